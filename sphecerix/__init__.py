@@ -1,12 +1,21 @@
-from .wignerd import tesseral_wigner_D, wigner_D, tesseral_wigner_D_mirror,\
-                     tesseral_wigner_D_improper
-from .tesseral import tesseral_transformation, permutation_sh_car
-from .atomic_wave_functions import wfcart, wf, wffield, wffield_l
-from .molecule import Molecule
-from .basis_functions import BasisFunction
-from .symmetry_operations import *
-from .matrixplot import plot_matrix, visualize_matrices
-from .character_table import CharacterTable
-from .projection_operator import ProjectionOperator
-
+from .wignerd import tesseral_wigner_D, wigner_D, tesseral_wigner_D_mirror,\
+                     tesseral_wigner_D_improper
+from .tesseral import tesseral_transformation, permutation_sh_car
+from .atomic_wave_functions import wfcart, wf, wffield, wffield_l
+from .molecule import Molecule
+from .xyz_reader import XYZReader, iter_xyz
+from .basis_functions import BasisFunction
+from .basis_set import BasisSet
+from .factorised_operations import FactorisedOperations
+from .symmetry_operations import *
+from .group import quantise_matrices, multiplication_table, common_centre, \
+                   generate_group, operation_axes, conjugacy_classes, \
+                   class_constants, atom_orbits, stabilisers
+from .measures import symmetrize, continuous_symmetry_measure
+from .matrixplot import plot_matrix, visualize_matrices
+from .character_table import CharacterTable
+from .character_table_generator import generate_character_table
+from .projection_operator import ProjectionOperator
+from .storage import SymmetryCache
+
 from ._version import __version__
\ No newline at end of file
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from .basis_functions import BasisFunction
+
+class BasisSet:
+    """
+    Array-backed collection of basis functions
+
+    The quantum numbers (n,l,m), the atom on which a basis function resides
+    and the shell to which it belongs are stored as integer arrays. A shell
+    is a contiguous series of basis functions on the same atom sharing the
+    same n and l. BasisFunction objects and names are only constructed on
+    request.
+
+    Shells are indexed per atom (atom -> shells -> m-slots). Every shell
+    owns a contiguous block of 2l+1 slots, ordered by increasing m, which
+    refer to the basis function carrying that m-value or to -1 when the
+    shell is incomplete.
+
+    A basis set supports len(), indexing and iteration like the list of
+    BasisFunction objects it replaces, but cannot be extended in place;
+    rebuild it via Molecule.build_basis() instead.
+    """
+    def __init__(self, n, l, m, atomid, shell, symbols, elements, positions):
+        self.n = np.asarray(n, dtype=np.int64)
+        self.l = np.asarray(l, dtype=np.int64)
+        self.m = np.asarray(m, dtype=np.int64)
+        self.atomid = np.asarray(atomid, dtype=np.int64)
+        self.shell = np.asarray(shell, dtype=np.int64)
+        # the atoms are copied, such that the basis set keeps referring to
+        # the atoms it was built for when atoms are added to the molecule
+        self.symbols = list(symbols)                            # element symbol lookup
+        self.elements = np.array(elements, dtype=np.int64)      # element index of every atom
+        self.positions = np.array(positions, dtype=np.float64)  # (N,3) array of atomic positions
+
+        # shell data; the functions of a shell are stored contiguously
+        self.shell_offset = np.searchsorted(self.shell, np.arange(self.get_nr_shells()))
+        self.shell_atom = self.atomid[self.shell_offset]
+        self.shell_n = self.n[self.shell_offset]
+        self.shell_l = self.l[self.shell_offset]
+
+        self.__build_shell_index()
+
+        self._names = None
+        self._shell_lookup = None
+
+    @classmethod
+    def from_molset(cls, mol, molset):
+        """
+        Build basis set for a molecule from a dictionary that maps element
+        symbols onto a list of BasisFunction objects
+        """
+        # build the per-element templates; template functions are mapped
+        # onto shells by grouping consecutive functions with identical n and
+        # l, starting a new shell whenever an m-value is repeated
+        nrel = len(mol.symbols)
+        tn, tl, tm, tshell = [], [], [], []
+        nrbfs = np.zeros(nrel, dtype=np.int64)
+        nrshells = np.zeros(nrel, dtype=np.int64)
+        for e,symbol in enumerate(mol.symbols):
+            shell = -1
+            prev = None
+            for bf in molset.get(symbol, []):
+                if abs(bf.m) > bf.l:
+                    raise RuntimeError('Invalid basis function encountered for %s: n=%i, l=%i, m=%i' % (symbol, bf.n, bf.l, bf.m))
+                if (bf.n, bf.l) != prev or bf.m in shell_ms:
+                    shell += 1
+                    shell_ms = set()
+                    prev = (bf.n, bf.l)
+                shell_ms.add(bf.m)
+                tn.append(bf.n)
+                tl.append(bf.l)
+                tm.append(bf.m)
+                tshell.append(shell)
+            nrbfs[e] = len(molset.get(symbol, []))
+            nrshells[e] = shell + 1
+        tn, tl, tm, tshell = [np.array(a, dtype=np.int64) for a in (tn, tl, tm, tshell)]
+        toffset = np.cumsum(nrbfs) - nrbfs
+
+        # expand the templates over the atoms
+        elements = mol.elements
+        atom_nrbfs = nrbfs[elements]
+        atom_nrshells = nrshells[elements]
+        atomid = np.repeat(np.arange(len(elements)), atom_nrbfs)
+        local = np.arange(len(atomid)) - np.repeat(np.cumsum(atom_nrbfs) - atom_nrbfs, atom_nrbfs)
+        tidx = toffset[elements[atomid]] + local
+        shell = tshell[tidx] + np.repeat(np.cumsum(atom_nrshells) - atom_nrshells, atom_nrbfs)
+
+        return cls(tn[tidx], tl[tidx], tm[tidx], atomid, shell,
+                   mol.symbols, elements, mol.positions)
+
+    def __len__(self):
+        return len(self.n)
+
+    def __getitem__(self, idx):
+        return self.get_basis_function(idx)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.get_basis_function(i)
+
+    def get_nr_shells(self):
+        """
+        Get the number of shells in the basis set
+        """
+        return int(self.shell[-1]) + 1 if len(self.shell) > 0 else 0
+
+    @property
+    def names(self):
+        """
+        Names of the basis functions, constructed on first use
+        """
+        if self._names is None:
+            self._names = [self.symbols[self.elements[a]] + BasisFunction(n,l,m).name
+                           for n,l,m,a in zip(self.n, self.l, self.m, self.atomid)]
+        return self._names
+
+    def get_basis_function(self, idx):
+        """
+        Construct a BasisFunction object for a single basis function
+        """
+        idx = range(len(self))[idx]
+        bf = BasisFunction(int(self.n[idx]), int(self.l[idx]), int(self.m[idx]))
+        bf.atomid = int(self.atomid[idx])
+        bf.name = self.symbols[self.elements[bf.atomid]] + bf.name
+        bf.r = np.array(self.positions[bf.atomid])
+
+        return bf
+
+    def get_slot(self, shell, m):
+        """
+        Get the slot index of a specific m-value in a shell
+        """
+        return self.shell_slot_offset[shell] + m + self.shell_l[shell]
+
+    def find_shell(self, atomid, n, l, multiplicity=0):
+        """
+        Find the index of a shell on an atom, where multiplicity enumerates
+        repeated shells sharing the same n and l; returns -1 if no such shell
+        exists
+        """
+        if self._shell_lookup is None:
+            # count how many preceding shells on the same atom share (n,l)
+            keys = list(zip(self.shell_atom.tolist(), self.shell_n.tolist(), self.shell_l.tolist()))
+            counts = {}
+            self._shell_lookup = {}
+            for s,key in enumerate(keys):
+                k = counts.get(key, 0)
+                counts[key] = k + 1
+                self._shell_lookup[key + (k,)] = s
+
+        return self._shell_lookup.get((atomid, n, l, multiplicity), -1)
+
+    def get_target_shells(self, atom_permutation):
+        """
+        Given the atom onto which every atom is mapped, establish onto which
+        shell every shell is mapped; a (K,N) array of atom permutations
+        yields a (K,nshells) array of shells
+        """
+        target_atom = np.take(atom_permutation, self.shell_atom, axis=-1)
+        target = self.atom_shell_offset[target_atom] + self.shell_local
+
+        if target.size > 0:
+            valid = target < self.atom_shell_offset[target_atom + 1]
+            target = np.where(valid, target, 0)
+            valid &= (self.shell_n[target] == self.shell_n) & (self.shell_l[target] == self.shell_l)
+            if not np.all(valid):
+                idx = np.argwhere(~valid)[0]
+                s = idx[-1]
+                raise RuntimeError('Shell %i on atom %i has no counterpart on atom %i' % (s, self.shell_atom[s], target_atom[tuple(idx)]))
+
+        return target
+
+    def get_block_entries(self, shells, target_shells, block):
+        """
+        Get the (row, column, value) entries of a matrix that couples each
+        shell in shells to its target shell via the same (2l+1)x(2l+1)
+        block, all shells having the same l; slots without basis function
+        are omitted
+        """
+        l = self.shell_l[shells[0]] if len(shells) > 0 else 0
+        mrange = np.arange(2*l+1)
+        src = self.slot_bf[self.shell_slot_offset[shells][:,None] + mrange]
+        tgt = self.slot_bf[self.shell_slot_offset[target_shells][:,None] + mrange]
+        mask = (src[:,:,None] >= 0) & (tgt[:,None,:] >= 0)
+
+        rows = np.broadcast_to(src[:,:,None], mask.shape)[mask]
+        cols = np.broadcast_to(tgt[:,None,:], mask.shape)[mask]
+        vals = np.broadcast_to(block, mask.shape)[mask]
+
+        return rows, cols, vals
+
+    def __build_shell_index(self):
+        """
+        Build the atom -> shell -> m-slot index
+        """
+        nratoms = len(self.elements)
+        if np.any(np.diff(self.shell_atom) < 0):
+            raise RuntimeError('Shells should be sorted by atom')
+
+        # atom -> shells; the shells of atom i are atom_shell_offset[i] up to
+        # atom_shell_offset[i+1]
+        self.atom_shell_offset = np.searchsorted(self.shell_atom, np.arange(nratoms + 1))
+        self.shell_local = np.arange(len(self.shell_atom)) - self.atom_shell_offset[self.shell_atom]
+
+        # shell -> m-slots
+        self.shell_slot_offset = np.concatenate([[0], np.cumsum(2 * self.shell_l + 1)])
+        self.slot_bf = -np.ones(self.shell_slot_offset[-1], dtype=np.int64)
+        slots = self.shell_slot_offset[self.shell] + self.m + self.l
+        if len(np.unique(slots)) != len(slots):
+            raise RuntimeError('Duplicate m-values encountered within a shell')
+        self.slot_bf[slots] = np.arange(len(self))
@@ -1,45 +1,422 @@
 # -*- coding: utf-8 -*-
 
+import glob
 import json
 import os
+import re
+import threading
 import numpy as np
+from .character_table_generator import generate_character_table, is_generatable, \
+                                       compute_character_table, class_symbol, inverse_symbol, \
+                                       freeze_table
+
+TABLEDIR = os.path.join(os.path.dirname(__file__), 'charactertables')
+PACKAGE = os.path.join(TABLEDIR, 'charactertables.bin')
+PACKAGE_MAGIC = b'SPXCTAB1'
+
+# process-wide registry of validated character tables, keyed by name
+_registry = {}
+_registry_lock = threading.Lock()
+_package = None
+
+# character tables computed from sets of operations, keyed by the class
+# structure of the group
+_computed_tables = {}
 
 class CharacterTable:
     """
     Class to store character table data in
+    
+    Tables are taken from the packed resource holding the bundled tables,
+    from the json files in the charactertables folder or, for the point
+    groups of the families Cn, Cnv, Cnh, Dn, Dnd, Dnh and Sn, generated
+    (see generate_character_table). Generated tables combine pairs of
+    complex conjugate irreducible representations into a single real
+    representation; the squared norm of such a representation is 2.
+    
+    Every table is loaded and validated once per process; all instances of
+    the same table share the same read-only arrays and the same immutable
+    table data (chartablelib).
     """
-    def __init__(self, name):
-        filename = os.path.join(os.path.dirname(__file__), 'charactertables', name + '.json')
-        f = open(filename, 'r')
-        self.chartablelib = json.load(f)
-        self.order = np.sum([int(c['multiplicity']) for c in self.chartablelib['classes']])
-        self.nrclasses = len(self.chartablelib['classes'])
-        self.nrgroups = len(self.chartablelib['symmetry_groups'])
-        
-        # build condensed and expanded table
-        self.table = np.zeros((self.nrgroups, self.nrgroups), dtype=np.float64)
-        self.expandedtable = np.zeros((self.nrgroups, self.order), dtype=np.float64)
-        for i,g in enumerate(self.chartablelib['symmetry_groups']): # loop over irreps
-            idx = 0 # loop over operations
-            for j,c in enumerate(self.chartablelib['classes']):
-                self.table[i,j] = g['characters'][j]
-                for k in range(c['multiplicity']):
-                    self.expandedtable[i,idx] = g['characters'][j]
-                    idx += 1
-        
-        # check that the character table is correct
-        try:
-            np.testing.assert_almost_equal(self.expandedtable @ self.expandedtable.transpose() / self.order, 
-                                           np.identity(self.nrgroups))
-        except AssertionError as e:
-            print('Invalid character table encountered in: %s' % filename)
-            raise e
-        
-    def lot(self, traces):
-        return np.round(self.expandedtable @ traces / self.order)
+    def __init__(self, name, chartablelib=None):
+        if chartablelib is None:
+            entry = get_character_table_entry(name)
+        else:
+            entry = _build_entry(name, chartablelib)
+        
+        self.__set_entry(entry)
+    
+    def __set_entry(self, entry):
+        self.chartablelib = entry['chartablelib']
+        self.order = entry['order']
+        self.nrclasses = entry['nrclasses']
+        self.nrgroups = entry['nrgroups']
+        self.sizes = entry['sizes']                 # class sizes
+        self.table = entry['table']                 # (irreps, classes)
+        self.expandedtable = entry['expandedtable'] # (irreps, operations)
+        self.irreducible = entry['irreducible']     # complex characters
+        self.norms = entry['norms']                 # squared norms
+    
+    @classmethod
+    def from_operations(cls, symops, name=None, tol=1e-4):
+        """
+        Compute the character table of the group formed by a set of
+        symmetry operations
+        
+        The table is established from the class multiplication coefficients
+        (see compute_character_table), such that any closed set of
+        operations can be analysed without a tabulated character table.
+        Tables are cached by their name, the order of the group and the
+        sizes, symbols and axes of its classes.
+        
+        Classes that share a symbol are distinguished by exponents (for the
+        class holding the inverses, e.g. C3 and C3^2) or by primes. Every
+        class lists the axis of one of its operations, such that the
+        classes can be told apart when assigning operations to them (see
+        SymmetryOperations.get_class_indices).
+        
+        Parameters
+        ----------
+        symops : SymmetryOperations
+            Operations forming a group
+        name : str, optional
+            Name of the table; by default, the point group label
+        tol : float
+            Tolerance used for identifying identical matrices
+        """
+        from .group import conjugacy_classes, class_constants, operation_axes
+        from .point_group import classify_operations, _get_label
+        
+        matrices = symops.get_matrices()
+        mt = symops.get_multiplication_table(tol)
+        labels = conjugacy_classes(mt)
+        
+        # renumber the classes such that the identity comes first
+        identity = np.flatnonzero(np.all(mt == np.arange(len(mt)), axis=1))[0]
+        labels = np.where(labels == labels[identity], 0, labels + (labels < labels[identity]))
+        
+        sizes = np.bincount(labels)
+        representatives = np.unique(labels, return_index=True)[1]
+        inverses = labels[np.argmax(mt == identity, axis=1)[representatives]]
+        symbols = [class_symbol(matrices[k], len(mt)) for k in representatives]
+        for a in range(len(symbols)):
+            b = symbols.index(symbols[a])
+            if b < a and inverses[b] == a:
+                symbols[a] = inverse_symbol(symbols[a])
+        symbols = [s + "'" * symbols[:a].count(s) for a,s in enumerate(symbols)]
+        axes = operation_axes(matrices[representatives])
+        axes = [axis if np.any(axis != 0.0) else None for axis in axes]
+        
+        if name is None:
+            name = _get_label(classify_operations(matrices)[0]).lower()
+        key = (name, len(mt)) + tuple(zip(sizes.tolist(), symbols,
+                                          [None if a is None else tuple(np.round(a, 6) + 0.0) for a in axes]))
+        if key not in _computed_tables:
+            _computed_tables[key] = _build_entry(name, compute_character_table(class_constants(mt, labels),
+                                                                               sizes, symbols, name, axes))
+        
+        ct = cls.__new__(cls)
+        ct.__set_entry(_computed_tables[key])
+        
+        return ct
+    
+    @staticmethod
+    def exists(name):
+        """
+        Check whether a character table is available
+        """
+        return name in _registry or name in _get_package() or \
+               os.path.isfile(os.path.join(TABLEDIR, name + '.json')) or is_generatable(name)
+    
+    def lot(self, traces, classes=None, tol=1e-3):
+        """
+        Reduce one or more representations into irreducible representations
+        
+        Parameters
+        ----------
+        traces : numpy.ndarray
+            Characters of the representation for all operations, or for
+            all classes (class-condensed); a (M,order) or (M,nrclasses)
+            array reduces M representations at once
+        classes : numpy.ndarray, optional
+            Index of the class of every operation (see
+            SymmetryOperations.get_class_indices); if omitted, the
+            operations are assumed to be listed in the class order of
+            the character table
+        tol : float
+            Maximum deviation of the multiplicities from integers
+        
+        Returns
+        -------
+        numpy.ndarray
+            (nrgroups,) or (M,nrgroups) array of multiplicities
+        
+        Raises
+        ------
+        ValueError
+            If the multiplicities deviate from integers by more than tol
+        """
+        traces = np.asarray(traces)
+        if classes is not None:
+            weights = self.table[:,classes]
+        elif traces.shape[-1] == self.order:
+            weights = self.expandedtable
+        elif traces.shape[-1] == self.nrclasses:
+            weights = self.table * self.sizes
+        else:
+            raise ValueError('Expected %i (operations) or %i (classes) characters per representation, got %i' %
+                             (self.order, self.nrclasses, traces.shape[-1]))
+        
+        multiplicities = (traces @ weights.transpose()).real / (self.order * self.norms)
+        rounded = np.round(multiplicities)
+        deviation = np.max(np.abs(multiplicities - rounded), initial=0.0)
+        if deviation > tol:
+            raise ValueError('Representation does not reduce into irreducible representations of %s '
+                             '(maximum deviation from integer multiplicities: %.3g)' % 
+                             (self.chartablelib['name'], deviation))
+        
+        return rounded
+    
+    def get_class_signatures(self):
+        """
+        Establish for every class whether it holds proper or improper
+        operations and the trace of their 3x3 matrices, as parsed from the
+        class symbols; primes and labels between parentheses are ignored
+        
+        Returns
+        -------
+        list of tuple
+            (improper, trace) for every class
+        """
+        signatures = []
+        for c in self.chartablelib['classes']:
+            match = re.match(r'^(E|i|C|S|sigma)(\d*)(?:\^(\d+))?', c['symbol'])
+            if match is None:
+                raise RuntimeError('Cannot interpret class symbol %s' % c['symbol'])
+            op, n, k = match.groups()
+            angle = 2.0 * np.pi * int(k or 1) / int(n or 1)
+            if op == 'E':
+                signatures.append((False, 3.0))
+            elif op == 'i':
+                signatures.append((True, -3.0))
+            elif op == 'C':
+                signatures.append((False, 1.0 + 2.0 * np.cos(angle)))
+            elif op == 'S':
+                signatures.append((True, -1.0 + 2.0 * np.cos(angle)))
+            else:
+                signatures.append((True, 1.0))
+        
+        return signatures
+    
+    def get_class_axes(self):
+        """
+        Establish for every class the direction of the axis (or mirror
+        normal) of one of its operations, as annotated in the class symbols
+        
+        Explicit annotations are read from parentheses, e.g. C2(x) or
+        sigma(xz), the latter referring to the normal y. Otherwise, the
+        common orientation conventions are followed: sigma_h is normal to
+        the z-axis, a sigma_v plane holds the x-axis (with normal y) and a
+        C2' axis coincides with the x-axis. Tables may list the axis of a
+        class explicitly in an 'axis' entry.
+        
+        Returns
+        -------
+        list
+            Unit vector or None (no annotation) for every class
+        """
+        unit = {'x': np.array([1.0, 0.0, 0.0]),
+                'y': np.array([0.0, 1.0, 0.0]),
+                'z': np.array([0.0, 0.0, 1.0])}
+        axes = []
+        for c in self.chartablelib['classes']:
+            if 'axis' in c:
+                axes.append(np.array(c['axis'], dtype=np.float64) / np.linalg.norm(c['axis']))
+                continue
+            
+            symbol = c['symbol']
+            label = re.search(r'\(([a-z]+)\)', symbol)
+            label = label.group(1) if label is not None else None
+            if symbol.startswith('sigma'):
+                if label is None:
+                    label = re.match(r'sigma_?([a-z]*)', symbol).group(1)
+                if len(label) == 2 and set(label) <= set('xyz'):
+                    axes.append(unit[(set('xyz') - set(label)).pop()])
+                else:
+                    axes.append({'h': unit['z'], 'v': unit['y']}.get(label))
+            elif label in unit:
+                axes.append(unit[label])
+            elif re.fullmatch(r"C2'", symbol):
+                axes.append(unit['x'])
+            else:
+                axes.append(None)
+        
+        return axes
+    
+    def get_class_constants(self):
+        """
+        Calculate the class multiplication coefficients from the characters
+        
+        Returns
+        -------
+        numpy.ndarray
+            (C,C,C) array; entry [a,b,c] lists how many times an element of
+            class c is obtained as product of an element of class a and an
+            element of class b
+        """
+        sizes = np.array([c['multiplicity'] for c in self.chartablelib['classes']])
+        chi = self.irreducible
+        return np.einsum('a,b,ia,ib,ic,i->abc', sizes, sizes, chi, chi,
+                         chi.conj(), 1.0 / chi[:,0], optimize=True).real / self.order
     
     def get_label_irrep(self, irrep_idx):
         return self.chartablelib['symmetry_groups'][irrep_idx]['symbol']
     
     def get_character(self, irrep_idx, op_idx):
-        return self.expandedtable[irrep_idx, op_idx]
\ No newline at end of file
+        return self.expandedtable[irrep_idx, op_idx]
+
+def get_character_table_entry(name):
+    """
+    Get the validated data of a character table from the process-wide
+    registry, loading the table on first use
+    
+    Returns
+    -------
+    dict
+        Table data; the arrays are read-only, the table data (chartablelib)
+        is immutable and both are shared between all users
+    """
+    entry = _registry.get(name)
+    if entry is not None:
+        return entry
+    
+    with _registry_lock:
+        if name not in _registry:
+            package = _get_package()
+            filename = os.path.join(TABLEDIR, name + '.json')
+            if name in package:
+                chartablelib = package[name]
+            elif os.path.isfile(filename):
+                with open(filename, 'r') as f:
+                    chartablelib = json.load(f)
+            elif is_generatable(name):
+                chartablelib = generate_character_table(name)
+            else:
+                raise RuntimeError('No character table available for %s' % name)
+            _registry[name] = _build_entry(name, chartablelib)
+        
+        return _registry[name]
+
+def pack_character_tables(path=PACKAGE, directory=TABLEDIR):
+    """
+    Precompile the json files of the character tables into a single binary
+    file that is read at once
+    
+    The file starts with a magic string and the length of a json header
+    that describes the classes and irreps of every table; the characters
+    follow as a block of float64 values. The bundled file should be rebuilt
+    whenever one of the json files changes.
+    """
+    header = []
+    blocks = []
+    offset = 0
+    for filename in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        with open(filename, 'r') as f:
+            chartablelib = json.load(f)
+        table = np.array([g['characters'] for g in chartablelib['symmetry_groups']], dtype='<f8')
+        header.append({
+            'name': os.path.splitext(os.path.basename(filename))[0],
+            'classes': chartablelib['classes'],
+            'irreps': [g['symbol'] for g in chartablelib['symmetry_groups']],
+            'offset': offset,
+            'shape': table.shape,
+        })
+        blocks.append(table.reshape(-1))
+        offset += table.size
+    
+    header = json.dumps(header).encode()
+    header += b' ' * (-(len(PACKAGE_MAGIC) + 8 + len(header)) % 8)
+    with open(path, 'wb') as f:
+        f.write(PACKAGE_MAGIC)
+        f.write(np.uint64(len(header)).astype('<u8').tobytes())
+        f.write(header)
+        f.write(np.concatenate(blocks).tobytes() if blocks else b'')
+
+def read_character_tables(path=PACKAGE):
+    """
+    Read a file written by pack_character_tables
+    
+    Returns
+    -------
+    dict
+        Mapping of names onto character tables in the layout of the json
+        files
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    if data[:len(PACKAGE_MAGIC)] != PACKAGE_MAGIC:
+        raise RuntimeError('Invalid character table package: %s' % path)
+    start = len(PACKAGE_MAGIC) + 8
+    length = int(np.frombuffer(data, dtype='<u8', count=1, offset=len(PACKAGE_MAGIC))[0])
+    header = json.loads(data[start:start+length])
+    values = np.frombuffer(data, dtype='<f8', offset=start+length)
+    
+    tables = {}
+    for e in header:
+        table = values[e['offset']:e['offset'] + int(np.prod(e['shape']))].reshape(e['shape'])
+        tables[e['name']] = {
+            'name': e['name'],
+            'classes': e['classes'],
+            'symmetry_groups': [{'symbol': s, 'characters': row.tolist()}
+                                for s,row in zip(e['irreps'], table)],
+        }
+    
+    return tables
+
+def _get_package():
+    """
+    Get the bundled character tables, reading the packed resource on first
+    use
+    """
+    global _package
+    if _package is None:
+        _package = read_character_tables(PACKAGE) if os.path.isfile(PACKAGE) else {}
+    
+    return _package
+
+def _build_entry(name, chartablelib):
+    """
+    Build and validate the arrays of a character table; the table data
+    itself is stored as an immutable copy (see freeze_table)
+    """
+    sizes = np.array([int(c['multiplicity']) for c in chartablelib['classes']], dtype=np.int64)
+    table = np.array([g['characters'] for g in chartablelib['symmetry_groups']], dtype=np.float64)
+    table = table.reshape(-1, len(sizes))
+    order = int(np.sum(sizes))
+    expandedtable = np.repeat(table, sizes, axis=1)
+    irreducible = np.array(chartablelib.get('irreducible_characters', table))
+    
+    # check that the character table is correct; the representations
+    # should be orthogonal, with a squared norm of 1 (irreducible) or 2
+    # (pair of complex conjugate irreducible representations)
+    norms = np.round(np.sum(expandedtable**2, axis=1) / order)
+    deviation = np.max(np.abs(expandedtable @ expandedtable.transpose() / order - np.diag(norms)))
+    if deviation > 1e-6 or not np.all((norms == 1) | (norms == 2)):
+        raise ValueError('Invalid character table %s: the representations are not orthogonal or '
+                         'do not have a squared norm of 1 or 2 (maximum deviation: %.3g)' % (name, deviation))
+    
+    for arr in (sizes, table, expandedtable, irreducible, norms):
+        arr.flags.writeable = False
+    
+    return {
+        'chartablelib': freeze_table(chartablelib),
+        'order': order,
+        'nrclasses': len(sizes),
+        'nrgroups': len(table),
+        'sizes': sizes,
+        'table': table,
+        'expandedtable': expandedtable,
+        'irreducible': irreducible,
+        'norms': norms,
+    }
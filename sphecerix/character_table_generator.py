@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import re
+from fractions import Fraction
+from types import MappingProxyType
+import numpy as np
+
+FAMILIES = ('c', 'cv', 'ch', 'd', 'dd', 'dh', 's')
+
+def parse_family(name):
+    """
+    Establish the family and principal order of a point group name
+
+    Parameters
+    ----------
+    name : str
+        Schoenflies name, e.g. 'c5v', 'd8h', 's4', 'cs' or 'ci'
+
+    Returns
+    -------
+    tuple or None
+        (family, n) where family is one of 'c', 'cv', 'ch', 'd', 'dd',
+        'dh' or 's'; None when the name does not refer to one of these
+        families
+    """
+    name = name.lower()
+    if name == 'cs':
+        return ('ch', 1)
+    if name == 'ci':
+        return ('s', 2)
+
+    match = re.fullmatch(r'([cds])(\d+)([vhd]?)', name)
+    if match is None:
+        return None
+    letter, n, suffix = match.groups()
+    family, n = letter + suffix, int(n)
+
+    # S_n with n odd equals C_nh; C1v, D1, D1d and D1h equal Cs, C2, C2h
+    # and C2v respectively
+    if family not in FAMILIES or n < 1 or (family == 's' and n % 2 == 1) or \
+       (family in ('cv', 'd', 'dd', 'dh') and n < 2):
+        return None
+
+    return family, n
+
+def is_generatable(name):
+    """
+    Check whether a character table can be generated for a point group
+    """
+    return parse_family(name) is not None
+
+@functools.lru_cache(maxsize=None)
+def generate_character_table(name):
+    """
+    Build the character table of a point group of the families Cn, Cnv,
+    Cnh, Dn, Dnd, Dnh and Sn
+
+    The tables are built from the irreducible representations of the cyclic
+    and dihedral groups, combined with the direct product with {E, σh} or
+    {E, i} where applicable. Pairs of complex conjugate irreducible
+    representations are combined into a single real representation (e.g.
+    the E representations of Cn); the complex characters are retained to
+    establish the class multiplication coefficients.
+
+    Returns
+    -------
+    mapping
+        Character table in the same layout as the json files, i.e. with
+        'name', 'classes' and 'symmetry_groups' entries, complemented by an
+        'irreducible_characters' entry holding the complex characters of
+        the irreducible representations. The tables are cached and hence
+        immutable (see freeze_table).
+    """
+    family, n = parse_family(name)
+
+    if family == 'c':
+        classes, irreps = _cyclic(n, lambda k: _symbol(Fraction(k, n), False))
+    elif family == 's' and n % 4 == 0:
+        classes, irreps = _cyclic(n, lambda k: _symbol(Fraction(k, n), k % 2 == 1))
+    elif family == 's':
+        # S_n with n = 2 (mod 4) is the direct product of C_{n/2} with {E,i}
+        m = n // 2
+        classes, irreps = _cyclic(m, lambda k: _symbol(Fraction(k, m), False))
+        classes, irreps = _direct_product(classes, irreps, _inversion_symbols(classes), parity=True)
+    elif family == 'ch':
+        classes, irreps = _cyclic(n, lambda k: _symbol(Fraction(k, n), False))
+        classes, irreps = _direct_product(classes, irreps, _reflection_symbols(classes),
+                                          parity=(n % 2 == 0), c2=_find_class(classes, 'C2'))
+    elif family == 'cv':
+        classes, irreps = _dihedral(n, lambda k: _symbol(Fraction(k, n), False), ['sigma_v', 'sigma_d'])
+    elif family in ('d', 'dh'):
+        classes, irreps = _dihedral(n, lambda k: _symbol(Fraction(k, n), False), ["C2'", "C2''"])
+        if n == 2:
+            # the three C2 axes of D2 are named after the coordinate axes;
+            # B1, B2 and B3 are symmetric under C2(z), C2(y) and C2(x)
+            axes = {'C2': 'C2(z)', "C2'": 'C2(y)', "C2''": 'C2(x)'}
+            labels = {'A1': 'A', 'A2': 'B1', 'B1': 'B2', 'B2': 'B3'}
+            classes = [(axes.get(s, s), m) for s,m in classes]
+            irreps = [(labels[l], c) for l,c in irreps]
+        if family == 'dh':
+            classes, irreps = _direct_product(classes, irreps, _reflection_symbols(classes),
+                                              parity=(n % 2 == 0), c2=_find_class(classes, 'C2' if n > 2 else 'C2(z)'))
+    elif family == 'dd' and n % 2 == 0:
+        # D_nd with n even is isomorphic to the dihedral group D_2n, with
+        # S_2n taking the role of the principal rotation
+        classes, irreps = _dihedral(2 * n, lambda k: _symbol(Fraction(k, 2 * n), k % 2 == 1),
+                                    ["C2'", 'sigma_d'])
+    else:
+        # D_nd with n odd is the direct product of D_n with {E,i}
+        classes, irreps = _dihedral(n, lambda k: _symbol(Fraction(k, n), False), ["C2'"])
+        classes, irreps = _direct_product(classes, irreps, _inversion_symbols(classes), parity=True)
+
+    components = [np.array(c) for _,c in irreps]
+
+    return freeze_table({
+        'name': name.lower(),
+        'classes': [{'symbol': s, 'multiplicity': int(m)} for s,m in classes],
+        'symmetry_groups': [{'symbol': label, 'characters': [float(x) for x in np.round(np.sum(c, axis=0).real, 12)]}
+                            for (label,_),c in zip(irreps, components)],
+        'irreducible_characters': np.vstack(components),
+    })
+
+def freeze_table(obj):
+    """
+    Convert (a part of) a character table into an immutable structure;
+    dictionaries become read-only mappings, lists become tuples and arrays
+    become read-only copies
+    """
+    if isinstance(obj, (dict, MappingProxyType)):
+        return MappingProxyType({k: freeze_table(v) for k,v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze_table(v) for v in obj)
+    if isinstance(obj, np.ndarray):
+        obj = obj.copy()
+        obj.flags.writeable = False
+    
+    return obj
+
+def _symbol(turns, improper):
+    """
+    Get the class symbol of a (proper or improper) rotation over a fraction
+    of a full turn; an improper rotation is the rotation followed by a
+    reflection in the plane perpendicular to the axis
+    """
+    f = Fraction(turns) % 1
+    a, b = f.numerator, f.denominator
+    if not improper:
+        if a == 0:
+            return 'E'
+        return 'C%i' % b if a == 1 else 'C%i^%i' % (b,a)
+
+    if a == 0:
+        return 'sigma_h'
+    if f == Fraction(1,2):
+        return 'i'
+
+    # S_b^k equals the reflection times C_b^k only for odd k
+    k = a if a % 2 == 1 else a + b
+    return 'S%i' % b if k == 1 else 'S%i^%i' % (b,k)
+
+def _turns(symbol):
+    """
+    Get the fraction of a full turn of a proper rotation symbol
+    """
+    match = re.fullmatch(r'C(\d+)(?:\^(\d+))?', symbol)
+    return Fraction(int(match.group(2) or 1), int(match.group(1)))
+
+def _find_class(classes, symbol):
+    """
+    Get the index of the first class with a given symbol (or None)
+    """
+    return next((j for j,(s,_) in enumerate(classes) if s == symbol), None)
+
+def _reflection_symbols(classes):
+    """
+    Symbols of the products of the reflection in the horizontal plane with
+    the operations of the classes of a group of proper rotations
+    """
+    mapping = {'E': 'sigma_h', "C2'": 'sigma_v', "C2''": 'sigma_d',
+               'C2(z)': 'i', 'C2(y)': 'sigma(yz)', 'C2(x)': 'sigma(xz)'}
+    return [mapping[s] if s in mapping else _symbol(_turns(s), True) for s,_ in classes]
+
+def _inversion_symbols(classes):
+    """
+    Symbols of the products of the inversion with the operations of the
+    classes of a group of proper rotations
+    """
+    mapping = {'E': 'i', "C2'": 'sigma_d'}
+    return [mapping[s] if s in mapping else _symbol(_turns(s) + Fraction(1,2), True) for s,_ in classes]
+
+def _cyclic(n, symbol):
+    """
+    Classes and irreducible representations of the cyclic group of order n;
+    complex conjugate pairs of representations are listed as a single
+    representation with two components
+    """
+    classes = [(symbol(k), 1) for k in range(n)]
+    k = np.arange(n)
+    chi = lambda p: np.exp(2.0j * np.pi * p * k / n)
+
+    irreps = [('A', [chi(0)])]
+    if n % 2 == 0:
+        irreps.append(('B', [chi(n // 2)]))
+    nre = (n - 1) // 2
+    for p in range(1, nre + 1):
+        irreps.append(('E' if nre == 1 else 'E%i' % p, [chi(p), chi(n - p)]))
+
+    return classes, irreps
+
+def _dihedral(n, symbol, reflections):
+    """
+    Classes and irreducible representations of the dihedral group of order
+    2n, generated by a rotation R of order n and a reflection s (i.e. an
+    element of order two inverting R)
+
+    The reflections sR^k form a single class for odd n; for even n, these
+    split into the classes with even and odd k, named by reflections[0]
+    and reflections[1] respectively.
+    """
+    nre = (n - 1) // 2
+    powers = list(range(nre + 1)) + ([n // 2] if n % 2 == 0 else [])
+    classes = [(symbol(k), 1 if k in (0, n / 2) else 2) for k in powers]
+    if n % 2 == 1:
+        classes.append((reflections[0], n))
+    else:
+        classes += [(reflections[0], n // 2), (reflections[1], n // 2)]
+
+    powers = np.array(powers)
+    nrefl = len(classes) - len(powers)
+    irreps = [('A1', [np.ones(len(classes))]),
+              ('A2', [np.concatenate([np.ones(len(powers)), -np.ones(nrefl)])])]
+    if n % 2 == 0:
+        alt = (-1.0)**powers
+        irreps += [('B1', [np.concatenate([alt, [1.0, -1.0]])]),
+                   ('B2', [np.concatenate([alt, [-1.0, 1.0]])])]
+    nre = (n - 1) // 2
+    for p in range(1, nre + 1):
+        chars = np.concatenate([2.0 * np.cos(2.0 * np.pi * p * powers / n), np.zeros(nrefl)])
+        irreps.append(('E' if nre == 1 else 'E%i' % p, [chars]))
+
+    return classes, irreps
+
+def _direct_product(classes, irreps, symbols, parity=False, c2=None):
+    """
+    Build the classes and representations of the direct product of a group
+    with a group {E, X} where X is either the inversion or the reflection in
+    the horizontal plane
+
+    Representations are labelled by g/u when parity is set and by '/''
+    otherwise. The parity of a representation is its character under the
+    inversion; when X is the reflection, the inversion is the product of X
+    with the C2 rotation in class c2.
+    """
+    newclasses = classes + [(s,m) for s,(_,m) in zip(symbols, classes)]
+
+    newirreps = []
+    for sign in [1.0, -1.0]:
+        for idx,(label,components) in enumerate(irreps):
+            chars = [np.concatenate([c, sign * c]) for c in components]
+            real = np.sum(components, axis=0).real
+            p = sign if (not parity or c2 is None) else sign * real[c2] / real[0]
+            if not parity:
+                suffix = "'" if p > 0 else "''"
+            else:
+                suffix = 'g' if p > 0 else 'u'
+            newirreps.append((p < 0, idx, label + suffix, chars))
+
+    # list the symmetric (g or ') representations first, each in the order
+    # of the representations of the original group
+    newirreps = [(label, chars) for _,_,label,chars in sorted(newirreps, key=lambda r: r[:2])]
+
+    return newclasses, newirreps
+
+def compute_character_table(constants, sizes, symbols, name, axes=None, seed=0):
+    """
+    Compute the character table of a group from its class multiplication
+    coefficients (Burnside's method as refined by Dixon)
+
+    The quantities w_a = |C_a| chi(a) / chi(E) of every irreducible
+    representation are the common eigenvectors of the matrices
+    M_a[b,c] = constants[a,b,c], with eigenvalue w_a. The matrices are
+    diagonalised simultaneously via a random linear combination; the
+    dimensions follow from the orthogonality relations.
+
+    Parameters
+    ----------
+    constants : numpy.ndarray
+        (C,C,C) class multiplication coefficients (see class_constants)
+    sizes : numpy.ndarray
+        (C,) class sizes; the first class should hold the identity
+    symbols : list of str
+        Class symbols; a class labelled 'i' sets the g/u labels and the
+        proper rotations of highest order set the A/B labels
+    name : str
+        Name of the character table
+    axes : list, optional
+        Axis of an operation of every class (or None), stored in the
+        'axis' entries of the classes
+    seed : int
+        Seed of the random linear combination
+
+    Returns
+    -------
+    dict
+        Character table in the same layout as generate_character_table
+    """
+    constants = np.asarray(constants, dtype=np.float64)
+    sizes = np.asarray(sizes, dtype=np.float64)
+    nrclasses = len(sizes)
+    order = np.sum(sizes)
+
+    # a random combination of the class matrices has distinct eigenvalues
+    # (barring bad luck, in which case another combination is tried)
+    rng = np.random.default_rng(seed)
+    for _ in range(10):
+        M = np.einsum('a,abc->bc', rng.uniform(1.0, 2.0, nrclasses), constants)
+        e,v = np.linalg.eig(M)
+        gaps = np.abs(e[:,None] - e[None,:]) + np.identity(nrclasses)
+        if np.min(gaps) > 1e-6 * np.max(np.abs(e)):
+            break
+    else:
+        raise RuntimeError('Cannot separate the irreducible representations of %s' % name)
+
+    w = (v / v[0]).transpose()
+    if not np.allclose(np.einsum('abc,ic->iab', constants, w), w[:,:,None] * w[:,None,:], atol=1e-6):
+        raise RuntimeError('Inconsistent class multiplication coefficients for %s' % name)
+
+    dims = np.sqrt(order / np.sum(np.abs(w)**2 / sizes, axis=1))
+    if not np.allclose(dims, np.round(dims), atol=1e-6):
+        raise RuntimeError('Non-integral dimensions of the irreducible representations of %s' % name)
+    chi = np.round(dims)[:,None] * w / sizes
+    chi = np.where(np.abs(chi.imag) < 1e-9, chi.real, chi)
+
+    # combine pairs of complex conjugate representations
+    irreps = []
+    paired = np.zeros(nrclasses, dtype=bool)
+    for i in range(nrclasses):
+        if paired[i]:
+            continue
+        if np.all(chi[i].imag == 0.0):
+            irreps.append([chi[i]])
+            continue
+        j = next(j for j in range(i + 1, nrclasses) if not paired[j] and np.allclose(chi[j], chi[i].conj()))
+        paired[j] = True
+        irreps.append([chi[i], chi[j]])
+
+    # one-dimensional representations are labelled B when antisymmetric
+    # under the principal rotation; this only applies to groups with a
+    # single principal axis (i.e. not to the cubic groups)
+    inversion = symbols.index('i') if 'i' in symbols else None
+    orders = [int(re.match(r'C(\d+)', s).group(1)) if re.match(r'C\d+', s) else 0 for s in symbols]
+    principal = [j for j,n in enumerate(orders) if n == max(orders) and n > 1]
+    if any(sizes[j] > 2 for j in principal):
+        principal = []
+    def is_b(real):
+        return np.round(real[0]) == 1 and np.any(real[principal] < 0)
+
+    # order by parity, dimension, A/B and characters (the totally symmetric
+    # representation first) and assign Mulliken-like labels
+    def key(components):
+        real = np.sum(components, axis=0).real
+        return (inversion is not None and real[inversion] < 0, np.round(real[0]), is_b(real),
+                tuple(-np.round(real, 6)))
+    irreps = sorted(irreps, key=key)
+
+    letters = {1: 'A', 2: 'E', 3: 'T', 4: 'G', 5: 'H'}
+    labels = []
+    for components in irreps:
+        real = np.sum(components, axis=0).real
+        label = 'B' if is_b(real) else letters.get(int(np.round(real[0])), 'X%i' % np.round(real[0]))
+        if inversion is not None:
+            label += 'g' if real[inversion] > 0 else 'u'
+        labels.append(label)
+    for label in set(labels):
+        if labels.count(label) > 1:
+            idx = [j for j,l in enumerate(labels) if l == label]
+            for k,j in enumerate(idx):
+                labels[j] = label[0] + str(k+1) + label[1:]
+
+    classes = [{'symbol': s, 'multiplicity': int(m)} for s,m in zip(symbols, sizes)]
+    for c,axis in zip(classes, axes if axes is not None else []):
+        if axis is not None:
+            c['axis'] = [float(x) for x in axis]
+
+    return {
+        'name': name,
+        'classes': classes,
+        'symmetry_groups': [{'symbol': label, 'characters': [float(x) for x in np.round(np.sum(c, axis=0).real, 12)]}
+                            for label,c in zip(labels, irreps)],
+        'irreducible_characters': np.vstack([np.vstack(c) for c in irreps]).astype(np.complex128),
+    }
+
+def class_symbol(matrix, order):
+    """
+    Get the class symbol of an operation from its 3x3 matrix
+    """
+    improper = np.linalg.det(matrix) < 0
+    trace = np.trace(matrix)
+    cos = (trace + 1.0) / 2.0 if improper else (trace - 1.0) / 2.0
+    turns = Fraction(np.arccos(np.clip(cos, -1.0, 1.0)) / (2.0 * np.pi)).limit_denominator(order)
+    symbol = _symbol(turns, improper)
+
+    return 'sigma' if symbol == 'sigma_h' else symbol
+
+def inverse_symbol(symbol):
+    """
+    Get the symbol of the class holding the inverses of the operations of
+    a class, e.g. C3^2 for C3 and S6^5 for S6
+    """
+    match = re.fullmatch(r'([CS])(\d+)(?:\^(\d+))?', symbol)
+    if match is None:
+        return symbol
+    op, n, k = match.group(1), int(match.group(2)), int(match.group(3) or 1)
+    period = 2 * n if op == 'S' and n % 2 == 1 else n
+    k = (period - k) % period
+
+    return '%s%i' % (op, n) if k == 1 else '%s%i^%i' % (op, n, k)
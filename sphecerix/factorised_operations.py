@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+class FactorisedOperations:
+    """
+    Compact representation of the operation matrices in a basis set
+
+    Every operation matrix is the product of an atom permutation and a small
+    (2l+1)x(2l+1) block per angular momentum l. Only the permutations and
+    the blocks are stored; the block stored for operation k and angular
+    momentum l couples the m-slots of a shell (rows) to the m-slots of the
+    shell it is mapped onto (columns), i.e. it is the transpose of the
+    tesseral Wigner-D matrix.
+
+    Matrix-vector products, traces and products of operations are evaluated
+    in the space of m-slots of the basis set (see BasisSet); for incomplete
+    shells, products of two operations are only exact when the missing
+    m-slots are not needed.
+    """
+    def __init__(self, basis, permutations, blocks):
+        self.basis = basis
+        self.permutations = np.asarray(permutations, dtype=np.int64).reshape(-1, len(basis.elements))
+        self.blocks = {int(l): np.asarray(b, dtype=np.float64) for l,b in blocks.items()}
+
+        # shells per l and onto which shell each shell is mapped
+        self.lvals = np.unique(basis.shell_l)
+        self.shells = {int(l): np.flatnonzero(basis.shell_l == l) for l in self.lvals}
+        self.target_shells = basis.get_target_shells(self.permutations)
+        self.bf_slots = basis.shell_slot_offset[basis.shell] + basis.m + basis.l
+
+    def __len__(self):
+        return len(self.permutations)
+
+    def get_nbf(self):
+        """
+        Get the number of basis functions
+        """
+        return len(self.basis)
+
+    def take(self, indices):
+        """
+        Build a new object holding a subset of the operations
+        """
+        indices = np.atleast_1d(indices)
+        return FactorisedOperations(self.basis, self.permutations[indices],
+                                    {l: b[indices] for l,b in self.blocks.items()})
+
+    def product(self, k1, k2):
+        """
+        Build the product of two operations, corresponding to the matrix
+        product of operation matrix k1 with operation matrix k2
+        """
+        perm = self.permutations[k2][self.permutations[k1]]
+        blocks = {l: (b[k1] @ b[k2])[None] for l,b in self.blocks.items()}
+
+        return FactorisedOperations(self.basis, perm, blocks)
+
+    def dense(self, k, out=None):
+        """
+        Construct the dense operation matrix of operation k
+        """
+        nbf = self.get_nbf()
+        if out is None:
+            out = np.zeros((nbf, nbf))
+        else:
+            out[:] = 0.0
+
+        for l in self.lvals:
+            shells = self.shells[l]
+            rows, cols, vals = self.basis.get_block_entries(shells,
+                                                            self.target_shells[k, shells],
+                                                            self.blocks[l][k])
+            out[rows, cols] = vals
+
+        return out
+
+    def to_dense(self):
+        """
+        Construct the dense (K,nbf,nbf) tensor of all operation matrices
+        """
+        nbf = self.get_nbf()
+        mats = np.zeros((len(self), nbf, nbf))
+        for k in range(len(self)):
+            self.dense(k, out=mats[k])
+
+        return mats
+
+    def matvec(self, k, x):
+        """
+        Evaluate the product of operation matrix k with a vector x (or with
+        a matrix x, column by column)
+        """
+        xs = self.__to_slots(x)
+        ys = np.zeros_like(xs)
+        for l in self.lvals:
+            src = self.__slots(self.shells[l])
+            tgt = self.__slots(self.target_shells[k, self.shells[l]])
+            ys[src] = np.einsum('ab,sb...->sa...', self.blocks[l][k], xs[tgt])
+
+        return ys[self.bf_slots]
+
+    def matmat(self, k, X):
+        """
+        Evaluate the product of operation matrix k with a matrix X
+        """
+        return self.matvec(k, X)
+
+    def rmatvec(self, k, x):
+        """
+        Evaluate the product of a (row) vector x with operation matrix k
+        """
+        xs = self.__to_slots(x)
+        ys = np.zeros_like(xs)
+        for l in self.lvals:
+            src = self.__slots(self.shells[l])
+            tgt = self.__slots(self.target_shells[k, self.shells[l]])
+            ys[tgt] = np.einsum('ab,sa...->sb...', self.blocks[l][k], xs[src])
+
+        return ys[self.bf_slots]
+
+    def weighted_row(self, idx, weights):
+        """
+        Evaluate the weighted sum over all operations of row idx of the
+        operation matrices
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        shell = self.basis.shell[idx]
+        l = self.basis.l[idx]
+        m = self.basis.m[idx] + l
+
+        ys = np.zeros(self.basis.shell_slot_offset[-1])
+        tgt = self.__slots(self.target_shells[:, shell])
+        np.add.at(ys, tgt, weights[:,None] * self.blocks[l][:,m,:])
+
+        return ys[self.bf_slots]
+
+    def diagonals(self):
+        """
+        Get the diagonal elements of all operation matrices as a (K,nbf)
+        array
+        """
+        diag = np.zeros((len(self), self.get_nbf()))
+        shells = np.arange(len(self.basis.shell_l))
+        fixed = self.target_shells == shells
+        for l in self.lvals:
+            bfs = np.flatnonzero(self.basis.l == l)
+            m = self.basis.m[bfs] + l
+            diag[:,bfs] = fixed[:,self.basis.shell[bfs]] * self.blocks[l][:,m,m]
+
+        return diag
+
+    def traces(self):
+        """
+        Get the traces of all operation matrices
+        """
+        return np.sum(self.diagonals(), axis=1)
+
+    def trace(self, k):
+        """
+        Get the trace of operation matrix k
+        """
+        return self.take(k).traces()[0]
+
+    def __slots(self, shells):
+        """
+        Get the (nshells, 2l+1) array of m-slots of a series of shells
+        with identical l
+        """
+        l = self.basis.shell_l[shells[0]] if len(shells) > 0 else 0
+        return self.basis.shell_slot_offset[shells][:,None] + np.arange(2*l+1)
+
+    def __to_slots(self, x):
+        """
+        Scatter a vector (or matrix) in the basis onto the m-slots
+        """
+        x = np.asarray(x, dtype=np.float64)
+        xs = np.zeros((self.basis.shell_slot_offset[-1],) + x.shape[1:])
+        xs[self.bf_slots] = x
+
+        return xs
+
+class OperationMatrices:
+    """
+    Sequence of dense operation matrices, constructed on access from a
+    FactorisedOperations object and optionally cached
+    """
+    def __init__(self, factorised, cache=False):
+        self.factorised = factorised
+        self.cache = cache
+        self._matrices = {}
+
+    def __len__(self):
+        return len(self.factorised)
+
+    @property
+    def shape(self):
+        nbf = self.factorised.get_nbf()
+        return (len(self), nbf, nbf)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice) or not np.isscalar(idx):
+            return np.array([self[k] for k in np.arange(len(self))[idx]]).reshape((-1,) + self.shape[1:])
+
+        k = range(len(self))[idx]
+        if k in self._matrices:
+            return self._matrices[k]
+
+        mat = self.factorised.dense(k)
+        if self.cache:
+            self._matrices[k] = mat
+
+        return mat
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+    def __array__(self, dtype=None, copy=None):
+        return self[:].astype(dtype) if dtype is not None else self[:]
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from scipy.spatial import cKDTree
+from scipy.spatial.transform import Rotation as R
+
+def quantise_matrices(matrices, tol=1e-5):
+    """
+    Quantise a series of matrices on a grid with spacing tol, yielding a
+    (K,9) integer array that can be used for hashing
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1,9)
+    return np.rint(matrices / tol).astype(np.int64)
+
+def multiplication_table(matrices, tol=1e-4):
+    """
+    Build the multiplication table of a group of matrices
+    
+    All products are looked up in a single batched query of a KD-tree
+    holding the (flattened) matrices.
+    
+    Parameters
+    ----------
+    matrices : numpy.ndarray
+        (K,3,3) array of matrices forming a group
+    tol : float
+        Maximum (Frobenius) distance between a product and its match
+    
+    Returns
+    -------
+    numpy.ndarray
+        (K,K) integer array; entry [a,b] is the index of the product of
+        matrices a and b
+    
+    Raises
+    ------
+    RuntimeError
+        If the matrices do not form a group
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1,3,3)
+    K = len(matrices)
+    products = np.einsum('aij,bjk->abik', matrices, matrices)
+    
+    tree = cKDTree(matrices.reshape(-1,9))
+    dist, table = tree.query(products.reshape(-1,9), distance_upper_bound=tol)
+    table = table.reshape(K,K)
+    
+    unmatched = ~np.isfinite(dist.reshape(K,K))
+    if np.any(unmatched):
+        a,b = np.argwhere(unmatched)[0]
+        raise RuntimeError('Product of operations %i and %i is not part of the set of operations' % (a,b))
+    
+    return table.astype(np.int64)
+
+def common_centre(matrices, translations, tol=1e-6):
+    """
+    Establish a point left in place by all operations x -> Mx + t, i.e. a
+    centre about which the operations act as point operations (such as the
+    centroid for the operations found by SymmetryOperations.detect()); when
+    the operations leave a line or plane in place, the point of it closest
+    to the origin is returned
+    
+    Parameters
+    ----------
+    matrices : numpy.ndarray
+        (K,3,3) array of operation matrices
+    translations : numpy.ndarray
+        (K,3) array of (Cartesian) translations
+    tol : float
+        Maximum deviation of a translation from c - Mc
+    
+    Returns
+    -------
+    numpy.ndarray
+        Centre c of the operations
+    
+    Raises
+    ------
+    RuntimeError
+        If the operations do not leave a common point in place, e.g. when
+        these involve lattice translations or screw axes
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1,3,3)
+    translations = np.asarray(translations, dtype=np.float64).reshape(-1,3)
+    
+    # solve (1 - M_k) c = t_k for all operations at once
+    lhs = (np.identity(3) - matrices).reshape(-1,3)
+    rhs = translations.reshape(-1)
+    centre = np.linalg.lstsq(lhs, rhs, rcond=None)[0]
+    if np.max(np.abs(lhs @ centre - rhs), initial=0.0) > tol:
+        raise RuntimeError('The operations do not leave a common point in place; '
+                           'only point operations (about a common centre) are supported')
+    
+    return centre
+
+def _check_group(matrices, translations=None):
+    """
+    Raise a RuntimeError when the operations do not form a group, i.e. when
+    the matrices are not closed under multiplication or, if translations
+    are given, the operations do not act about a common centre
+    """
+    multiplication_table(matrices)
+    if translations is not None:
+        common_centre(matrices, translations)
+
+def generate_group(generators, tol=1e-5, maxorder=10000):
+    """
+    Close a series of matrices under multiplication
+    
+    Parameters
+    ----------
+    generators : numpy.ndarray
+        (G,3,3) array of generator matrices
+    tol : float
+        Tolerance used for identifying identical matrices
+    maxorder : int
+        Maximum number of elements
+    
+    Returns
+    -------
+    numpy.ndarray
+        (K,3,3) array of the matrices of all group elements; the identity
+        comes first, followed by the (distinct) generators
+    numpy.ndarray
+        (K,2) integer array; element k is the product of elements
+        products[k,0] and products[k,1] (in that order), which precede
+        element k; the identity and the generators carry -1
+    """
+    generators = np.asarray(generators, dtype=np.float64).reshape(-1,3,3)
+    elements = [np.identity(3)]
+    products = [(-1,-1)]
+    index = {quantise_matrices(np.identity(3), tol).tobytes(): 0}
+    gens = []
+    for g in generators:
+        key = quantise_matrices(g, tol).tobytes()
+        if key not in index:
+            index[key] = len(elements)
+            elements.append(g)
+            products.append((-1,-1))
+            gens.append(index[key])
+    
+    # breadth-first expansion; every new element is the product of a
+    # generator with an element found before
+    k = 0
+    while k < len(elements):
+        for g in gens:
+            m = elements[g] @ elements[k]
+            key = quantise_matrices(m, tol).tobytes()
+            if key not in index:
+                if len(elements) >= maxorder:
+                    raise RuntimeError('Group order exceeds %i; are the generators valid?' % maxorder)
+                index[key] = len(elements)
+                elements.append(m)
+                products.append((g,k))
+        k += 1
+    
+    return np.array(elements), np.array(products, dtype=np.int64).reshape(-1,2)
+
+def operation_axes(matrices):
+    """
+    Get the rotation axes of a series of operations; the axis of an
+    improper operation is that of its product with the inversion (i.e. the
+    normal of a mirror plane). The identity and the inversion yield a zero
+    vector.
+    
+    Parameters
+    ----------
+    matrices : numpy.ndarray
+        (K,3,3) array of orthogonal matrices
+    
+    Returns
+    -------
+    numpy.ndarray
+        (K,3) array of unit vectors (or zero vectors)
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1,3,3)
+    proper = matrices * np.sign(np.linalg.det(matrices))[:,None,None]
+    rotvec = R.from_matrix(proper).as_rotvec()
+    norm = np.linalg.norm(rotvec, axis=1)
+    
+    return np.where(norm[:,None] > 1e-6, rotvec / np.maximum(norm, 1e-6)[:,None], 0.0)
+
+def conjugacy_classes(table):
+    """
+    Partition the elements of a group into conjugacy classes
+    
+    Parameters
+    ----------
+    table : numpy.ndarray
+        (K,K) multiplication table of the group
+    
+    Returns
+    -------
+    numpy.ndarray
+        (K,) integer array holding the class of every element; classes are
+        numbered in order of first appearance
+    """
+    table = np.asarray(table, dtype=np.int64)
+    K = len(table)
+    identity = np.flatnonzero(np.all(table == np.arange(K), axis=1))[0]
+    inverse = np.argmax(table == identity, axis=1)
+    
+    # conj[g,x] = g x g^-1; the smallest index in the orbit of x labels
+    # its class
+    conj = table[table, inverse[:,None]]
+    representative = np.min(conj, axis=0)
+    
+    return np.unique(representative, return_inverse=True)[1].reshape(-1)
+
+def class_constants(table, labels):
+    """
+    Calculate the class multiplication coefficients of a group
+    
+    Parameters
+    ----------
+    table : numpy.ndarray
+        (K,K) multiplication table of the group
+    labels : numpy.ndarray
+        (K,) class of every element
+    
+    Returns
+    -------
+    numpy.ndarray
+        (C,C,C) array; entry [a,b,c] lists how many times an element of
+        class c is obtained as product of an element of class a and an
+        element of class b
+    """
+    table = np.asarray(table, dtype=np.int64)
+    labels = np.asarray(labels, dtype=np.int64)
+    nrclasses = labels.max() + 1
+    idx = (labels[:,None] * nrclasses + labels[None,:]) * nrclasses + labels[table]
+    counts = np.bincount(idx.reshape(-1), minlength=nrclasses**3).reshape((nrclasses,)*3)
+    
+    return counts / np.bincount(labels)[None,None,:]
+
+def atom_orbits(permutations):
+    """
+    Decompose the atoms into orbits under a set of atom permutations
+    
+    Atoms are labelled by the lowest atom index they can be mapped onto;
+    labels are propagated along the permutations (in both directions)
+    until convergence, such that a set of generators suffices.
+    
+    Parameters
+    ----------
+    permutations : numpy.ndarray
+        (K,N) integer array of atom permutations
+    
+    Returns
+    -------
+    numpy.ndarray
+        (N,) integer array holding the orbit of every atom; orbits are
+        numbered in order of first appearance
+    numpy.ndarray
+        Representative (lowest atom index) of every orbit
+    """
+    permutations = np.asarray(permutations, dtype=np.int64).reshape(-1, np.shape(permutations)[-1])
+    labels = np.arange(permutations.shape[1])
+    while True:
+        new = np.minimum(labels, np.min(labels[permutations], axis=0))
+        np.minimum.at(new, permutations, new[None,:])
+        new = new[new]
+        if np.array_equal(new, labels):
+            break
+        labels = new
+    
+    representatives, orbits = np.unique(labels, return_inverse=True)
+    
+    return orbits.reshape(-1), representatives
+
+def stabilisers(permutations, atoms):
+    """
+    Get for a series of atoms the indices of the permutations that leave
+    these atoms in place
+    """
+    permutations = np.asarray(permutations, dtype=np.int64)
+    atoms = np.atleast_1d(atoms)
+    fixed = permutations[:,atoms] == atoms
+    
+    return [np.flatnonzero(f) for f in fixed.T]
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import itertools
+from scipy.spatial import cKDTree
+from .group import common_centre, _check_group
+from .symmetry_operations import match_atoms
+
+def symmetrize(mol, operations, tol=1e-2, cell=None):
+    """
+    Make a geometry (or a series of geometries) exactly symmetric by
+    averaging every atom over its images under all operations
+    
+    Atoms are matched with a loose tolerance; atom i is then replaced by
+    the average over all operations k of the inverse of operation k
+    applied to the atom onto which atom i is mapped by operation k. As the
+    operations form a group, this projects the geometry onto the space of
+    symmetric geometries. The average is evaluated for all operations and
+    atoms at once using the table of atom permutations. Without a unit
+    cell, the operations should act about a common centre (see
+    common_centre()), which is kept fixed for all frames.
+    
+    Parameters
+    ----------
+    mol : Molecule or numpy.ndarray
+        Molecule, (N,3) array of positions or (F,N,3) array of frames
+    operations : SymmetryOperations or list of Operation
+        Operations forming a group
+    tol : float
+        Maximum distance between a transformed atom and its image
+    cell : numpy.ndarray, optional
+        (3,3) array holding the lattice vectors as rows; taken from the
+        molecule when a Molecule is given
+    
+    Returns
+    -------
+    numpy.ndarray
+        Symmetrized positions, of the same shape as the input positions
+    
+    Raises
+    ------
+    RuntimeError
+        If the operations do not form a group (about a common centre) or
+        atoms cannot be matched
+    """
+    if hasattr(mol, 'positions'):
+        positions, cell = mol.positions, mol.cell
+    else:
+        positions = mol
+    positions = np.asarray(positions, dtype=np.float64)
+    if hasattr(operations, 'operations'):
+        operations = operations.operations
+    
+    matrices = np.array([op.get_matrix() for op in operations]).reshape(-1,3,3)
+    translations = np.array([op.get_translation() for op in operations]).reshape(-1,3)
+    names = [op.name for op in operations]
+    # averaging over the images only projects onto symmetric geometries
+    # when the operations form a group
+    _check_group(matrices, None if cell is not None else translations)
+    
+    frames = positions.reshape((-1,) + positions.shape[-2:])
+    perms = np.array([match_atoms(frame, matrices, tol, names, translations, cell)
+                      for frame in frames])
+    
+    return _average_images(frames, perms, matrices, translations, cell).reshape(positions.shape)
+
+def continuous_symmetry_measure(frames, operations, elements=None, method='kdtree',
+                                chunksize=2**20):
+    """
+    Calculate the continuous symmetry measure (CSM) of a series of frames
+    with respect to a set of point operations
+    
+    The CSM is 100 times the sum of the squared distances between the
+    (centred) atoms and those of the closest symmetric structure,
+    normalised by the sum of the squared distances of the atoms to their
+    centroid. It is zero for a symmetric structure. The operations are kept
+    fixed, i.e. the frames should be oriented consistently with the
+    operations; their translations are ignored as both the frames and the
+    operations are taken about the centroid.
+    
+    For every frame and operation, the permutation mapping the transformed
+    atoms onto the atoms (of the same element) is established
+    independently: by nearest neighbours via a KD-tree, falling back to an
+    optimal assignment (Hungarian algorithm) when the nearest neighbours do
+    not form a permutation, or always by optimal assignment. The closest
+    symmetric structure then follows from averaging the atoms over their
+    images (see symmetrize()). Frames are processed in chunks such that the
+    intermediate (frames, operations, atoms) arrays hold at most chunksize
+    entries (but at least a single frame).
+    
+    Parameters
+    ----------
+    frames : numpy.ndarray
+        (F,N,3) array of frames or (N,3) array of positions
+    operations : SymmetryOperations or list of Operation
+        Operations forming a group about a common centre
+    elements : sequence, optional
+        (N,) element (indices or symbols) of every atom; atoms are only
+        mapped onto atoms of the same element
+    method : str
+        Either 'kdtree' or 'hungarian'
+    chunksize : int
+        Maximum number of (frame, operation, atom) combinations processed at
+        once
+    
+    Returns
+    -------
+    numpy.ndarray
+        (F,) array holding the CSM of every frame (or a scalar for a single
+        set of positions)
+    """
+    from scipy.optimize import linear_sum_assignment
+    from scipy.spatial.distance import cdist
+    
+    frames = np.asarray(frames, dtype=np.float64)
+    single = frames.ndim == 2
+    frames = frames.reshape((-1,) + frames.shape[-2:])
+    if hasattr(operations, 'operations'):
+        operations = operations.operations
+    if method not in ('kdtree', 'hungarian'):
+        raise RuntimeError('Unknown matching method: %s' % method)
+    
+    # the frames are centred, such that only the matrices matter; operations
+    # about another centre (such as those found by detect()) are accepted
+    matrices = np.array([op.get_matrix() for op in operations]).reshape(-1,3,3)
+    common_centre(matrices, [op.get_translation() for op in operations])
+    
+    F, N = frames.shape[:2]
+    K = len(matrices)
+    if elements is None:
+        elements = np.zeros(N, dtype=np.int64)
+    else:
+        elements = np.unique(np.asarray(elements), return_inverse=True)[1].reshape(N)
+    
+    csm = np.empty(F)
+    step = max(1, chunksize // (K * N))
+    for start in range(0, F, step):
+        chunk = frames[start:start+step]
+        chunk = chunk - np.mean(chunk, axis=1, keepdims=True)
+        C = len(chunk)
+        tpos = chunk[:,None,:,:] @ matrices.transpose(0,2,1)[None]
+        
+        # atoms of different elements (and of different frames) are
+        # separated along additional coordinates by more than any distance
+        # within the frames, such that all frames of the chunk are matched
+        # in a single query
+        scale = 4.0 * (np.max(np.abs(chunk)) + 1.0)
+        extra = np.zeros((C,N,2))
+        extra[:,:,0] = elements * scale
+        extra[:,:,1] = np.arange(C)[:,None] * scale
+        ref = np.concatenate([chunk, extra], axis=2)
+        pts = np.concatenate([tpos, np.broadcast_to(extra[:,None], (C,K,N,2))], axis=3)
+        if method == 'kdtree':
+            _, idx = cKDTree(ref.reshape(-1,5)).query(pts.reshape(-1,5))
+            perms = idx.reshape(C,K,N) - np.arange(C)[:,None,None] * N
+            redo = np.argwhere(np.any(np.sort(perms, axis=2) != np.arange(N), axis=2))
+        else:
+            perms = np.empty((C,K,N), dtype=np.int64)
+            redo = itertools.product(range(C), range(K))
+        for f,k in redo:
+            perms[f,k] = linear_sum_assignment(cdist(pts[f,k], ref[f], 'sqeuclidean'))[1]
+        
+        sym = _average_images(chunk, perms, matrices)
+        norm = np.sum(chunk**2, axis=(1,2))
+        dev = np.sum((chunk - sym)**2, axis=(1,2))
+        csm[start:start+len(chunk)] = 100.0 * np.divide(dev, norm, out=np.zeros_like(dev), where=norm > 0)
+    
+    return csm[0] if single else csm
+
+def _average_images(frames, perms, matrices, translations=None, cell=None):
+    """
+    Average every atom over the inverse operations applied to its images
+    
+    Parameters
+    ----------
+    frames : numpy.ndarray
+        (F,N,3) array of frames
+    perms : numpy.ndarray
+        (F,K,N) array of atom permutations per frame
+    matrices : numpy.ndarray
+        (K,3,3) array of operation matrices
+    translations : numpy.ndarray, optional
+        (K,3) array of translations
+    cell : numpy.ndarray, optional
+        (3,3) array of lattice vectors; displacements are taken modulo the
+        lattice vectors
+    """
+    # displacement of every atom with respect to the transformed atom
+    # mapped onto it
+    images = np.take_along_axis(frames[:,None,:,:], perms[...,None], axis=2)
+    delta = images - frames[:,None,:,:] @ matrices.transpose(0,2,1)[None]
+    if translations is not None:
+        delta -= translations[None,:,None,:]
+    if cell is not None:
+        delta -= np.round(delta @ np.linalg.inv(cell)) @ cell
+    
+    return frames + np.sum(delta @ matrices[None], axis=1) / len(matrices)
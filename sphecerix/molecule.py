@@ -1,32 +1,157 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
-from copy import deepcopy
+from .basis_set import BasisSet
+
+ANG2BOHR = 1.8897259886
 
 class Molecule:
     """
     Molecule class
+
+    Atoms are stored as a structure of arrays: a contiguous (N,3) array of
+    positions (in bohr), an integer array of element indices and a list of
+    element symbols to which these indices refer.
     """
     def __init__(self, _name='unknown'):
-        self.atoms = []
-        self.charges = []
         self.name = _name
         self.basis = None
+        self.cell = None        # lattice vectors (rows, in bohr) when periodic
+        self.symbols = []       # element symbol lookup
+        self._symbol_ids = {}   # element symbol -> element index
+
+        # storage buffers; only the first self._nratoms rows are in use
+        self._nratoms = 0
+        self._positions = np.zeros((0,3), dtype=np.float64)
+        self._elements = np.zeros(0, dtype=np.int64)
+        self._charges = np.zeros(0, dtype=np.int64)
 
-    def from_file(self, path, molname=None):
+        # symmetry bookkeeping of molecules built from an asymmetric unit
+        self.operations = None          # operations generating the atoms
+        self.atom_permutations = None   # (K,N) atom permutations
+        self.orbits = None              # orbit (unique atom) of every atom
+        self._symmetric_positions = None
+
+    @classmethod
+    def from_asymmetric_unit(cls, symbols, positions, operations, unit='bohr',
+                             tol=np.sqrt(1e-5), name='unknown'):
         """
-        Build molecule from file and return it
+        Build a molecule from its symmetry-unique atoms and the (point)
+        operations of its group
+
+        All operations are applied to all unique atoms at once; coincident
+        images are merged via a KD-tree. The atoms are ordered per unique
+        atom. The atom permutations under all operations follow from the
+        multiplication table of the group and are recorded, together with
+        the orbit of every atom, such that SymmetryOperations can use these
+        instead of matching the atoms.
+
+        symbols    : sequence of element symbols of the unique atoms
+        positions  : (U,3) array of positions of the unique atoms
+        operations : SymmetryOperations object or list of Operation objects
+                     forming a group; these may carry a translation when
+                     acting about a common centre (see common_centre())
+        unit       : either 'bohr' or 'angstrom'
+        tol        : distance below which images are considered coincident
         """
-        self.name = molname
+        from scipy.spatial import cKDTree
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+        from .group import multiplication_table, common_centre
+
+        if hasattr(operations, 'operations'):
+            operations = operations.operations
+        operations = list(operations)
+
+        positions = np.array(positions, dtype=np.float64).reshape(-1,3)
+        if unit == "angstrom":
+            positions *= ANG2BOHR
+        elif unit != "bohr":
+            raise RuntimeError("Invalid unit encountered: %s. Accepted units are 'bohr' and 'angstrom'." % unit)
+        symbols = np.asarray(symbols, dtype=str).reshape(-1)
+        if len(symbols) != len(positions):
+            raise RuntimeError("Number of symbols (%i) does not match number of positions (%i)." % (len(symbols), len(positions)))
+
+        matrices = np.array([op.get_matrix() for op in operations]).reshape(-1,3,3)
+        translations = np.array([op.get_translation() for op in operations]).reshape(-1,3)
+        table = multiplication_table(matrices)
+        common_centre(matrices, translations)
+        K, U = len(matrices), len(positions)
+
+        # images of all unique atoms under all operations; image k of unique
+        # atom u has index u * K + k
+        images = (np.einsum('kij,uj->uki', matrices, positions) + translations[None]).reshape(-1,3)
+        pairs = cKDTree(images).query_pairs(tol, output_type='ndarray')
+        graph = coo_matrix((np.ones(len(pairs)), (pairs[:,0], pairs[:,1])), shape=(K*U, K*U))
+        nrclusters, labels = connected_components(graph, directed=False)
+
+        # every atom is represented by its first image
+        first = np.full(nrclusters, K*U, dtype=np.int64)
+        np.minimum.at(first, labels, np.arange(K*U))
+        order = np.argsort(first)
+        first = first[order]
+        atom = np.empty(nrclusters, dtype=np.int64)
+        atom[order] = np.arange(nrclusters)
+
+        # all images in a cluster should stem from the same unique atom
+        orbits = first // K
+        if np.any(orbits[atom[labels]] != np.repeat(np.arange(U), K)):
+            raise RuntimeError("Images of different unique atoms coincide.")
+
+        # operation k maps atom i = M_g p_u onto M_k M_g p_u
+        image_atom = atom[labels].reshape(U,K)
+        generator = first % K
+        perms = image_atom[orbits[None,:], table[:,generator]]
+
+        mol = cls(name)
+        mol.add_atoms(symbols[orbits], images[first])
+        mol.operations = operations
+        mol.atom_permutations = perms
+        mol.orbits = orbits
+        mol._symmetric_positions = np.array(mol.positions)
+
+        return mol
+
+    def get_atom_permutations(self, operations):
+        """
+        Get the recorded atom permutations (see from_asymmetric_unit) of a
+        series of operations as a (K,N) array, or None when these are not
+        available for all operations or the atoms have been altered
+        """
+        if self.atom_permutations is None or self.cell is not None or \
+           not np.array_equal(self._symmetric_positions, self.positions):
+            return None
 
-        with open(path, 'r') as f:
-            lines = f.readlines()
-            
-            nratoms = int(lines[0].strip())
+        lookup = {id(op): k for k,op in enumerate(self.operations)}
+        idx = [lookup.get(id(op), -1) for op in operations]
+        if -1 in idx:
+            return None
 
-            for line in lines[2:2+nratoms]:
-                pieces = line.split()
-                self.add_atom(pieces[0], float(pieces[1]), float(pieces[2]), float(pieces[3]), unit='angstrom')
+        return self.atom_permutations[np.array(idx, dtype=np.int64)].reshape(-1, self.nratoms)
+
+    def get_stabilisers(self, atoms=None):
+        """
+        Get the indices of the recorded operations (see
+        from_asymmetric_unit) that leave each of a series of atoms (by
+        default all atoms) in place
+        """
+        from .group import stabilisers
+
+        if atoms is None:
+            atoms = np.arange(self.nratoms)
+
+        return stabilisers(self.atom_permutations, atoms)
+
+    def from_file(self, path, molname=None, frame=0):
+        """
+        Build molecule from (a frame of a) file and return it
+        """
+        from .xyz_reader import XYZReader
+
+        self.name = molname
+
+        with XYZReader(path) as reader:
+            self.add_atoms(reader.read_symbols(frame), reader.read_positions(frame))
 
     def __str__(self):
         res = "Molecule: %s\n" % self.name
@@ -35,31 +160,152 @@ class Molecule:
 
         return res
 
+    @property
+    def nratoms(self):
+        """
+        Number of atoms in the molecule
+        """
+        return self._nratoms
+
+    @property
+    def positions(self):
+        """
+        Atomic positions in bohr as a contiguous (N,3) array; this is a view
+        on the internal storage and is not copied
+        """
+        return self._positions[:self._nratoms]
+
+    @property
+    def elements(self):
+        """
+        Element index of every atom; see Molecule.symbols for the lookup
+        """
+        return self._elements[:self._nratoms]
+
+    @property
+    def charges(self):
+        """
+        Read-only tuple holding the charge of every atom
+        """
+        return tuple(self._charges[:self._nratoms].tolist())
+
+    @property
+    def atoms(self):
+        """
+        Read-only tuple of (symbol, position) pairs, built on access; the
+        positions are copies, atoms are added via add_atom()/add_atoms()
+        and moved via Molecule.positions
+        """
+        return tuple((self.symbols[e], p) for e,p in zip(self.elements, np.array(self.positions)))
+
     def add_atom(self, atom, x, y, z, unit='bohr'):
-        ang2bohr = 1.8897259886
+        self.add_atoms([atom], [[float(x), float(y), float(z)]], unit=unit)
+
+    def add_atoms(self, symbols, positions, unit='bohr'):
+        """
+        Add a series of atoms to the molecule in one go
+
+        symbols   : sequence of element symbols of length M
+        positions : (M,3) array of atomic positions
+        unit      : either 'bohr' or 'angstrom'
+        """
+        positions = np.array(positions, dtype=np.float64).reshape(-1,3)
 
-        x = float(x)
-        y = float(y)
-        z = float(z)
+        if unit == "angstrom":
+            positions *= ANG2BOHR
+        elif unit != "bohr":
+            raise RuntimeError("Invalid unit encountered: %s. Accepted units are 'bohr' and 'angstrom'." % unit)
+
+        # map element symbols onto element indices
+        usymbols, inverse = np.unique(np.asarray(symbols, dtype=str), return_inverse=True)
+        if len(inverse) != len(positions):
+            raise RuntimeError("Number of symbols (%i) does not match number of positions (%i)." % (len(inverse), len(positions)))
+        lut = np.array([self.__get_symbol_id(s) for s in usymbols], dtype=np.int64)
+
+        # copy data into the storage buffers
+        n0 = self._nratoms
+        n1 = n0 + len(positions)
+        self.__reserve(n1)
+        self._positions[n0:n1] = positions
+        self._elements[n0:n1] = lut[inverse.reshape(-1)]
+        self._charges[n0:n1] = 0
+        self._nratoms = n1
+
+        # the atoms no longer follow from an asymmetric unit
+        self.atom_permutations = None
+        self.orbits = None
+
+    def set_unit_cell(self, vectors, unit='bohr'):
+        """
+        Set the unit cell, making the molecule periodic
+
+        vectors : (3,3) array holding the lattice vectors as rows
+        unit    : either 'bohr' or 'angstrom'
+        """
+        vectors = np.array(vectors, dtype=np.float64).reshape(3,3)
 
-        if unit == "bohr":
-            self.atoms.append([atom, np.array([x, y, z])])
-        elif unit == "angstrom":
-            self.atoms.append([atom, np.array([x*ang2bohr, y*ang2bohr, z*ang2bohr])])
-        else:
+        if unit == "angstrom":
+            vectors *= ANG2BOHR
+        elif unit != "bohr":
             raise RuntimeError("Invalid unit encountered: %s. Accepted units are 'bohr' and 'angstrom'." % unit)
 
-        self.charges.append(0)
-        
+        if abs(np.linalg.det(vectors)) < 1e-8:
+            raise RuntimeError("Lattice vectors should be linearly independent.")
+
+        self.cell = vectors
+
+    def is_periodic(self):
+        """
+        Whether the molecule has a unit cell
+        """
+        return self.cell is not None
+
+    def get_fractional(self, positions=None):
+        """
+        Convert Cartesian positions (by default those of the atoms) to
+        fractional coordinates of the unit cell
+        """
+        positions = self.positions if positions is None else np.asarray(positions, dtype=np.float64)
+
+        return positions @ np.linalg.inv(self.cell)
+
+    def get_cartesian(self, fractional):
+        """
+        Convert fractional coordinates of the unit cell to Cartesian
+        positions (in bohr)
+        """
+        return np.asarray(fractional, dtype=np.float64) @ self.cell
+
     def build_basis(self, molset):
-        self.basis = []
-        
-        for i,atom in enumerate(self.atoms):
-            if atom[0] in molset.keys():
-                for bf in molset[atom[0]]:
-                    abf = deepcopy(bf)
-                    abf.name = atom[0] + bf.name
-                    abf.r = np.array([atom[1][i] for i in range(3)])
-                    abf.atomid = i
-                    self.basis.append(abf)
-            
\ No newline at end of file
+        """
+        Build the basis set from a dictionary mapping element symbols onto
+        a list of BasisFunction objects
+        """
+        self.basis = BasisSet.from_molset(self, molset)
+
+    def __get_symbol_id(self, symbol):
+        """
+        Get element index of symbol, registering the symbol when required
+        """
+        symbol = str(symbol)
+        if symbol not in self._symbol_ids:
+            self._symbol_ids[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+
+        return self._symbol_ids[symbol]
+
+    def __reserve(self, n):
+        """
+        Ensure that the storage buffers can hold at least n atoms; capacity
+        grows geometrically such that repeated calls to add_atom are amortized
+        """
+        capacity = len(self._positions)
+        if n <= capacity:
+            return
+
+        capacity = max(n, 2 * capacity, 16)
+        for attr in ['_positions', '_elements', '_charges']:
+            old = getattr(self, attr)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._nratoms] = old[:self._nratoms]
+            setattr(self, attr, new)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+import weakref
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+from concurrent.futures import ProcessPoolExecutor
+
+class WorkerPool:
+    """
+    Pool of worker processes evaluating tasks over contiguous chunks of
+    operations
+
+    Results are always collected in the order of the tasks, such that the
+    outcome does not depend on the number of workers. With a single worker,
+    all tasks are evaluated in the calling process.
+    """
+    def __init__(self, workers=None, chunks_per_worker=4):
+        self.workers = max(int(workers or 1), 1)
+        self.chunks_per_worker = chunks_per_worker
+        self.executor = None
+        if self.workers > 1:
+            # the workers should share the resource tracker of this process,
+            # such that shared memory attached to by a worker is not
+            # unlinked when the worker exits
+            resource_tracker.ensure_running()
+            self.executor = ProcessPoolExecutor(self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def shutdown(self):
+        """
+        Stop the worker processes
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def is_parallel(self):
+        """
+        Whether tasks are evaluated by worker processes
+        """
+        return self.executor is not None
+
+    def get_chunks(self, indices):
+        """
+        Split a series of indices into contiguous chunks; a few chunks are
+        made per worker to balance the load
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(indices) == 0:
+            return []
+        if self.executor is None:
+            return [indices]
+
+        return np.array_split(indices, min(len(indices), self.chunks_per_worker * self.workers))
+
+    def starmap(self, func, tasks):
+        """
+        Evaluate func for every tuple of arguments in tasks and return the
+        results in the order of the tasks
+        """
+        if self.executor is None:
+            return [func(*args) for args in tasks]
+
+        return list(self.executor.map(func, *zip(*tasks))) if len(tasks) > 0 else []
+
+def allocate_shared(owner, shape, dtype=np.float64):
+    """
+    Allocate a zero-initialised array in shared memory
+
+    The shared memory segment is unlinked when owner is garbage collected,
+    at interpreter exit, or when the returned finalizer is called; arrays
+    referring to the segment remain valid after it has been unlinked.
+
+    Returns
+    -------
+    multiprocessing.shared_memory.SharedMemory
+        Shared memory segment
+    numpy.ndarray
+        Array referring to the segment
+    weakref.finalize
+        Finalizer unlinking the segment
+    """
+    nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+    shm = _SharedMemory(create=True, size=nbytes)
+    arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    return shm, arr, weakref.finalize(owner, _unlink, shm)
+
+def wigner_blocks(operations, l):
+    """
+    Get the transposed Wigner-D matrices of a series of operations
+    """
+    return np.array([op.get_wigner_matrix(l).transpose() for op in operations]).reshape(-1,2*l+1,2*l+1)
+
+def build_dense(name, shape, factorised, indices):
+    """
+    Construct dense operation matrices directly into an array in shared
+    memory; operation j of factorised is stored at index indices[j]
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        out = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        for j,k in enumerate(indices):
+            factorised.dense(j, out=out[k])
+        del out
+    finally:
+        shm.close()
+
+class _SharedMemory(shared_memory.SharedMemory):
+    """
+    Shared memory segment that is not unmapped when the object is garbage
+    collected; the mapping is released along with the last array referring
+    to it
+    """
+    def __del__(self):
+        pass
+
+def _unlink(shm):
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
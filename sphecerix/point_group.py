@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from fractions import Fraction
+from scipy.spatial import cKDTree
+from scipy.spatial.transform import Rotation as R
+from .symmetry_operations import Identity, Inversion, Rotation, Mirror, \
+                                 ImproperRotation
+
+def get_rotor_type(positions, tol=1e-3):
+    """
+    Classify the rotor type of a set of atoms from the principal moments of
+    the (unit mass) inertia tensor
+
+    Returns
+    -------
+    str
+        One of 'atom', 'linear', 'spherical', 'symmetric' or 'asymmetric'
+    numpy.ndarray
+        Principal moments in ascending order
+    numpy.ndarray
+        Principal axes (as columns)
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    r2 = np.einsum('ni,ni->n', positions, positions)
+    inertia = np.sum(r2) * np.identity(3) - positions.T @ positions
+    moments, axes = np.linalg.eigh(inertia)
+
+    # compare the moments relative to the largest one
+    scale = max(moments[-1], 1.0)
+    if moments[-1] < tol:
+        return 'atom', moments, axes
+    if moments[0] < tol * scale:
+        return 'linear', moments, axes
+
+    same = np.abs(np.diff(moments)) < tol * scale
+    if np.all(same):
+        return 'spherical', moments, axes
+    if np.any(same):
+        return 'symmetric', moments, axes
+
+    return 'asymmetric', moments, axes
+
+def detect_point_group(positions, elements, tol=np.sqrt(1e-5)):
+    """
+    Detect all symmetry operations of a set of atoms and the point group to
+    which these belong
+
+    The operations are searched about the centroid of the atoms, which
+    lies on all symmetry elements. When the centroid does not coincide with
+    the origin, every operation M carries the translation c - Mc, with c
+    the centroid, such that it maps the atoms in place onto each other.
+
+    Every operation is fully determined by the images of two non-collinear
+    reference atoms. The reference atoms are taken from the smallest sets of
+    symmetry-equivalent atoms (same element, same distance to the origin)
+    and candidate images are restricted to atoms at the correct distances
+    using a KD-tree; all candidates are verified by a batched KD-tree query.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        (N,3) array of atomic positions
+    elements : numpy.ndarray
+        Element index of every atom
+    tol : float
+        Maximum distance between a transformed atom and its image
+
+    Returns
+    -------
+    list of Operation
+        Symmetry operations, sorted by type
+    numpy.ndarray
+        (K,N) array of atom permutations of the operations
+    str
+        Point group label (Schoenflies notation)
+    """
+    centroid = np.average(np.asarray(positions, dtype=np.float64), axis=0)
+    positions = np.asarray(positions, dtype=np.float64) - centroid
+    elements = np.asarray(elements, dtype=np.int64)
+    N = len(positions)
+
+    rotor, moments, axes = get_rotor_type(positions, tol)
+    if rotor in ('atom', 'linear'):
+        raise RuntimeError('Point group detection is not supported for %s molecules' % ('linear' if rotor == 'linear' else 'single-atom'))
+
+    a1, a2 = _select_reference_atoms(positions, elements, tol)
+    sea = _get_sea_labels(positions, elements, tol)
+
+    # candidate images of the two reference atoms
+    b1 = np.flatnonzero(sea == sea[a1])
+    c2 = np.flatnonzero(sea == sea[a2])
+    d12 = np.linalg.norm(positions[a2] - positions[a1])
+    tree = cKDTree(positions[c2])
+    pairs = [(i, c2[j]) for i,js in zip(b1, tree.query_ball_point(positions[b1], d12 + tol))
+             for j in js if np.abs(np.linalg.norm(positions[c2[j]] - positions[i]) - d12) < tol]
+    pairs = np.array(pairs, dtype=np.int64).reshape(-1,2)
+
+    # operation matrices mapping the frame of the reference atoms onto the
+    # frame of their images; both proper and improper candidates are built
+    pa1, pa2 = positions[a1], positions[a2]
+    finv = np.linalg.inv(np.column_stack([pa1, pa2, np.cross(pa1, pa2)]))
+    pb1, pb2 = positions[pairs[:,0]], positions[pairs[:,1]]
+    cross = np.cross(pb1, pb2)
+    frames = np.concatenate([np.stack([pb1, pb2, cross], axis=2),
+                             np.stack([pb1, pb2, -cross], axis=2)])
+    matrices = _orthogonalize(frames @ finv)
+
+    # for planar molecules, a proper and an improper operation can induce
+    # the same permutation; operations are hence identified by their
+    # permutation and the sign of their determinant
+    perms, valid = _verify(positions, elements, matrices, tol)
+    signs = np.sign(np.linalg.det(matrices[valid])).astype(np.int64)
+    unique = np.unique(np.column_stack([signs, perms[valid]]), axis=0)
+    signs, perms = unique[:,0], unique[:,1:]
+    matrices = _fit_matrices(positions, perms, signs)
+
+    operations, order = classify_operations(matrices)
+
+    # operations about the centroid
+    translations = centroid - matrices @ centroid
+    for op,t in zip(operations, translations):
+        if np.linalg.norm(t) > 1e-10:
+            op.set_translation(t)
+
+    return [operations[k] for k in order], perms[order], _get_label(operations)
+
+def _select_reference_atoms(positions, elements, tol):
+    """
+    Select two reference atoms that are not collinear with the origin,
+    preferring atoms from small sets of symmetry-equivalent atoms
+    """
+    sea = _get_sea_labels(positions, elements, tol)
+    counts = np.bincount(sea)
+    radius = np.linalg.norm(positions, axis=1)
+
+    candidates = np.flatnonzero(radius > tol)
+    candidates = candidates[np.argsort(counts[sea[candidates]], kind='stable')]
+    a1 = candidates[0]
+
+    sin = np.linalg.norm(np.cross(positions[candidates], positions[a1]), axis=1) / \
+          (radius[candidates] * radius[a1])
+    noncollinear = candidates[sin > 1e-3]
+    a2 = noncollinear[np.argmin(counts[sea[noncollinear]])]
+
+    return a1, a2
+
+def _get_sea_labels(positions, elements, tol):
+    """
+    Label the atoms by element and distance to the origin; atoms carrying
+    different labels are never symmetry-equivalent
+    """
+    radius = np.linalg.norm(positions, axis=1)
+    order = np.lexsort((radius, elements))
+    newgroup = np.concatenate([[False], (np.diff(elements[order]) != 0) |
+                                        (np.diff(radius[order]) > tol)])
+    labels = np.zeros(len(positions), dtype=np.int64)
+    labels[order] = np.cumsum(newgroup)
+
+    return labels
+
+def _orthogonalize(matrices):
+    """
+    Replace a series of matrices by the nearest orthogonal matrices
+    """
+    u, s, vt = np.linalg.svd(matrices)
+    return u @ vt
+
+def _verify(positions, elements, matrices, tol, chunksize=2**20):
+    """
+    Establish which candidate matrices map the atoms onto themselves
+    """
+    N = len(positions)
+    tree = cKDTree(positions)
+    perms = np.zeros((len(matrices), N), dtype=np.int64)
+    valid = np.zeros(len(matrices), dtype=bool)
+    step = max(1, chunksize // N)
+    for start in range(0, len(matrices), step):
+        mats = matrices[start:start+step]
+        tpos = np.einsum('kij,nj->kni', mats, positions)
+        dist, idx = tree.query(tpos.reshape(-1,3), distance_upper_bound=tol)
+        dist, idx = dist.reshape(-1,N), idx.reshape(-1,N)
+        ok = np.all(np.isfinite(dist), axis=1)
+        idx[~ok] = 0
+        ok &= np.all(elements[idx] == elements, axis=1)
+        ok &= np.all(np.sort(idx, axis=1) == np.arange(N), axis=1)
+        perms[start:start+step] = idx
+        valid[start:start+step] = ok
+
+    return perms, valid
+
+def _fit_matrices(positions, perms, signs):
+    """
+    Find the orthogonal matrices (with determinant signs) that best map
+    every atom onto its image
+    """
+    h = np.einsum('kni,nj->kij', positions[perms], positions)
+    u, s, vt = np.linalg.svd(h)
+    d = np.ones((len(perms), 3))
+    d[:,2] = signs * np.sign(np.linalg.det(u @ vt))
+
+    return np.einsum('kij,kj,kjl->kil', u, d, vt)
+
+def classify_operations(matrices):
+    """
+    Convert the matrices of a group of operations to Operation objects
+
+    Parameters
+    ----------
+    matrices : numpy.ndarray
+        (K,3,3) array of the operation matrices of a complete group
+
+    Returns
+    -------
+    list of Operation
+        Operation objects in the order of the matrices
+    list of int
+        Order in which the operations should be listed, sorted by type,
+        order and power
+    """
+    maxorder = len(matrices)
+    ops = []
+    for M in matrices:
+        det = np.linalg.det(M)
+        rotvec = R.from_matrix(M * np.sign(det)).as_rotvec()
+        angle = np.linalg.norm(rotvec)
+        axis = rotvec / angle if angle > 1e-6 else np.array([0.0, 0.0, 1.0])
+
+        if det > 0:
+            if angle < 1e-6:
+                ops.append(['E', 1, 1, None, None])
+            else:
+                n = _get_order(angle, maxorder)
+                ops.append(['C', n, int(np.round(angle * n / (2.0 * np.pi))), axis, angle])
+        else:
+            if angle < 1e-6:
+                ops.append(['i', 1, 1, None, None])
+            elif np.abs(angle - np.pi) < 1e-6:
+                ops.append(['σ', 2, 1, _canonical(axis), None])
+            else:
+                # -R(a,w) = σ_a R(-a, pi-w)
+                n = _get_order(np.pi - angle, maxorder)
+                ops.append(['S', n, int(np.round((np.pi - angle) * n / (2.0 * np.pi))), -axis, np.pi - angle])
+
+    # principal axis: highest order rotation axis, preferring an axis that
+    # also hosts an improper rotation of double order and alignment with z
+    rotations = [op for op in ops if op[0] == 'C']
+    principal = None
+    if len(rotations) > 0:
+        nmax = max(op[1] for op in rotations)
+        def score(op):
+            s2n = any(o[0] == 'S' and o[1] == 2 * nmax and
+                      np.abs(np.abs(o[3] @ op[3]) - 1.0) < 1e-4 for o in ops)
+            return (s2n, np.round(np.abs(op[3][2]), 4))
+        principal = max([op for op in rotations if op[1] == nmax], key=score)[3]
+
+    # C2 axes are unoriented
+    for op in ops:
+        if op[0] == 'C' and op[1] == 2:
+            op[3] = _canonical(op[3])
+
+    # build operations, sorted by type, order and power
+    rank = {'E': 0, 'C': 1, 'i': 2, 'S': 3, 'σ': 4}
+    keys = []
+    for op in ops:
+        if op[3] is None:
+            keys.append((rank[op[0]], 0, 0, 0, 0.0, 0.0, 0.0))
+            continue
+        parallel = 0 if principal is None or np.abs(np.abs(op[3] @ principal) - 1.0) < 1e-4 else 1
+        ax = -np.round(np.abs(op[3]), 4)
+        keys.append((rank[op[0]], -op[1], op[2], parallel, ax[2], ax[1], ax[0]))
+    order = sorted(range(len(ops)), key=lambda k: keys[k])
+
+    operations = [None] * len(ops)
+    # operations of the same type, order and power are numbered; mirror
+    # planes are numbered separately from the horizontal mirror plane
+    labelkeys = [keys[k][:4] if ops[k][0] == 'σ' else keys[k][:3] for k in range(len(ops))]
+    counts = {}
+    for key in labelkeys:
+        counts[key] = counts.get(key, 0) + 1
+    seen = {}
+    for k in order:
+        t, n, p, axis, angle = ops[k]
+        key = labelkeys[k]
+        seen[key] = seen.get(key, 0) + 1
+        suffix = ',%i' % seen[key] if counts[key] > 1 else ''
+        label = ('%i' % n if p == 1 else '%i^%i' % (n,p)) + suffix
+        if t == 'E':
+            operations[k] = Identity()
+        elif t == 'i':
+            operations[k] = Inversion()
+        elif t == 'C':
+            operations[k] = Rotation(label, axis, angle)
+        elif t == 'S':
+            operations[k] = ImproperRotation(label, axis, angle)
+        else:
+            # only horizontal mirror planes are labelled; distinguishing
+            # vertical from dihedral planes requires the class structure
+            label = ('h' if keys[k][3] == 0 else '') + suffix
+            operations[k] = Mirror(label, axis)
+
+    return operations, order
+
+def _canonical(axis):
+    """
+    Orient an axis such that its first significant component is positive
+    """
+    idx = np.flatnonzero(np.abs(axis) > 1e-4)[0]
+    return axis if axis[idx] > 0 else -axis
+
+def _get_label(operations):
+    """
+    Establish the point group label from a complete set of operations
+    """
+    rotations = [op for op in operations if isinstance(op, Rotation)]
+    improper = [op for op in operations if isinstance(op, ImproperRotation)]
+    mirrors = [op for op in operations if isinstance(op, Mirror)]
+    inversion = any(isinstance(op, Inversion) for op in operations)
+
+    if len(rotations) == 0:
+        if len(mirrors) > 0:
+            return 'Cs'
+        if inversion:
+            return 'Ci'
+        return 'C1'
+
+    orders = [_get_order(op.angle, len(operations)) for op in rotations]
+
+    # count the distinct axes of order 3 or higher
+    axes = [_canonical(op.axis) for op,n in zip(rotations, orders) if n >= 3]
+    distinct = []
+    for ax in axes:
+        if not any(np.abs(np.abs(ax @ d) - 1.0) < 1e-4 for d in distinct):
+            distinct.append(ax)
+
+    if len(distinct) > 1:
+        if 5 in orders:
+            return 'Ih' if inversion else 'I'
+        if 4 in orders:
+            return 'Oh' if inversion else 'O'
+        if inversion:
+            return 'Th'
+        return 'Td' if len(mirrors) > 0 else 'T'
+
+    # principal axis; for groups with only C2 axes, prefer an axis that
+    # coincides with an improper rotation axis
+    nmax = max(orders)
+    candidates = [op.axis for op,n in zip(rotations, orders) if n == nmax]
+    principal = candidates[0]
+    for ax in candidates:
+        if any(np.abs(np.abs(ax @ s.axis) - 1.0) < 1e-4 for s in improper):
+            principal = ax
+            break
+
+    nperp = len([op for op,n in zip(rotations, orders)
+                 if n == 2 and np.abs(op.axis @ principal) < 1e-4])
+    sigma_h = any(np.abs(np.abs(op.normal @ principal) - 1.0) < 1e-4 for op in mirrors)
+    nsigma_v = len([op for op in mirrors if np.abs(op.normal @ principal) < 1e-4])
+
+    if nperp == nmax:
+        if sigma_h:
+            return 'D%ih' % nmax
+        if nsigma_v == nmax:
+            return 'D%id' % nmax
+        return 'D%i' % nmax
+
+    if sigma_h:
+        return 'C%ih' % nmax
+    if nsigma_v == nmax:
+        return 'C%iv' % nmax
+    if len(improper) > 0:
+        return 'S%i' % (2 * nmax)
+
+    return 'C%i' % nmax
+
+def _get_order(angle, maxorder):
+    """
+    Get the order n of a rotation over an angle 2 pi k / n; the order
+    cannot exceed the order of the group
+    """
+    return Fraction(angle / (2.0 * np.pi)).limit_denominator(max(2, maxorder)).denominator
@@ -1,168 +1,314 @@
-# -*- coding: utf-8 -*-
-
-import numpy as np
-from collections import Counter
-import random
-import networkx as nx
-
-class ProjectionOperator:
-    
-    def __init__(self, ct, so, tolerance=1e-4):
-        #
-        # ToDo: assert that the objects have the right type
-        #
-        
-        self.ct = ct # character table
-        self.so = so # symmetry operations
-        self.groups = None
-        self.irreps = None
-        self.block_sizes = None
-        self.tolerance = tolerance
-        
-    def collect(self):
-        """
-        Construct groups of basis functions that can transform among each
-        other and figure out which irreps these span
-        """
-        # Create one logical matrix that shows which basis functions are allowed
-        # to mix with which other basis functions for any of the symmetry operations
-        # that are part of the group.
-        groupmatrix = np.zeros_like(self.so.operation_matrices[0], dtype=np.bool8)
-        for m in self.so.operation_matrices:
-            bm = np.abs(m) > self.tolerance
-            groupmatrix = np.logical_or(groupmatrix, bm)
-        
-        # Build a graph for all basis functions that can be transformed into
-        # each other
-        G = nx.Graph()
-        for i,row in enumerate(groupmatrix):
-            G.add_node(i)
-            if np.sum(row) > 1:
-                idx = np.where(row)[0]
-                for j in idx:
-                    G.add_edge(i,j)
-            
-        self.groups = [tuple(c) for c in nx.connected_components(G)]
-        print(self.groups)
-        
-    def build_mos(self, verbose=False):
-        # check if groups have been collected
-        if self.groups is None:
-            self.collect()
-        self.build_irreps()
-
-        # build molecular orbitals
-        self.mos = np.zeros((len(self.so.mol.basis), len(self.so.mol.basis)),
-                            dtype=np.float64)
-        mo_idx = 0
-        for g,irreplist in zip(self.groups,self.irreps): # loop over the groups
-        
-            bf_idx = 0
-        
-            if verbose:
-                print('Group: ', g)
-                print('       ', [self.so.mol.basis[i].name for i in g])
-                print('Irreps:')
-        
-            for j,irrep in enumerate(irreplist): # loop over irreps
-            
-                # early exit if there are no irreps of this type
-                if irrep == 0:
-                    continue
-                
-                if verbose:
-                    label = self.ct.get_label_irrep(j)
-                    print('  - %s: %i' % (label, irrep))
-                    
-                irrep_e = self.ct.get_character(j,0) # get dimensionality of irrep
-                irrepres = np.zeros((int(irrep * irrep_e), len(self.so.mol.basis)))
-                zero_modes = True
-
-                while zero_modes: # keep on looping until no zero eigenvalues are found
-                    bf_indices = random.sample(g, int(irrep * irrep_e))
-                    for k in range(int(irrep * irrep_e)): # loop over times the irrep is present
-                        #label = self.ct.get_label_irrep(j)
-                        res = self.apply_projection_operator(bf_indices[k], j)
-                        irrepres[k,:] = res
-                        bf_idx += 1
-                    
-                        S = irrepres @ irrepres.transpose()
-                        e,v = np.linalg.eigh(S)
-                    
-                        #print('Trying: ', e)
-                        zero_modes = np.any(np.abs(e) < 1e-2)
-                
-                # perform orthogonalization if the irrep space is larger than 1
-                if len(irrepres) > 1:
-                    S = irrepres @ irrepres.transpose()
-                    e,v = np.linalg.eigh(S)
-                    #print(e)
-                    
-                    # for symmetric orthogonalization:
-                    #    X = v @ np.diag(1.0 / np.sqrt(e)) @ v.transpose()
-                    #    irrepres = X @ irrepres
-                    # for canonical orthogonalization:
-                    #    X = v @ np.diag(1.0 / np.sqrt(e))
-                    #    irrepres = X.transpose() @ irrepres
-                    
-                    X = v @ np.diag(1.0 / np.sqrt(e))
-                    irrepres = X.transpose() @ irrepres
-                    
-                    for mo in irrepres:
-                        self.mos[mo_idx] = mo
-                        mo_idx += 1
-                else:
-                    self.mos[mo_idx] = irrepres[0,:]
-                    mo_idx += 1
-                     
-        return self.mos
-        
-    def build_irreps(self):
-        # Determine irreps per unique group.
-        self.irreps = []
-        self.irreplabels = []
-        self.block_sizes = []
-        self.blocks = []
-        for g in self.groups:
-            chars = [np.sum(np.take(np.diagonal(m),g)) for m in self.so.operation_matrices]
-            self.irreps.append(self.ct.lot(chars))
-            
-            for j,irrepdim in enumerate(self.irreps[-1]):
-                if irrepdim > 0:
-                    self.block_sizes.append(int(irrepdim * self.ct.chartablelib['symmetry_groups'][j]['characters'][0]))
-                    self.blocks.append((self.block_sizes[-1], irrepdim, self.ct.get_label_irrep(j)))
-                    
-    def apply_projection_operator(self, bf_idx, irrep_idx):
-        """
-        Apply the projection operator to a basis function
-        """
-        res = np.zeros(len(self.so.mol.basis))
-        for i,m in enumerate(self.so.operation_matrices):
-            res += self.ct.get_character(irrep_idx, i) * m[bf_idx,:]
-
-        # return result and normalize it
-        return np.array(res, dtype=np.float64) / np.linalg.norm(res)
-    
-    def get_block_sizes(self):
-        """
-        Get the block sizes of the block-diagonal matrix after the matrix
-        transformation in the MO basis
-        """
-        return self.block_sizes
-    
-    def get_blocks(self):
-        return self.blocks
-    
-    def check_transformation(self):
-        return
-        newmats = [self.mos @ m @ self.mos.transpose() for m in self.so.operation_matrices]
-        
-        idx = 0
-        for c in range(self.ct.nr_classes): # loop over classes
-            for m in range(self.ct.classes[c]['multiplicity']):
-                mat = newmats[idx]
-                
-                # check blocks for mat
-                idx2 = 0
-                
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from collections import Counter
+import random
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+class ProjectionOperator:
+    
+    def __init__(self, ct, so, tolerance=1e-4):
+        #
+        # ToDo: assert that the objects have the right type
+        #
+        
+        self.ct = ct # character table
+        self.so = so # symmetry operations
+        self.groups = None
+        self.irreps = None
+        self.block_sizes = None
+        self.tolerance = tolerance
+        
+    def collect(self):
+        """
+        Construct groups of basis functions that can transform among each
+        other and figure out which irreps these span
+        """
+        # Collect which basis functions are allowed to mix with which other
+        # basis functions for any of the symmetry operations that are part of
+        # the group. The couplings are read from the factorised operations,
+        # such that no dense operation matrices are required.
+        fo = self.so.factorised
+        nbf = fo.get_nbf()
+        rows = [np.arange(nbf)]
+        cols = [np.arange(nbf)]
+        for l in fo.lvals:
+            shells = fo.shells[l]
+            for k in range(len(fo)):
+                r,c,v = self.so.mol.basis.get_block_entries(shells,
+                                                            fo.target_shells[k,shells],
+                                                            fo.blocks[l][k])
+                mask = np.abs(v) > self.tolerance
+                rows.append(r[mask])
+                cols.append(c[mask])
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        
+        # Build a graph for all basis functions that can be transformed into
+        # each other and collect its connected components
+        G = coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(nbf, nbf))
+        nrgroups, labels = connected_components(G, directed=False)
+        order = np.argsort(labels, kind='stable')
+        groups = np.split(order, np.cumsum(np.bincount(labels, minlength=nrgroups))[:-1])
+            
+        self.groups = sorted([tuple(g.tolist()) for g in groups])
+        print(self.groups)
+        
+    def build_mos(self, verbose=False):
+        # check if groups have been collected
+        if self.groups is None:
+            self.collect()
+        self.build_irreps()
+
+        # build molecular orbitals
+        self.mos = np.zeros((len(self.so.mol.basis), len(self.so.mol.basis)),
+                            dtype=np.float64)
+        mo_idx = 0
+        for g,irreplist in zip(self.groups,self.irreps): # loop over the groups
+        
+            bf_idx = 0
+        
+            if verbose:
+                print('Group: ', g)
+                print('       ', [self.so.mol.basis[i].name for i in g])
+                print('Irreps:')
+        
+            for j,irrep in enumerate(irreplist): # loop over irreps
+            
+                # early exit if there are no irreps of this type
+                if irrep == 0:
+                    continue
+                
+                if verbose:
+                    label = self.ct.get_label_irrep(j)
+                    print('  - %s: %i' % (label, irrep))
+                    
+                irrep_e = self.ct.get_character(j,0) # get dimensionality of irrep
+                irrepres = np.zeros((int(irrep * irrep_e), len(self.so.mol.basis)))
+                zero_modes = True
+
+                while zero_modes: # keep on looping until no zero eigenvalues are found
+                    bf_indices = random.sample(g, int(irrep * irrep_e))
+                    for k in range(int(irrep * irrep_e)): # loop over times the irrep is present
+                        #label = self.ct.get_label_irrep(j)
+                        res = self.apply_projection_operator(bf_indices[k], j)
+                        irrepres[k,:] = res
+                        bf_idx += 1
+                    
+                        S = irrepres @ irrepres.transpose()
+                        e,v = np.linalg.eigh(S)
+                    
+                        #print('Trying: ', e)
+                        zero_modes = np.any(np.abs(e) < 1e-2)
+                
+                # perform orthogonalization if the irrep space is larger than 1
+                if len(irrepres) > 1:
+                    S = irrepres @ irrepres.transpose()
+                    e,v = np.linalg.eigh(S)
+                    #print(e)
+                    
+                    # for symmetric orthogonalization:
+                    #    X = v @ np.diag(1.0 / np.sqrt(e)) @ v.transpose()
+                    #    irrepres = X @ irrepres
+                    # for canonical orthogonalization:
+                    #    X = v @ np.diag(1.0 / np.sqrt(e))
+                    #    irrepres = X.transpose() @ irrepres
+                    
+                    X = v @ np.diag(1.0 / np.sqrt(e))
+                    irrepres = X.transpose() @ irrepres
+                    
+                    for mo in irrepres:
+                        self.mos[mo_idx] = mo
+                        mo_idx += 1
+                else:
+                    self.mos[mo_idx] = irrepres[0,:]
+                    mo_idx += 1
+                     
+        return self.mos
+        
+    def build_irreps(self):
+        # Determine irreps per unique group.
+        self.irreplabels = []
+        self.block_sizes = []
+        self.blocks = []
+        self.classes = self.so.get_class_indices(self.ct)
+        diagonals = self.so.factorised.diagonals()
+        chars = np.array([np.sum(diagonals[:,g], axis=1) for g in self.groups]).reshape(-1, len(diagonals))
+        self.irreps = list(self.ct.lot(chars, self.classes))
+        for irreps in self.irreps:
+            for j,irrepdim in enumerate(irreps):
+                if irrepdim > 0:
+                    self.block_sizes.append(int(irrepdim * self.ct.chartablelib['symmetry_groups'][j]['characters'][0]))
+                    self.blocks.append((self.block_sizes[-1], irrepdim, self.ct.get_label_irrep(j)))
+                    
+    def apply_projection_operator(self, bf_idx, irrep_idx):
+        """
+        Apply the projection operator to a basis function
+        """
+        chars = self.ct.table[irrep_idx, self.classes]
+        res = self.so.factorised.weighted_row(bf_idx, chars)
+
+        # return result and normalize it
+        return np.array(res, dtype=np.float64) / np.linalg.norm(res)
+    
+    def build_salcs(self, tolerance=1e-12):
+        """
+        Build the symmetry-adapted linear combinations per orbit of
+        symmetry-equivalent shells
+        
+        The basis functions of a shell only mix with those of the shells it
+        is mapped onto, i.e. with the shells of the same type on the
+        symmetry-equivalent atoms. For each such orbit of shells, the
+        number of times each irrep occurs follows from the characters of
+        the induced representation (only shells left in place contribute).
+        The SALCs of each irrep are obtained from the projection operator
+        in the small subspace of the orbit and are scattered into a sparse
+        matrix, such that no nbf x nbf dense matrix is ever constructed.
+        
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            (nbf,nbf) matrix holding the SALCs as rows, ordered per orbit of
+            shells and per irrep
+        """
+        fo = self.so.factorised
+        basis = self.so.mol.basis
+        nshells = basis.get_nr_shells()
+        if np.any(np.bincount(basis.shell, minlength=nshells) != 2 * basis.shell_l + 1):
+            raise RuntimeError('Building SALCs per orbit requires complete shells')
+        
+        self.classes = self.so.get_class_indices(self.ct)
+        self.irreps = []
+        self.block_sizes = []
+        self.blocks = []
+        rows, cols, vals = [], [], []
+        visited = np.zeros(nshells, dtype=bool)
+        nrsalcs = 0
+        for seed in range(nshells):
+            if visited[seed]:
+                continue
+            
+            # orbit of shells and the induced representation on it
+            shells = np.unique(fo.target_shells[:,seed])
+            visited[shells] = True
+            l = basis.shell_l[seed]
+            m = len(shells)
+            nm = 2*l+1
+            pos = -np.ones(nshells, dtype=np.int64)
+            pos[shells] = np.arange(m)
+            targets = pos[fo.target_shells[:,shells]]
+            blocks = fo.blocks[l]
+            
+            chars = np.sum(targets == np.arange(m), axis=1) * np.trace(blocks, axis1=1, axis2=2)
+            irreps = self.ct.lot(chars, self.classes)
+            self.irreps.append(irreps)
+            
+            # slots of the orbit and the basis functions they refer to
+            bfs = basis.slot_bf[(basis.shell_slot_offset[shells][:,None] + np.arange(nm)).reshape(-1)]
+            
+            for j,irrep in enumerate(irreps):
+                if irrep == 0:
+                    continue
+                
+                # projection operator in the subspace of the orbit; operation
+                # k couples shell a to shell targets[k,a] via block k
+                weights = self.ct.table[j, self.classes]
+                dim = self.ct.table[j,0]
+                P = np.zeros((m, m, nm, nm))
+                np.add.at(P, (np.tile(np.arange(m), len(fo)), targets.reshape(-1)),
+                          np.repeat(weights[:,None,None] * blocks, m, axis=0))
+                P = P.transpose(0,2,1,3).reshape(m*nm, m*nm) * dim / self.ct.order / self.ct.norms[j]
+                
+                e,v = np.linalg.eigh(0.5 * (P + P.transpose()))
+                salcs = v[:,e > 0.5].transpose()
+                if len(salcs) != int(irrep * dim):
+                    raise RuntimeError('Projection onto irrep %s yields %i instead of %i functions' %
+                                       (self.ct.get_label_irrep(j), len(salcs), int(irrep * dim)))
+                
+                r,c = np.nonzero(np.abs(salcs) > tolerance)
+                rows.append(r + nrsalcs)
+                cols.append(bfs[c])
+                vals.append(salcs[r,c])
+                nrsalcs += len(salcs)
+                
+                self.block_sizes.append(len(salcs))
+                self.blocks.append((len(salcs), irrep, self.ct.get_label_irrep(j)))
+        
+        nbf = len(basis)
+        self.salcs = csr_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                                shape=(nbf, nbf))
+        
+        return self.salcs
+    
+    def save(self, path):
+        """
+        Store the irreps, blocks and orbitals in a directory of .npy files
+        with a JSON manifest
+        """
+        from .storage import write_arrays
+        
+        arrays = {'irreps': np.array(self.irreps)}
+        if getattr(self, 'classes', None) is not None:
+            arrays['classes'] = self.classes
+        if getattr(self, 'mos', None) is not None:
+            arrays['mos'] = self.mos
+        if getattr(self, 'salcs', None) is not None:
+            arrays['salcs_data'] = self.salcs.data
+            arrays['salcs_indices'] = self.salcs.indices
+            arrays['salcs_indptr'] = self.salcs.indptr
+        
+        manifest = {
+            'type': 'ProjectionOperator',
+            'character_table': self.ct.chartablelib['name'],
+            'groups': [list(g) for g in self.groups] if self.groups is not None else None,
+            'block_sizes': [int(b) for b in self.block_sizes],
+            'blocks': [[int(b[0]), float(b[1]), b[2]] for b in self.blocks],
+        }
+        write_arrays(path, arrays, manifest)
+    
+    def restore(self, path, mmap=False):
+        """
+        Restore the irreps, blocks and orbitals from a directory written by
+        save()
+        """
+        from .storage import read_arrays
+        
+        arrays, manifest = read_arrays(path, mmap)
+        if manifest['character_table'] != self.ct.chartablelib['name']:
+            raise RuntimeError('Stored results in %s belong to character table %s' % (path, manifest['character_table']))
+        
+        self.groups = [tuple(g) for g in manifest['groups']] if manifest['groups'] is not None else None
+        self.irreps = list(arrays['irreps'])
+        self.block_sizes = manifest['block_sizes']
+        self.blocks = [tuple(b) for b in manifest['blocks']]
+        self.classes = arrays.get('classes')
+        self.mos = arrays.get('mos')
+        if 'salcs_data' in arrays:
+            nbf = len(self.so.mol.basis)
+            self.salcs = csr_matrix((arrays['salcs_data'], arrays['salcs_indices'], arrays['salcs_indptr']),
+                                    shape=(nbf, nbf))
+    
+    def get_block_sizes(self):
+        """
+        Get the block sizes of the block-diagonal matrix after the matrix
+        transformation in the MO basis
+        """
+        return self.block_sizes
+    
+    def get_blocks(self):
+        return self.blocks
+    
+    def check_transformation(self):
+        return
+        newmats = [self.mos @ m @ self.mos.transpose() for m in self.so.operation_matrices]
+        
+        idx = 0
+        for c in range(self.ct.nr_classes): # loop over classes
+            for m in range(self.ct.classes[c]['multiplicity']):
+                mat = newmats[idx]
+                
+                # check blocks for mat
+                idx2 = 0
+                
                 idx += 1
\ No newline at end of file
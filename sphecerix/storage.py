@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+
+FORMAT_VERSION = 1
+
+def write_arrays(path, arrays, manifest):
+    """
+    Write a series of arrays as .npy files to a directory, together with a
+    JSON manifest
+
+    The directory is first written under a temporary name and then moved
+    into place, such that readers never encounter an incomplete result.
+
+    Parameters
+    ----------
+    path : str
+        Directory to write to; an existing directory is replaced
+    arrays : dict
+        Mapping of names onto numpy arrays
+    manifest : dict
+        JSON-serializable metadata
+    """
+    path = os.path.abspath(path)
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmpdir = tempfile.mkdtemp(prefix='.tmp-', dir=parent)
+    try:
+        for name,arr in arrays.items():
+            np.save(os.path.join(tmpdir, name + '.npy'), np.asarray(arr), allow_pickle=False)
+
+        manifest = dict(manifest)
+        manifest['version'] = FORMAT_VERSION
+        manifest['arrays'] = sorted(arrays.keys())
+        with open(os.path.join(tmpdir, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, indent=1)
+
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.replace(tmpdir, path)
+    except BaseException:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        raise
+
+def read_arrays(path, mmap=False):
+    """
+    Read a directory written by write_arrays
+
+    Parameters
+    ----------
+    path : str
+        Directory to read from
+    mmap : bool
+        Whether to memory-map the arrays (read-only) instead of reading them
+
+    Returns
+    -------
+    dict
+        Mapping of names onto numpy arrays
+    dict
+        Manifest
+    """
+    with open(os.path.join(path, 'manifest.json'), 'r') as f:
+        manifest = json.load(f)
+
+    if manifest.get('version') != FORMAT_VERSION:
+        raise RuntimeError('Unsupported format version %s in %s (expected %i)' %
+                           (manifest.get('version'), path, FORMAT_VERSION))
+
+    arrays = {name: np.load(os.path.join(path, name + '.npy'),
+                            mmap_mode='r' if mmap else None, allow_pickle=False)
+              for name in manifest['arrays']}
+
+    return arrays, manifest
+
+def operation_to_dict(op):
+    """
+    Describe an operation by a JSON-serializable dictionary
+    """
+    from .symmetry_operations import Identity, Inversion, Rotation, Mirror, \
+                                     ImproperRotation
+
+    if isinstance(op, Identity):
+        d = {'type': 'identity'}
+    elif isinstance(op, Inversion):
+        d = {'type': 'inversion'}
+    elif isinstance(op, Rotation):
+        d = {'type': 'rotation', 'label': op.name[1:],
+             'vec': op.axis.tolist(), 'angle': float(op.angle)}
+    elif isinstance(op, ImproperRotation):
+        d = {'type': 'improper', 'label': op.name[1:],
+             'vec': op.axis.tolist(), 'angle': float(op.angle)}
+    elif isinstance(op, Mirror):
+        d = {'type': 'mirror', 'label': op.name[1:],
+             'vec': np.asarray(op.normal).tolist()}
+    else:
+        raise RuntimeError('Cannot store operation of type %s' % type(op).__name__)
+
+    if np.any(op.get_translation() != 0.0):
+        d['translation'] = op.get_translation().tolist()
+
+    return d
+
+def hash_symmetry(mol, operations, decimals=6):
+    """
+    Build a hash of the canonicalised geometry, the basis set and the list
+    of operations
+
+    Positions and operation matrices are rounded, such that numerically
+    insignificant differences do not alter the hash.
+
+    Raises
+    ------
+    RuntimeError
+        If the molecule has no basis set
+    """
+    if mol.basis is None:
+        raise RuntimeError('The molecule has no basis set; build it via Molecule.build_basis() first')
+
+    h = hashlib.sha256()
+    h.update(json.dumps([mol.symbols[e] for e in mol.elements]).encode())
+    h.update((np.round(mol.positions, decimals) + 0.0).tobytes())
+    if mol.cell is not None:
+        h.update((np.round(mol.cell, decimals) + 0.0).tobytes())
+
+    basis = mol.basis
+    for arr in (basis.n, basis.l, basis.m, basis.atomid, basis.shell):
+        h.update(np.ascontiguousarray(arr, dtype=np.int64).tobytes())
+
+    matrices = np.array([op.get_matrix() for op in operations]).reshape(-1,3,3)
+    translations = np.array([op.get_translation() for op in operations]).reshape(-1,3)
+    h.update(json.dumps([op.name for op in operations]).encode())
+    h.update((np.round(matrices, decimals) + 0.0).tobytes())
+    if np.any(translations != 0.0):
+        h.update((np.round(translations, decimals) + 0.0).tobytes())
+
+    return h.hexdigest()
+
+class SymmetryCache:
+    """
+    Directory holding the results of symmetry analyses, keyed by a hash of
+    the geometry, the basis set and the operations
+
+    The total size of the cache is bounded; when it is exceeded, the least
+    recently used entries are removed.
+    """
+    def __init__(self, directory, maxsize=2**30, mmap=False):
+        self.directory = directory
+        self.maxsize = maxsize  # maximum size in bytes
+        self.mmap = mmap        # memory-map arrays when loading
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, symops):
+        """
+        Get the cache key of a set of symmetry operations
+        """
+        return hash_symmetry(symops.mol, symops.operations)
+
+    def run(self, symops, dense=True):
+        """
+        Run the symmetry operations, loading the results from the cache
+        when available and storing them otherwise
+        """
+        path = os.path.join(self.directory, self.get_key(symops), 'symops')
+        if os.path.isdir(path):
+            symops.restore(path, dense=dense, mmap=self.mmap)
+            self.__touch(path)
+        else:
+            symops.run(dense=dense)
+            symops.save(path)
+            self.evict()
+
+        return symops
+
+    def build_mos(self, po):
+        """
+        Build the molecular orbitals of a projection operator, loading the
+        results from the cache when available and storing them otherwise
+        """
+        path = os.path.join(self.directory, self.get_key(po.so),
+                            'mos-%s' % po.ct.chartablelib['name'])
+        if os.path.isdir(path):
+            po.restore(path, mmap=self.mmap)
+            self.__touch(path)
+        else:
+            po.build_mos()
+            po.save(path)
+            self.evict()
+
+        return po.mos
+
+    def get_size(self):
+        """
+        Get the total size (in bytes) of all entries
+        """
+        return sum(size for _,size,_ in self.__get_entries())
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the total size is
+        within bounds
+        """
+        entries = sorted(self.__get_entries(), key=lambda e: e[2])
+        total = sum(size for _,size,_ in entries)
+        for path,size,_ in entries:
+            if total <= self.maxsize:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """
+        Remove all entries
+        """
+        for path,_,_ in self.__get_entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def __get_entries(self):
+        """
+        Collect the (path, size, last access time) of all entries
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith('.') or not os.path.isdir(path):
+                continue
+            size = 0
+            atime = 0.0
+            for root,_,files in os.walk(path):
+                for fname in files:
+                    st = os.stat(os.path.join(root, fname))
+                    size += st.st_size
+                    if fname == 'manifest.json':
+                        atime = max(atime, st.st_mtime)
+            entries.append((path, size, atime))
+
+        return entries
+
+    def __touch(self, path):
+        """
+        Mark an entry as recently used
+        """
+        now = time.time()
+        os.utime(os.path.join(path, 'manifest.json'), (now, now))
@@ -1,157 +1,1019 @@
-import numpy as np
-from scipy.spatial.transform import Rotation as R
-from . import tesseral_wigner_D, tesseral_wigner_D_mirror, tesseral_wigner_D_improper
-
-class SymmetryOperations:
-    """
-    Class containing all symmetry operations as applied to molecule object
-    """ 
-    def __init__(self, mol):
-        self.mol = mol
-        self.operations = []
-        
-        # build atoms matrix
-        self.positions = np.zeros((len(self.mol.atoms), 3))
-        for i,atom in enumerate(self.mol.atoms):
-            self.positions[i,:] = atom[1]
-        
-    def add(self, name, label = None, vec = None, angle = None):
-        # ensure vector is of float type
-        if vec is not None:
-            vec = np.array(vec, dtype=np.float64)
-        
-        if name == 'identity':
-            self.operations.append(Identity())
-        elif name == 'rotation':
-            self.operations.append(Rotation(label, vec, angle))
-        elif name == 'mirror':
-            self.operations.append(Mirror(label, vec))
-        elif name == 'improper':
-            self.operations.append(ImproperRotation(label, vec, angle))
-        elif name == 'inversion':
-            self.operations.append(Inversion())
-        else:
-            raise Exception('Unknown operation: %s' % name)
-    
-    def run(self):
-        N = len(self.mol.atoms)   # number of atoms
-        nbf = len(self.mol.basis) # number of basis functions
-        self.atomic_transformations = np.zeros((len(self.operations),N), dtype=np.uint64)
-        self.basis_function_transformations = np.zeros((len(self.mol.basis), N, N))
-        
-        # assert atomic operations
-        for k,operation in enumerate(self.operations):
-            tpos = self.positions @ operation.get_matrix()
-            
-            for i,p in enumerate(self.positions):
-                for j,t in enumerate(tpos):
-                    r = t-p
-                    if np.sum(r**2) < 1e-5:
-                        self.atomic_transformations[k,i] = j
-        
-        # cache on which atoms basis functions are located
-        bfindices = -np.ones((N, 5, 3, 7), dtype=np.int64) # encode all possibilities up to 5f-orbitals
-        for i,bf in enumerate(self.mol.basis):
-            bfindices[bf.atomid, bf.n, bf.l, bf.m+bf.l] = i
-        
-        # assert basis function operations
-        self.operation_matrices = np.zeros((len(self.operations), nbf, nbf))
-        for k,operation in enumerate(self.operations):
-            for i,bf in enumerate(self.mol.basis):
-                # establish on which atom id the basis function lands
-                atomid = self.atomic_transformations[k,bf.atomid]
-                
-                # establish tesseral transformation
-                mvec = np.zeros(2*bf.l+1)
-                mvec[bf.m + bf.l] = 1
-                mres = operation.get_wigner_matrix(bf.l).dot(mvec)
-                
-                for m,v in enumerate(mres):
-                    idx = bfindices[atomid, bf.n, bf.l, m]
-                    if idx == -1:
-                        continue
-                    self.operation_matrices[k,i,idx] = v
-
-class Operation:
-    """
-    Base operation class
-    """
-    def __init__(self, name):
-        self.name = name
-        
-    def set_atomic_id(self, idx):
-        self.atomid = idx
-
-class Identity(Operation):
-    """
-    Identity operation "E"
-    """
-    def __init__(self):
-        super().__init__('E')
-
-    def get_matrix(self):
-        return np.identity(3)
-    
-    def get_wigner_matrix(self, l):
-        return np.identity(2*l+1)
-    
-class Inversion(Operation):
-    """
-    Identity operation "i"
-    """
-    def __init__(self):
-        super().__init__('i')
-
-    def get_matrix(self):
-        return -np.identity(3)
-    
-    def get_wigner_matrix(self, l):
-        return np.identity(2*l+1) * (-1)**l
-
-class Rotation(Operation):
-    """
-    Rotation operation "C"
-    """
-    def __init__(self, label, axis, angle):
-        super().__init__('C' + label)
-        self.axis = axis / np.linalg.norm(axis)
-        self.angle = angle
-        self.robj = R.from_rotvec(self.axis * self.angle)
-        
-    def get_matrix(self):
-        return self.robj.as_matrix()
-    
-    def get_wigner_matrix(self, l):
-        return tesseral_wigner_D(l, self.robj)
-        
-class Mirror(Operation):
-    """
-    Rotation operation "σ"
-    """
-    def __init__(self, label, normal):
-        super().__init__('σ' + label)
-        self.normal = normal
-        
-    def get_matrix(self):
-        return np.identity(3) - 2 * np.outer(self.normal, self.normal)
-    
-    def get_wigner_matrix(self, l):
-        return tesseral_wigner_D_mirror(l, self.normal)
-        
-class ImproperRotation(Operation):
-    """
-    Rotation operation "S"
-    """
-    def __init__(self, label, axis, angle):
-        super().__init__('S' + label)
-        self.axis = axis / np.linalg.norm(axis)
-        self.angle = angle
-        self.robj = R.from_rotvec(self.axis * self.angle)
-        
-    def get_matrix(self):
-        M = np.identity(3) - 2 * np.outer(self.axis, self.axis)
-        R = self.robj.as_matrix()
-        return M @ R
-    
-    def get_wigner_matrix(self, l):
-        return tesseral_wigner_D_improper(l, self.robj)
\ No newline at end of file
+import numpy as np
+from scipy.spatial.transform import Rotation as R
+from scipy.spatial import cKDTree
+from . import tesseral_wigner_D, tesseral_wigner_D_mirror, tesseral_wigner_D_improper
+from .factorised_operations import FactorisedOperations, OperationMatrices
+from .group import quantise_matrices, multiplication_table, common_centre, \
+                   generate_group, operation_axes, \
+                   conjugacy_classes, class_constants, atom_orbits, stabilisers
+
+class SymmetryOperations:
+    """
+    Class containing all symmetry operations as applied to molecule object
+    """ 
+    def __init__(self, mol, lazy=False, cache=False):
+        self.mol = mol
+        self.operations = []
+        self.lazy = lazy    # construct operation matrices on access
+        self.cache = cache  # keep lazily constructed matrices in memory
+        self.products = None    # (K,2) array; operation k is the product of
+                                # operations products[k] (or -1 if evaluated
+                                # directly)
+        
+        # state of the previous call to run(), used to only process the
+        # operations and shells that were added since
+        self.__processed = []       # operations that have been processed
+        self.__positions = None     # positions used for matching the atoms
+        self.__cell = None          # unit cell used for matching the atoms
+        self.__basis = None         # basis set used for the representation
+        self.__permutations = None  # buffer holding the atom permutations
+        self.__blocks = {}          # buffers holding the blocks per l
+        self.__dense = None         # buffer holding the dense matrices
+        self.__dense_shm = None     # shared memory backing this buffer
+        self.__nrdense = 0          # number of valid dense matrices
+        
+    @property
+    def positions(self):
+        """
+        Atomic positions of the molecule; refers directly to the position
+        array of the molecule without copying
+        """
+        return self.mol.positions
+        
+    def add(self, name, label = None, vec = None, angle = None, translation = None):
+        self.operations.append(self.__build_operation(name, label, vec, angle, translation))
+        if self.products is not None:
+            self.products = np.vstack([self.products, [[-1,-1]]])
+    
+    def add_generators(self, generators, tol=1e-5):
+        """
+        Add all operations of the group generated by a series of operations
+        
+        The group is closed under multiplication of the 3x3 matrices of the
+        generators (and of any operations that were already added). Only
+        the generators are represented via Wigner-D matrices; the
+        representations of all other operations are built in run() from
+        products of the factorised representations. The operations may
+        carry a translation provided that they act about a common centre
+        (as those found by detect()); the generated operations then act
+        about the same centre.
+        
+        Parameters
+        ----------
+        generators : list
+            Operation objects or tuples holding the arguments of add(), e.g.
+            ('rotation', '5', axis, 2.0 * np.pi / 5)
+        tol : float
+            Tolerance used for identifying identical matrices
+        """
+        from .point_group import classify_operations
+        
+        operations = list(self.operations)
+        for g in generators:
+            operations.append(g if isinstance(g, Operation) else self.__build_operation(*g))
+        
+        # the operations should act about a common centre, which is then
+        # shared by all generated operations
+        centre = common_centre(np.array([op.get_matrix() for op in operations]).reshape(-1,3,3),
+                               np.array([op.get_translation() for op in operations]).reshape(-1,3))
+        
+        matrices, products = generate_group(np.array([op.get_matrix() for op in operations]).reshape(-1,3,3), tol)
+        
+        # operations not given explicitly are classified from their matrix;
+        # those given explicitly are kept and evaluated directly
+        classified, order = classify_operations(matrices)
+        keys = quantise_matrices(matrices, tol)
+        explicit = {}
+        for op,key in zip(operations, quantise_matrices(np.array([op.get_matrix() for op in operations]).reshape(-1,3,3), tol)):
+            explicit.setdefault(key.tobytes(), op)
+        newops = []
+        for k,key in enumerate(keys):
+            if key.tobytes() in explicit:
+                newops.append(explicit[key.tobytes()])
+                products[k] = -1
+            else:
+                newops.append(classified[k])
+                if np.any(centre != 0.0):
+                    newops[-1].set_translation(centre - matrices[k] @ centre)
+        
+        # list the operations by type, order and power
+        order = np.array(order, dtype=np.int64)
+        inv = np.argsort(order)
+        self.operations = [newops[k] for k in order]
+        products = products[order]
+        self.products = np.where(products >= 0, inv[np.maximum(products, 0)], -1)
+        self.multiplication_table = self.get_multiplication_table()
+    
+    @staticmethod
+    def __build_operation(name, label = None, vec = None, angle = None, translation = None):
+        # ensure vector is of float type
+        if vec is not None:
+            vec = np.array(vec, dtype=np.float64)
+        
+        if name == 'identity':
+            op = Identity()
+        elif name == 'rotation':
+            op = Rotation(label, vec, angle)
+        elif name == 'mirror':
+            op = Mirror(label, vec)
+        elif name == 'improper':
+            op = ImproperRotation(label, vec, angle)
+        elif name == 'inversion':
+            op = Inversion()
+        else:
+            raise Exception('Unknown operation: %s' % name)
+        
+        if translation is not None:
+            op.set_translation(translation)
+        
+        return op
+    
+    @classmethod
+    def detect(cls, mol, tol=np.sqrt(1e-5)):
+        """
+        Detect the symmetry operations and point group of a molecule
+        
+        The operations act about the centroid c of the molecule: when c is
+        not at the origin, these are affine operations x -> Mx + (c - Mc).
+        All functions consuming operations accept such translations (see
+        common_centre()), while point operations about the origin follow
+        from dropping the translations.
+        
+        Parameters
+        ----------
+        mol : Molecule
+            Molecule object
+        tol : float
+            Maximum distance between a transformed atom and its image
+        
+        Returns
+        -------
+        SymmetryOperations
+            Object holding all symmetry operations of the molecule
+        str
+            Point group label (Schoenflies notation)
+        str or None
+            Name of the matching character table, if available
+        """
+        from .point_group import detect_point_group
+        from .character_table import CharacterTable
+        
+        if mol.is_periodic():
+            raise RuntimeError('Point group detection is not supported for periodic molecules')
+        
+        operations, perms, label = detect_point_group(mol.positions, mol.elements, tol)
+        symops = cls(mol)
+        symops.operations = operations
+        symops.atomic_transformations = perms
+        
+        ctname = label.lower() if CharacterTable.exists(label.lower()) else None
+        
+        return symops, label, ctname
+    
+    def get_matrices(self):
+        """
+        Get the 3x3 matrices of all operations as a (K,3,3) array
+        """
+        return np.array([op.get_matrix() for op in self.operations]).reshape(-1,3,3)
+    
+    def get_translations(self):
+        """
+        Get the (Cartesian) translations of all operations as a (K,3) array
+        """
+        return np.array([op.get_translation() for op in self.operations]).reshape(-1,3)
+    
+    def get_multiplication_table(self, tol=1e-4):
+        """
+        Build the multiplication table of the operations as a (K,K) integer
+        array; entry [a,b] is the index of the operation whose matrix equals
+        the product of the matrices of operations a and b
+        """
+        return multiplication_table(self.get_matrices(), tol)
+    
+    def get_conjugacy_classes(self, tol=1e-4):
+        """
+        Partition the operations into conjugacy classes
+        
+        Returns
+        -------
+        numpy.ndarray
+            (K,) integer array holding the class of every operation; classes
+            are numbered in order of first appearance
+        """
+        return conjugacy_classes(self.get_multiplication_table(tol))
+    
+    def get_class_indices(self, ct, tol=1e-4, keep_order=True):
+        """
+        Establish to which class of a character table every operation
+        belongs, such that the operations can be listed in any order
+        
+        When the operations are listed in the class order of the character
+        table, i.e. the first operations form the first class and so on,
+        and this order is consistent with the class sizes, the kind of
+        operations and the class multiplication coefficients, the order is
+        kept as given.
+        
+        Otherwise, the conjugacy classes of the operations are matched to
+        the classes of the character table by their size, by whether they
+        are proper or improper and by the trace of their 3x3 matrices.
+        Classes that cannot be distinguished this way (e.g. C2' and C2'' or
+        the C2(x), C2(y) and C2(z) classes of D2h) are assigned such that
+        the assignment is consistent with the class multiplication
+        coefficients and, as far as possible, with the axes annotated in
+        the class symbols (see CharacterTable.get_class_axes). If several
+        assignments remain that yield different characters, the assignment
+        is ambiguous (typically, the molecule is not in the standard
+        orientation) and an error is raised.
+        
+        Parameters
+        ----------
+        ct : CharacterTable
+            Character table
+        tol : float
+            Tolerance used for identifying identical matrices
+        keep_order : bool
+            Whether to keep the order of operations listed in the class
+            order of the character table; when False, the classes are
+            always assigned from their signatures and axes
+        
+        Returns
+        -------
+        numpy.ndarray
+            (K,) integer array holding the index of the class in the
+            character table of every operation
+        
+        Raises
+        ------
+        RuntimeError
+            If the operations do not match the character table or if the
+            assignment of the classes is ambiguous
+        """
+        mt = self.get_multiplication_table(tol)
+        labels = conjugacy_classes(mt)
+        nrclasses = labels.max() + 1
+        sizes = np.bincount(labels)
+        
+        # signature of every class: size, proper/improper and trace
+        matrices = self.get_matrices()
+        mats = matrices[np.unique(labels, return_index=True)[1]]
+        signatures = [(int(size), bool(det < 0), np.round(trace, 4) + 0.0) for size,det,trace in
+                      zip(sizes, np.linalg.det(mats), np.trace(mats, axis1=1, axis2=2))]
+        ctsignatures = [(int(c['multiplicity']), improper, np.round(trace, 4) + 0.0) for c,(improper,trace) in
+                        zip(ct.chartablelib['classes'], ct.get_class_signatures())]
+        
+        if len(mt) != ct.order or nrclasses != ct.nrclasses or \
+           sorted(signatures) != sorted(ctsignatures):
+            raise RuntimeError('Operations do not match the classes of character table %s' % ct.chartablelib['name'])
+        
+        constants = class_constants(mt, labels)
+        ctconstants = ct.get_class_constants()
+        
+        # operations listed in the class order of the character table
+        if keep_order:
+            positional = np.repeat(np.arange(ct.nrclasses), ct.sizes)
+            assignment = np.zeros(nrclasses, dtype=np.int64)
+            assignment[labels] = positional
+            if np.array_equal(assignment[labels], positional) and \
+               len(np.unique(assignment)) == nrclasses and \
+               all(signatures[i] == ctsignatures[assignment[i]] for i in range(nrclasses)) and \
+               np.allclose(ctconstants[np.ix_(assignment, assignment, assignment)], constants, atol=1e-6):
+                return positional
+        
+        # hits[i,j]: whether class i holds an operation along the axis
+        # annotated for class j of the character table
+        axes = operation_axes(matrices)
+        hits = np.zeros((nrclasses, ct.nrclasses), dtype=bool)
+        for j,axis in enumerate(ct.get_class_axes()):
+            if axis is not None:
+                aligned = np.abs(axes @ axis) > 1.0 - 1e-4
+                hits[:,j] = np.bincount(labels, weights=aligned, minlength=nrclasses) > 0
+            else:
+                hits[:,j] = True
+        
+        # classes sharing a signature are interchangeable when the character
+        # columns of their candidate classes are identical (e.g. C_n^k and
+        # C_n^(n-k)); these are assigned in order at the end and left out
+        # of the consistency checks, only the others need to be resolved
+        assignment = np.full(nrclasses, -1, dtype=np.int64)
+        interchangeable = []
+        pending = []
+        for sig in sorted(set(signatures)):
+            classes = np.array([i for i in range(nrclasses) if signatures[i] == sig])
+            targets = np.array([j for j in range(ct.nrclasses) if ctsignatures[j] == sig])
+            columns = np.unique(np.round(ct.table[:,targets], 6), axis=1, return_inverse=True)[1].reshape(-1)
+            if len(classes) == 1:
+                assignment[classes] = targets
+            elif np.all(columns == columns[0]):
+                interchangeable.append((classes, targets))
+            else:
+                pending.append((classes, targets, columns))
+        
+        # resolve one set of classes at a time, revisiting the ambiguous
+        # ones as long as resolving others narrows them down
+        while len(pending) > 0:
+            unresolved = []
+            for classes, targets, columns in pending:
+                resolved = _assign_classes(classes, targets, columns, hits, assignment,
+                                           constants, ctconstants)
+                if resolved is None:
+                    unresolved.append((classes, targets, columns))
+                else:
+                    assignment[classes] = resolved
+            if len(unresolved) == len(pending):
+                raise RuntimeError('Ambiguous class assignment for character table %s; orient the molecule '
+                                   'such that its axes match those of the character table' % ct.chartablelib['name'])
+            pending = unresolved
+        
+        fixed = np.flatnonzero(assignment >= 0)
+        if not np.allclose(ctconstants[np.ix_(assignment[fixed], assignment[fixed], assignment[fixed])],
+                           constants[np.ix_(fixed, fixed, fixed)], atol=1e-6):
+            raise RuntimeError('Could not establish a consistent class assignment for character table %s' % ct.chartablelib['name'])
+        for classes, targets in interchangeable:
+            assignment[classes] = targets
+        
+        return assignment[labels]
+    
+    def sort_by_classes(self, ct, tol=1e-4):
+        """
+        Reorder the operations such that they follow the class order of a
+        character table; should be called before run()
+        """
+        indices = self.get_class_indices(ct, tol)
+        order = np.argsort(indices, kind='stable')
+        inv = np.argsort(order)
+        
+        self.operations = [self.operations[k] for k in order]
+        if self.products is not None:
+            products = self.products[order]
+            self.products = np.where(products >= 0, inv[np.maximum(products, 0)], -1)
+        if getattr(self, 'atomic_transformations', None) is not None and \
+           len(self.atomic_transformations) == len(order):
+            self.atomic_transformations = self.atomic_transformations[order]
+        if getattr(self, 'multiplication_table', None) is not None:
+            self.multiplication_table = self.get_multiplication_table(tol)
+    
+    def run(self, dense=True, workers=None):
+        """
+        Establish the representation of the operations in the basis set
+        
+        The operations are always stored in factorised form (see
+        FactorisedOperations); when dense is set, the operation matrices are
+        exposed via operation_matrices as well. In lazy mode, this is a
+        sequence constructing the matrices on access; otherwise, the full
+        (K,nbf,nbf) tensor is built.
+        
+        Repeated calls are incremental: when operations have been appended
+        or the basis set has been replaced since the previous call, only the
+        atom permutations and blocks of the new operations and the blocks of
+        new angular momenta are evaluated. The stored arrays grow
+        geometrically, such that appending operations one at a time takes
+        amortised constant time per operation.
+        
+        For periodic molecules (see Molecule.set_unit_cell), atoms are
+        matched modulo the lattice vectors. The operation matrices are then
+        those at the Gamma-point, where all Bloch phases equal unity; these
+        only depend on the atom permutation within the unit cell.
+        
+        With workers set, the atom matching, the Wigner-D matrices and the
+        dense operation matrices of chunks of operations are evaluated by a
+        pool of worker processes; the dense matrices are written directly
+        into a shared memory buffer. The outcome does not depend on the
+        number of workers.
+        """
+        from .parallel import WorkerPool
+        
+        with WorkerPool(workers) as pool:
+            self.__run(dense, pool)
+    
+    def __run(self, dense, pool):
+        """
+        Process the new operations and shells, see run()
+        """
+        basis = self.mol.basis
+        nrops = len(self.operations)
+        start = self.__get_nr_processed()
+        self.__nrdense = min(self.__nrdense, start)
+        if start == 0:
+            self.__permutations = None
+            self.__blocks = {}
+            self.__dense = None
+            self.__nrdense = 0
+        
+        # assert atomic operations for the new operations
+        self.__permutations = _reserve(self.__permutations, nrops, (self.mol.nratoms,), np.int64)
+        # atom permutations recorded when building the molecule from its
+        # asymmetric unit are used as they are
+        perms = self.mol.get_atom_permutations(self.operations[start:])
+        if perms is not None:
+            self.__permutations[start:nrops] = perms
+        else:
+            matrices = self.get_matrices()
+            translations = self.get_translations()
+            names = [op.name for op in self.operations]
+            chunks = pool.get_chunks(np.arange(start, nrops))
+            perms = pool.starmap(match_atoms, [(self.positions, matrices[c], np.sqrt(1e-5), [names[k] for k in c],
+                                                translations[c], self.mol.cell) for c in chunks])
+            for c,p in zip(chunks, perms):
+                self.__permutations[c] = p
+        self.atomic_transformations = self.__permutations[:nrops]
+        
+        # assert basis function operations; every shell is mapped as a whole
+        # onto the m-slots of the corresponding shell on the target atom, such
+        # that each operation is fully characterized by the atom permutation
+        # and a single Wigner-D matrix per l
+        lvals = np.unique(basis.shell_l)
+        for l in lvals:
+            first = start if l in self.__blocks else 0
+            self.__blocks[l] = _reserve(self.__blocks.get(l), nrops, (2*l+1,2*l+1), np.float64)
+            self.__get_blocks(l, self.__blocks[l][:nrops], first, pool)
+        self.factorised = FactorisedOperations(basis,
+                                               self.atomic_transformations,
+                                               {l: self.__blocks[l][:nrops] for l in lvals})
+        
+        if basis is not self.__basis:
+            self.__nrdense = 0
+        self.__processed = list(self.operations)
+        self.__positions = np.array(self.positions)
+        self.__cell = self.mol.cell
+        self.__basis = basis
+        self.__build_operation_matrices(dense, pool)
+    
+    def __get_nr_processed(self):
+        """
+        Get the number of leading operations whose atom permutations and
+        blocks from a previous call to run() are still valid
+        """
+        if self.__positions is None or self.__permutations is None or \
+           not np.array_equal(self.__positions, self.positions) or \
+           not np.array_equal(self.__cell, self.mol.cell):
+            return 0
+        
+        nr = 0
+        for op1,op2 in zip(self.__processed, self.operations):
+            if op1 is not op2:
+                break
+            nr += 1
+        
+        return nr
+    
+    def __build_operation_matrices(self, dense, pool=None):
+        """
+        Expose the operation matrices from the factorised representation
+        """
+        from .parallel import build_dense
+        
+        if not dense:
+            self.operation_matrices = None
+        elif self.lazy:
+            self.operation_matrices = OperationMatrices(self.factorised, self.cache)
+        else:
+            # only the matrices of operations that were added since the
+            # previous call are constructed
+            nrops, nbf = len(self.factorised), self.factorised.get_nbf()
+            if self.__dense is not None and self.__dense.shape[1:] != (nbf,nbf):
+                self.__dense = None
+            start = min(self.__nrdense, self.__get_nr_processed(), nrops)
+            shared = pool is not None and pool.is_parallel() and start < nrops
+            self.__dense = _reserve(self.__dense, nrops, (nbf,nbf), np.float64,
+                                    lambda shape: self.__allocate_dense(shape, shared),
+                                    shared and self.__dense_shm is None)
+            if shared:
+                chunks = pool.get_chunks(np.arange(start, nrops))
+                pool.starmap(build_dense, [(self.__dense_shm[0].name, self.__dense.shape,
+                                            self.factorised.take(c), c) for c in chunks])
+            else:
+                for k in range(start, nrops):
+                    self.factorised.dense(k, out=self.__dense[k])
+            self.__nrdense = nrops
+            self.operation_matrices = self.__dense[:nrops]
+    
+    def __allocate_dense(self, shape, shared):
+        """
+        Allocate a new buffer for the dense operation matrices, either in
+        shared memory or in private memory; the shared memory segment of
+        the previous buffer (if any) is unlinked
+        """
+        from .parallel import allocate_shared
+        
+        if self.__dense_shm is not None:
+            self.__dense_shm[1]()
+            self.__dense_shm = None
+        
+        if not shared:
+            return np.zeros(shape)
+        
+        shm, arr, finalizer = allocate_shared(self, shape)
+        self.__dense_shm = (shm, finalizer)
+        
+        return arr
+    
+    def save(self, path):
+        """
+        Store the operations and their (factorised) representation in a
+        directory of .npy files with a JSON manifest; run() should have
+        been called
+        """
+        from .storage import write_arrays, operation_to_dict
+        
+        arrays = {'permutations': self.factorised.permutations}
+        for l,b in self.factorised.blocks.items():
+            arrays['blocks_%i' % l] = b
+        if self.products is not None:
+            arrays['products'] = self.products
+        
+        manifest = {
+            'type': 'SymmetryOperations',
+            'operations': [operation_to_dict(op) for op in self.operations],
+            'lvals': [int(l) for l in self.factorised.blocks.keys()],
+            'nratoms': int(self.mol.nratoms),
+            'nbf': len(self.mol.basis),
+        }
+        write_arrays(path, arrays, manifest)
+    
+    def restore(self, path, dense=True, mmap=False):
+        """
+        Restore the operations and their representation from a directory
+        written by save(), replacing the current operations; the molecule
+        and basis set should be identical to those used when saving
+        """
+        from .storage import read_arrays
+        
+        arrays, manifest = read_arrays(path, mmap)
+        if manifest['nratoms'] != self.mol.nratoms or manifest['nbf'] != len(self.mol.basis):
+            raise RuntimeError('Stored symmetry operations in %s do not match the molecule or basis set' % path)
+        
+        self.operations = [self.__build_operation(op['type'], op.get('label'), op.get('vec'), op.get('angle'),
+                                                  op.get('translation'))
+                           for op in manifest['operations']]
+        self.products = np.array(arrays['products']) if 'products' in arrays else None
+        self.atomic_transformations = arrays['permutations']
+        self.factorised = FactorisedOperations(self.mol.basis,
+                                               arrays['permutations'],
+                                               {l: arrays['blocks_%i' % l] for l in manifest['lvals']})
+        
+        # later calls to run() only process operations added hereafter
+        self.__processed = list(self.operations)
+        self.__positions = np.array(self.positions)
+        self.__cell = self.mol.cell
+        self.__basis = self.mol.basis
+        self.__permutations = self.factorised.permutations
+        self.__blocks = dict(self.factorised.blocks)
+        self.__dense = None
+        self.__nrdense = 0
+        self.__build_operation_matrices(dense)
+    
+    @classmethod
+    def load(cls, path, mol, dense=True, mmap=False, lazy=False, cache=False):
+        """
+        Construct a SymmetryOperations object from a directory written by
+        save()
+        """
+        symops = cls(mol, lazy=lazy, cache=cache)
+        symops.restore(path, dense=dense, mmap=mmap)
+        
+        return symops
+    
+    def __get_blocks(self, l, blocks, start=0, pool=None):
+        """
+        Evaluate the transposed Wigner-D matrices of the operations from
+        index start onwards for a given l, storing these in blocks;
+        operations that are products of other operations are built from
+        these products rather than from their own Wigner-D matrix
+        """
+        from .parallel import WorkerPool, wigner_blocks
+        
+        nrops = len(self.operations)
+        if start >= nrops:
+            return blocks
+        
+        done = np.arange(nrops) < start
+        direct = ~done if self.products is None else ~done & (self.products[:,0] < 0)
+        pool = WorkerPool() if pool is None else pool
+        chunks = pool.get_chunks(np.flatnonzero(direct))
+        results = pool.starmap(wigner_blocks, [([self.operations[k] for k in c], l) for c in chunks])
+        for c,b in zip(chunks, results):
+            blocks[c] = b
+        done |= direct
+        
+        # the matrix of the product M_a M_b has as (transposed) Wigner-D
+        # matrix the product B_b B_a
+        while not np.all(done):
+            a, b = self.products[:,0], self.products[:,1]
+            ready = ~done & done[np.maximum(a,0)] & done[np.maximum(b,0)]
+            if not np.any(ready):
+                raise RuntimeError('Circular product definition encountered')
+            blocks[ready] = blocks[b[ready]] @ blocks[a[ready]]
+            done |= ready
+        
+        return blocks
+    
+    def get_atomic_transformations(self):
+        """
+        Get the (K,N) table of atom permutations, matching the atoms when
+        these have not yet been established for the current operations
+        """
+        if getattr(self, 'atomic_transformations', None) is None or \
+           len(self.atomic_transformations) != len(self.operations):
+            self.atomic_transformations = self.mol.get_atom_permutations(self.operations)
+        if self.atomic_transformations is None:
+            self.atomic_transformations = match_atoms(self.positions,
+                                                      self.get_matrices(),
+                                                      names=[op.name for op in self.operations],
+                                                      translations=self.get_translations(),
+                                                      cell=self.mol.cell)
+        
+        return self.atomic_transformations
+    
+    def symmetrize(self, tol=1e-2):
+        """
+        Make the geometry of the molecule exactly symmetric under the
+        operations by averaging every atom over its images (see
+        symmetrize()); the positions of the molecule are updated in place
+        """
+        from .measures import symmetrize
+        
+        self.mol.positions[:] = symmetrize(self.mol, self.operations, tol)
+        self.atomic_transformations = None
+        
+        return self.mol.positions
+    
+    def get_orbits(self):
+        """
+        Decompose the atoms into orbits of symmetry-equivalent atoms
+        
+        Returns
+        -------
+        numpy.ndarray
+            (N,) integer array holding the orbit of every atom; orbits are
+            numbered in order of first appearance
+        numpy.ndarray
+            Representative (lowest atom index) of every orbit
+        """
+        return atom_orbits(self.get_atomic_transformations())
+    
+    def get_stabilisers(self, atoms=None):
+        """
+        Get the stabiliser subgroups (site symmetry groups) of a series of
+        atoms, by default the representatives of the orbits
+        
+        Returns
+        -------
+        list of numpy.ndarray
+            Indices of the operations that leave each atom in place
+        """
+        perm = self.get_atomic_transformations()
+        if atoms is None:
+            atoms = self.get_orbits()[1]
+        
+        return stabilisers(perm, atoms)
+    
+    def characters(self):
+        """
+        Calculate the characters (traces of the operation matrices) of all
+        operations without constructing the operation matrices
+        
+        Only shells residing on atoms that are left in place by an operation
+        contribute; for complete shells, the contribution follows from the
+        closed-form character of the rotation (including a parity factor for
+        improper operations).
+        """
+        basis = self.mol.basis
+        perm = self.get_atomic_transformations()
+        fixed = perm[:,basis.shell_atom] == basis.shell_atom
+        complete = np.bincount(basis.shell, minlength=basis.get_nr_shells()) == 2 * basis.shell_l + 1
+        
+        chars = np.zeros(len(self.operations))
+        for l in np.unique(basis.shell_l):
+            shells = np.flatnonzero((basis.shell_l == l) & complete)
+            chi = np.array([op.get_character(l) for op in self.operations])
+            chars += np.sum(fixed[:,shells], axis=1) * chi
+            
+            # incomplete shells only pick up the diagonal elements of the
+            # Wigner-D matrix for the m-values that are present
+            shells = np.flatnonzero((basis.shell_l == l) & ~complete)
+            if len(shells) > 0:
+                present = basis.slot_bf[basis.shell_slot_offset[shells][:,None] + np.arange(2*l+1)] >= 0
+                diag = np.array([np.diagonal(op.get_wigner_matrix(l)) for op in self.operations])
+                chars += np.einsum('ks,km,sm->k', fixed[:,shells], diag, present)
+        
+        return chars
+    
+    def iter_operation_matrices(self):
+        """
+        Generator over the dense operation matrices, constructing them one
+        at a time from the factorised representation
+        """
+        if self.operation_matrices is not None and not self.lazy:
+            yield from self.operation_matrices
+        else:
+            for k in range(len(self.factorised)):
+                yield self.factorised.dense(k)
+
+def _reserve(buffer, size, shape, dtype, alloc=None, force=False):
+    """
+    Get a buffer holding at least size entries of the given shape; when the
+    current buffer is too small (or read-only), or when force is set, a new
+    buffer is allocated with at least twice its capacity and the current
+    entries are copied
+    
+    The new buffer is obtained from alloc(shape) when given.
+    """
+    if buffer is not None and buffer.shape[1:] == shape and \
+       len(buffer) >= size and buffer.flags.writeable and not force:
+        return buffer
+    
+    nr = len(buffer) if buffer is not None and buffer.shape[1:] == shape else 0
+    newshape = (max(size, 2 * nr),) + shape
+    newbuffer = np.zeros(newshape, dtype=dtype) if alloc is None else alloc(newshape)
+    newbuffer[:nr] = buffer[:nr] if nr > 0 else 0
+    
+    return newbuffer
+
+def _assign_classes(classes, targets, columns, hits, assignment, constants, ctconstants):
+    """
+    Assign a set of classes sharing a signature to their candidate classes
+    of a character table (see SymmetryOperations.get_class_indices)
+    
+    Only assignments consistent with the class multiplication coefficients
+    of the classes assigned so far are considered; among these, the one
+    matching most annotated axes is established as a linear assignment
+    problem. Returns the candidate class of every class, or None when
+    another assignment matches as many axes while yielding different
+    characters.
+    """
+    from scipy.optimize import linear_sum_assignment
+    
+    fixed = np.flatnonzero(assignment >= 0)
+    n = len(classes)
+    
+    # score of every (class, candidate) pair; pairs inconsistent with the
+    # classes assigned so far are penalised beyond any gain in axes
+    score = hits[np.ix_(classes, targets)].astype(np.int64)
+    for a,i in enumerate(classes):
+        for b,j in enumerate(targets):
+            x = np.append(fixed, i)
+            y = np.append(assignment[fixed], j)
+            if not np.allclose(ctconstants[np.ix_(y,y,y)], constants[np.ix_(x,x,x)], atol=1e-6):
+                score[a,b] = -(n + 1)
+    
+    rows, cols = linear_sum_assignment(score, maximize=True)
+    best = score[rows, cols].sum()
+    if np.any(score[rows, cols] < 0):
+        # inconsistent with the classes assigned so far; the caller
+        # rejects the complete assignment
+        return targets[cols]
+    
+    # ambiguous when a class can be moved to a candidate with different
+    # characters without loss
+    for a,b in zip(rows, cols):
+        alternative = score.copy()
+        alternative[a, columns == columns[b]] = -n * (n + 1) - 1
+        r, c = linear_sum_assignment(alternative, maximize=True)
+        if alternative[r, c].sum() == best:
+            return None
+    
+    return targets[cols]
+
+def match_atoms(positions, matrices, tol=np.sqrt(1e-5), names=None,
+                translations=None, cell=None):
+    """
+    Establish onto which atom every atom is mapped under a series of
+    operations
+    
+    All transformed positions of all operations are matched against a
+    KD-tree of the original positions in a single batched query. For
+    periodic systems, atoms are matched modulo the lattice vectors using a
+    periodic KD-tree in fractional coordinates; the distance between
+    matched atoms is verified in Cartesian coordinates.
+    
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        (N,3) array of atomic positions
+    matrices : numpy.ndarray
+        (K,3,3) array of operation matrices
+    tol : float
+        Maximum distance between a transformed atom and its image
+    names : list of str, optional
+        Names of the operations, used for reporting errors
+    translations : numpy.ndarray, optional
+        (K,3) array of (Cartesian) translations applied after the matrices
+    cell : numpy.ndarray, optional
+        (3,3) array holding the lattice vectors as rows
+    
+    Returns
+    -------
+    numpy.ndarray
+        (K,N) integer array listing for every operation the index of the
+        atom onto which each atom is mapped
+    
+    Raises
+    ------
+    RuntimeError
+        If an operation does not map the set of atoms onto itself
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1,3,3)
+    K, N = len(matrices), len(positions)
+    if names is None:
+        names = ['#%i' % k for k in range(K)]
+    
+    tpos = np.einsum('kij,nj->kni', matrices, positions)
+    if translations is not None:
+        tpos += np.asarray(translations, dtype=np.float64).reshape(-1,1,3)
+    
+    if cell is None:
+        tree = cKDTree(positions)
+        dist, idx = tree.query(tpos.reshape(-1,3), distance_upper_bound=tol)
+    else:
+        dist, idx = _match_periodic(positions, tpos.reshape(-1,3), cell, tol)
+    idx = idx.reshape(K,N)
+    
+    # every atom should land on an atom
+    unmatched = ~np.isfinite(dist.reshape(K,N))
+    if np.any(unmatched):
+        k,i = np.argwhere(unmatched)[0]
+        raise RuntimeError('Operation %s does not map atom %i onto any atom' % (names[k], i))
+    
+    # and no two atoms should land on the same atom
+    duplicates = np.any(np.sort(idx, axis=1) != np.arange(N), axis=1)
+    if np.any(duplicates):
+        k = np.flatnonzero(duplicates)[0]
+        raise RuntimeError('Operation %s does not map the set of atoms onto itself' % names[k])
+    
+    return idx.astype(np.int64)
+
+def _match_periodic(positions, tpos, cell, tol):
+    """
+    Find for every position in tpos the position in positions that is
+    within a distance tol modulo the lattice vectors
+    
+    Returns
+    -------
+    numpy.ndarray
+        Distance to the matched position (inf when there is none)
+    numpy.ndarray
+        Index of the matched position (len(positions) when there is none)
+    """
+    cell = np.asarray(cell, dtype=np.float64).reshape(3,3)
+    inv = np.linalg.inv(cell)
+    frac = _wrap_fractional(positions @ inv)
+    tfrac = _wrap_fractional(tpos @ inv)
+    
+    # a Cartesian displacement of tol corresponds to at most this
+    # displacement in fractional coordinates
+    tree = cKDTree(frac, boxsize=1.0)
+    _, idx = tree.query(tfrac, distance_upper_bound=tol * np.linalg.norm(inv, 2))
+    
+    dist = np.full(len(tpos), np.inf)
+    found = np.flatnonzero(idx < len(positions))
+    df = tfrac[found] - frac[idx[found]]
+    df -= np.round(df)
+    d = np.linalg.norm(df @ cell, axis=1)
+    dist[found] = np.where(d <= tol, d, np.inf)
+    
+    return dist, idx
+
+def _wrap_fractional(frac):
+    """
+    Wrap fractional coordinates into [0,1)
+    """
+    frac = frac - np.floor(frac)
+    frac[frac >= 1.0] = 0.0
+    
+    return frac
+
+def rotation_character(l, angle):
+    """
+    Character of a rotation over an angle in the basis of the 2l+1
+    spherical harmonics of order l
+    
+    Parameters
+    ----------
+    l : int
+        Order of the spherical harmonics
+    angle : float
+        Rotation angle
+    
+    Returns
+    -------
+    float
+        :math:`\\chi^{l}(\\omega) = \\sin((l+\\frac{1}{2})\\omega) / \\sin(\\omega/2)`
+    """
+    half = np.sin(angle / 2.0)
+    if np.abs(half) < 1e-12:
+        return float(2*l+1)
+    
+    return np.sin((l + 0.5) * angle) / half
+
+class Operation:
+    """
+    Base operation class
+    """
+    def __init__(self, name):
+        self.name = name
+        
+    def set_atomic_id(self, idx):
+        self.atomid = idx
+    
+    def set_translation(self, translation):
+        """
+        Set the (Cartesian) translation applied after the point operation,
+        e.g. the fractional translation of a screw axis or glide plane
+        """
+        self.translation = np.array(translation, dtype=np.float64).reshape(3)
+    
+    def get_translation(self):
+        return getattr(self, 'translation', np.zeros(3))
+
+class Identity(Operation):
+    """
+    Identity operation "E"
+    """
+    def __init__(self):
+        super().__init__('E')
+
+    def get_matrix(self):
+        return np.identity(3)
+    
+    def get_wigner_matrix(self, l):
+        return np.identity(2*l+1)
+    
+    def get_character(self, l):
+        return 2*l+1
+    
+class Inversion(Operation):
+    """
+    Identity operation "i"
+    """
+    def __init__(self):
+        super().__init__('i')
+
+    def get_matrix(self):
+        return -np.identity(3)
+    
+    def get_wigner_matrix(self, l):
+        return np.identity(2*l+1) * (-1)**l
+    
+    def get_character(self, l):
+        return (-1)**l * (2*l+1)
+
+class Rotation(Operation):
+    """
+    Rotation operation "C"
+    """
+    def __init__(self, label, axis, angle):
+        super().__init__('C' + label)
+        self.axis = axis / np.linalg.norm(axis)
+        self.angle = angle
+        self.robj = R.from_rotvec(self.axis * self.angle)
+        
+    def get_matrix(self):
+        return self.robj.as_matrix()
+    
+    def get_wigner_matrix(self, l):
+        return tesseral_wigner_D(l, self.robj)
+    
+    def get_character(self, l):
+        return rotation_character(l, self.angle)
+        
+class Mirror(Operation):
+    """
+    Rotation operation "σ"
+    """
+    def __init__(self, label, normal):
+        super().__init__('σ' + label)
+        self.normal = normal
+        
+    def get_matrix(self):
+        return np.identity(3) - 2 * np.outer(self.normal, self.normal)
+    
+    def get_wigner_matrix(self, l):
+        return tesseral_wigner_D_mirror(l, self.normal)
+    
+    def get_character(self, l):
+        # a mirror operation is an inversion combined with a C2 rotation
+        return (-1)**l * rotation_character(l, np.pi)
+        
+class ImproperRotation(Operation):
+    """
+    Rotation operation "S"
+    """
+    def __init__(self, label, axis, angle):
+        super().__init__('S' + label)
+        self.axis = axis / np.linalg.norm(axis)
+        self.angle = angle
+        self.robj = R.from_rotvec(self.axis * self.angle)
+        
+    def get_matrix(self):
+        M = np.identity(3) - 2 * np.outer(self.axis, self.axis)
+        R = self.robj.as_matrix()
+        return M @ R
+    
+    def get_wigner_matrix(self, l):
+        return tesseral_wigner_D_improper(l, self.robj)
+    
+    def get_character(self, l):
+        # an improper rotation is an inversion combined with a rotation over
+        # an additional angle of pi
+        return (-1)**l * rotation_character(l, self.angle + np.pi)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+import io
+import mmap
+import os
+import numpy as np
+from .molecule import Molecule, ANG2BOHR
+
+class XYZReader:
+    """
+    Streaming reader for (multi-frame) XYZ files
+
+    Upon construction, only the byte offsets of the frames are indexed; the
+    coordinate blocks are parsed on demand, such that individual frames can
+    be accessed in any order. Positions are returned in bohr.
+    """
+    def __init__(self, path, use_mmap=True):
+        self.path = path
+
+        with open(path, 'rb') as f:
+            if use_mmap and os.path.getsize(path) > 0:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._buffer = f.read()
+
+        self.__index_frames()
+
+    def __len__(self):
+        return len(self._nratoms)
+
+    def __getitem__(self, frame):
+        return self.read_frame(frame)
+
+    def __iter__(self):
+        return self.iter_frames()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Release the (memory-mapped) file buffer
+        """
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def get_nratoms(self, frame):
+        """
+        Get the number of atoms in a frame
+        """
+        return int(self._nratoms[self.__check_frame(frame)])
+
+    def get_comment(self, frame):
+        """
+        Get the comment line of a frame
+        """
+        start, end = self._offsets[self.__check_frame(frame), 0:2]
+        return bytes(self._buffer[start:end]).decode().strip()
+
+    def read_positions(self, frame):
+        """
+        Parse the atomic positions (in bohr) of a frame as an (N,3) array
+        """
+        block = self.__get_block(frame)
+        positions = np.loadtxt(io.BytesIO(block), usecols=(1,2,3), ndmin=2,
+                               dtype=np.float64)
+        return positions * ANG2BOHR
+
+    def read_symbols(self, frame):
+        """
+        Parse the element symbols of a frame
+        """
+        block = self.__get_block(frame)
+        return np.loadtxt(io.BytesIO(block), usecols=0, ndmin=1, dtype=str)
+
+    def read_frame(self, frame, molname=None):
+        """
+        Build a Molecule object from a frame; if no name is provided, the
+        comment line of the frame is used
+        """
+        mol = Molecule(self.get_comment(frame) if molname is None else molname)
+        mol.add_atoms(self.read_symbols(frame), self.read_positions(frame))
+
+        return mol
+
+    def iter_frames(self, start=None, stop=None, step=None):
+        """
+        Generator yielding a Molecule object for every frame in the range
+        """
+        for frame in range(len(self))[start:stop:step]:
+            yield self.read_frame(frame)
+
+    def iter_positions(self, start=None, stop=None, step=None):
+        """
+        Generator yielding the (N,3) position array for every frame in the
+        range
+        """
+        for frame in range(len(self))[start:stop:step]:
+            yield self.read_positions(frame)
+
+    def __check_frame(self, frame):
+        """
+        Validate frame index, supporting negative indices
+        """
+        nrframes = len(self)
+        if frame < -nrframes or frame >= nrframes:
+            raise IndexError('Frame %i out of range for file with %i frames' % (frame, nrframes))
+
+        return frame % nrframes
+
+    def __get_block(self, frame):
+        """
+        Grab the bytes holding the coordinate block of a frame
+        """
+        start, end = self._offsets[self.__check_frame(frame), 1:3]
+        return bytes(self._buffer[start:end])
+
+    def __index_frames(self):
+        """
+        Find the byte offsets of the frames and how many atoms they hold
+        """
+        data = np.frombuffer(self._buffer, dtype=np.uint8)
+        newlines = np.flatnonzero(data == ord('\n'))
+
+        # line i spans bytes [line_starts[i], line_starts[i+1]); a sentinel
+        # is added when the file does not end with a newline
+        line_starts = np.concatenate([[0], newlines + 1])
+        if len(data) > 0 and data[-1] != ord('\n'):
+            line_starts = np.append(line_starts, len(data))
+        nrlines = len(line_starts) - 1
+
+        # per frame: start and end of comment line, end of coordinate block
+        offsets = []
+        nratoms = []
+        line = 0
+        while line < nrlines:
+            header = bytes(self._buffer[line_starts[line]:line_starts[line+1]]).strip()
+            if len(header) == 0: # allow for trailing blank lines
+                line += 1
+                continue
+
+            try:
+                n = int(header)
+            except ValueError:
+                raise RuntimeError('Invalid XYZ header encountered at line %i of %s' % (line+1, self.path))
+
+            if line + 2 + n > nrlines:
+                raise RuntimeError('Truncated frame encountered at line %i of %s' % (line+1, self.path))
+
+            offsets.append((line_starts[line+1], line_starts[line+2],
+                            line_starts[line+2+n]))
+            nratoms.append(n)
+            line += n + 2
+
+        self._offsets = np.array(offsets, dtype=np.int64).reshape(-1,3)
+        self._nratoms = np.array(nratoms, dtype=np.int64)
+
+def iter_xyz(path, positions_only=False, start=None, stop=None, step=None,
+             use_mmap=True):
+    """
+    Generator over the frames of a (multi-frame) XYZ file, yielding either
+    Molecule objects or (N,3) position arrays in bohr
+    """
+    with XYZReader(path, use_mmap=use_mmap) as reader:
+        if positions_only:
+            yield from reader.iter_positions(start, stop, step)
+        else:
+            yield from reader.iter_frames(start, stop, step)
@@ -0,0 +1,72 @@
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sphecerix import Molecule, BasisFunction, SymmetryOperations
+
+# basis sets for ammonia
+BASIS_SETS = {
+    'minimal': {
+        'N': [BasisFunction(1,0,0),
+              BasisFunction(2,0,0),
+              BasisFunction(2,1,1),
+              BasisFunction(2,1,-1),
+              BasisFunction(2,1,0)],
+        'H': [BasisFunction(1,0,0)]
+    },
+    # nitrogen 2p-functions only
+    'p': {
+        'N': [BasisFunction(2,1,1),
+              BasisFunction(2,1,-1),
+              BasisFunction(2,1,0)],
+        'H': [BasisFunction(1,0,0)]
+    },
+    # d-functions on nitrogen and p-functions on hydrogen
+    'extended': {
+        'N': [BasisFunction(1,0,0),
+              BasisFunction(2,0,0),
+              BasisFunction(2,1,1),
+              BasisFunction(2,1,-1),
+              BasisFunction(2,1,0)] +
+             [BasisFunction(3,2,m) for m in range(-2,3)],
+        'H': [BasisFunction(1,0,0),
+              BasisFunction(2,1,1),
+              BasisFunction(2,1,-1),
+              BasisFunction(2,1,0)]
+    },
+}
+
+def build_ammonia(basis='minimal', lazy=False, cache=False):
+    """
+    Build the C3v symmetry operations of ammonia (C3 axis along z and one
+    of the mirror planes containing the y-axis)
+
+    Parameters
+    ----------
+    basis : str
+        Name of the basis set (see BASIS_SETS)
+    lazy : bool
+        Passed on to SymmetryOperations
+    cache : bool
+        Passed on to SymmetryOperations
+    """
+    mol = Molecule()
+    mol.add_atom('N', 0.00000000, 0.00000000, -0.06931370, unit='angstrom')
+    mol.add_atom('H', 0.00000000, 0.94311105,  0.32106944, unit='angstrom')
+    mol.add_atom('H', -0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+    mol.add_atom('H', 0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+    mol.build_basis(BASIS_SETS[basis])
+
+    symops = SymmetryOperations(mol, lazy=lazy, cache=cache)
+    symops.add('identity')
+    symops.add('rotation', '3+', np.array([0,0,1]), 2.0 * np.pi / 3)
+    symops.add('rotation', '3-', -np.array([0,0,1]), 2.0 * np.pi / 3)
+    for i in range(0,3):
+        symops.add('mirror', 'v%i' % (i+1), np.array([np.cos(i * 2.0 * np.pi / 3),
+                                                      np.sin(i * 2.0 * np.pi / 3),
+                                                      0.0]))
+
+    return symops
@@ -53,6 +53,44 @@ class TestAmmoniaSymmetryOperations(unittest.TestCase):
         irreps = ct.lot(np.trace(symops.operation_matrices, axis1=1, axis2=2))
         np.testing.assert_almost_equal(irreps, [4,0,2])
         
+    def test_nh3_higher_shells(self):
+        """
+        Split-valence p-shells and f-shells are placed on the nitrogen atom
+        """
+        mol = Molecule()
+        mol.add_atom('N', 0.00000000, 0.00000000, -0.06931370, unit='angstrom')
+        mol.add_atom('H', 0.00000000, 0.94311105,  0.32106944, unit='angstrom')
+        mol.add_atom('H', -0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+        mol.add_atom('H', 0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+        
+        molset = {
+            'N': [BasisFunction(2,1,m) for m in [1,-1,0]] +
+                 [BasisFunction(2,1,m) for m in [1,-1,0]] +
+                 [BasisFunction(4,3,m) for m in range(-3,4)],
+            'H': [BasisFunction(1,0,0)]
+        }
+        mol.build_basis(molset)
+        
+        symops = SymmetryOperations(mol)
+        symops.add('identity')
+        symops.add('rotation', '3+', np.array([0,0,1]), 2.0 * np.pi / 3)
+        symops.add('rotation', '3-', -np.array([0,0,1]), 2.0 * np.pi / 3)
+        for i in range(0,3):
+            symops.add('mirror', 'v1', np.array([np.cos(i * 2.0 * np.pi / 3),
+                                                 np.sin(i * 2.0 * np.pi / 3),
+                                                 0.0]))
+        symops.run()
+        
+        # all operation matrices should be orthogonal
+        for m in symops.operation_matrices:
+            np.testing.assert_almost_equal(m @ m.transpose(), np.identity(len(mol.basis)))
+        
+        # 2 x (A1 + E) for the p-shells, A1 + E for the hydrogens and
+        # 2A1 + A2 + 2E for the f-shell
+        ct = CharacterTable('c3v')
+        irreps = ct.lot(np.trace(symops.operation_matrices, axis1=1, axis2=2))
+        np.testing.assert_almost_equal(irreps, [5,1,5])
+        
         
 
 if __name__ == '__main__':
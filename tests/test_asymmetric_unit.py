@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+from unittest import mock
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, SymmetryOperations, match_atoms
+
+class TestAsymmetricUnit(unittest.TestCase):
+    """
+    Test building molecules from their symmetry-unique atoms
+    """
+
+    def test_methane(self):
+        group = SymmetryOperations(None)
+        group.add_generators([('rotation', '3', np.ones(3), 2.0 * np.pi / 3),
+                              ('improper', '4', np.array([0,0,1]), np.pi / 2)])
+        self.assertEqual(len(group.operations), 24)
+
+        mol = Molecule.from_asymmetric_unit(['C', 'H'], [[0,0,0], [0.63,0.63,0.63]],
+                                            group, unit='angstrom')
+        self.assertEqual(mol.nratoms, 5)
+        self.assertEqual([a[0] for a in mol.atoms], ['C', 'H', 'H', 'H', 'H'])
+        np.testing.assert_equal(mol.orbits, [0,1,1,1,1])
+        np.testing.assert_almost_equal(np.abs(mol.positions[1:]), 0.63 * 1.8897259886)
+        self.assertEqual([len(s) for s in mol.get_stabilisers()], [24,6,6,6,6])
+
+        # the recorded permutations equal those obtained by matching
+        np.testing.assert_equal(mol.atom_permutations,
+                                match_atoms(mol.positions, group.get_matrices()))
+
+        # and are used by SymmetryOperations instead of matching the atoms
+        mol.build_basis({'C': [BasisFunction(2,1,m) for m in range(-1,2)],
+                         'H': [BasisFunction(1,0,0)]})
+        symops = SymmetryOperations(mol)
+        symops.operations = group.operations
+        symops.products = group.products
+        with mock.patch('sphecerix.symmetry_operations.match_atoms', side_effect=RuntimeError):
+            symops.run()
+            np.testing.assert_equal(symops.get_orbits()[0], [0,1,1,1,1])
+
+        # which no longer holds once the atoms are moved
+        mol.positions[1] *= 1.01
+        self.assertIsNone(mol.get_atom_permutations(group.operations))
+
+    def test_coinciding_images(self):
+        group = SymmetryOperations(None)
+        group.add_generators([('rotation', '4', np.array([0,0,1]), np.pi / 2)])
+        mol = Molecule.from_asymmetric_unit(['O', 'H', 'H'], [[0,0,1], [1,0,0], [0,2,0]], group)
+        self.assertEqual(mol.nratoms, 9)
+        np.testing.assert_equal(mol.orbits, [0,1,1,1,1,2,2,2,2])
+
+        with self.assertRaises(RuntimeError):
+            Molecule.from_asymmetric_unit(['H', 'H'], [[1,0,0], [0,1,0]], group)
+
+if __name__ == '__main__':
+    unittest.main()
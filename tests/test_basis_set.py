@@ -0,0 +1,132 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, BasisSet
+
+class TestBasisSet(unittest.TestCase):
+    """
+    Test construction of the array-backed basis set
+    """
+
+    def test_ethylene(self):
+        mol = self.build_ethylene()
+        mol.build_basis(self.build_molset())
+
+        self.assertIsInstance(mol.basis, BasisSet)
+        self.assertEqual(len(mol.basis), 14)
+        self.assertEqual(mol.basis.get_nr_shells(), 10)
+
+        np.testing.assert_equal(mol.basis.atomid, [0,0,0,0,0,1,1,1,1,1,2,3,4,5])
+        np.testing.assert_equal(mol.basis.l, [0,0,1,1,1,0,0,1,1,1,0,0,0,0])
+        np.testing.assert_equal(mol.basis.m, [0,0,1,-1,0,0,0,1,-1,0,0,0,0,0])
+        np.testing.assert_equal(mol.basis.shell, [0,1,2,2,2,3,4,5,5,5,6,7,8,9])
+        np.testing.assert_equal(mol.basis.shell_offset, [0,1,2,5,6,7,10,11,12,13])
+        np.testing.assert_equal(mol.basis.shell_atom, [0,0,0,1,1,1,2,3,4,5])
+
+        self.assertEqual(mol.basis.names[:5], ['C1s', 'C2s', 'C2px', 'C2py', 'C2pz'])
+        self.assertEqual(mol.basis.names[-1], 'H1s')
+
+        # basis function objects are created on request
+        bf = mol.basis[7]
+        self.assertIsInstance(bf, BasisFunction)
+        self.assertEqual(bf.name, 'C2px')
+        self.assertEqual(bf.atomid, 1)
+        np.testing.assert_almost_equal(bf.r, mol.positions[1])
+        self.assertEqual([b.name for b in mol.basis], mol.basis.names)
+
+        # the basis set keeps the positions it was built for, also when
+        # adding atoms reallocates the position array of the molecule
+        r = np.array(mol.positions[1])
+        mol.positions[1] += 1.0
+        np.testing.assert_almost_equal(mol.basis[7].r, r)
+        mol.add_atoms(['H'] * 32, np.zeros((32,3)))
+        mol.positions[1] += 1.0
+        np.testing.assert_almost_equal(mol.basis[7].r, r)
+        self.assertEqual(len(mol.basis.positions), 6)
+
+    def test_repeated_shells(self):
+        """
+        Repeated m-values within the same (n,l) start a new shell
+        """
+        mol = Molecule()
+        mol.add_atom('C', 0.0, 0.0, 0.0)
+        mol.add_atom('O', 0.0, 0.0, 1.0)
+        molset = {
+            'C': [BasisFunction(2,1,-1), BasisFunction(2,1,0), BasisFunction(2,1,1),
+                  BasisFunction(2,1,-1), BasisFunction(2,1,0), BasisFunction(2,1,1)],
+        }
+        mol.build_basis(molset)
+        np.testing.assert_equal(mol.basis.shell, [0,0,0,1,1,1])
+        np.testing.assert_equal(mol.basis.atomid, [0,0,0,0,0,0])
+
+    def test_shell_index(self):
+        """
+        Arbitrary n, l and repeated shells are resolved by the shell index
+        """
+        mol = Molecule()
+        mol.add_atom('N', 0.0, 0.0, 0.0)
+        mol.add_atom('H', 0.0, 0.0, 1.0)
+        molset = {
+            'N': [BasisFunction(2,1,m) for m in range(-1,2)] +
+                 [BasisFunction(2,1,m) for m in range(-1,2)] +
+                 [BasisFunction(4,3,m) for m in range(-3,4)] +
+                 [BasisFunction(5,4,0)],
+            'H': [BasisFunction(1,0,0)]
+        }
+        mol.build_basis(molset)
+
+        np.testing.assert_equal(mol.basis.atom_shell_offset, [0,4,5])
+        np.testing.assert_equal(mol.basis.shell_slot_offset, [0,3,6,13,22,23])
+        self.assertEqual(mol.basis.find_shell(0, 2, 1), 0)
+        self.assertEqual(mol.basis.find_shell(0, 2, 1, 1), 1)
+        self.assertEqual(mol.basis.find_shell(0, 4, 3), 2)
+        self.assertEqual(mol.basis.find_shell(1, 1, 0), 4)
+        self.assertEqual(mol.basis.find_shell(1, 2, 1), -1)
+
+        # the g-shell only holds a single function
+        slots = mol.basis.get_slot(3, np.arange(-4,5))
+        np.testing.assert_equal(mol.basis.slot_bf[slots], [-1,-1,-1,-1,13,-1,-1,-1,-1])
+        self.assertEqual(mol.basis.names[9], 'N4fz3')
+        self.assertEqual(mol.basis.names[13], 'N5g+0')
+
+    def test_large_cluster(self):
+        nratoms = 10000
+        rng = np.random.default_rng(1)
+        mol = Molecule()
+        mol.add_atoms(np.where(np.arange(nratoms) % 2 == 0, 'C', 'H'),
+                      rng.uniform(-50, 50, (nratoms,3)))
+        mol.build_basis(self.build_molset())
+
+        self.assertEqual(len(mol.basis), 30000)
+        np.testing.assert_equal(np.bincount(mol.basis.atomid)[:4], [5,1,5,1])
+        self.assertEqual(mol.basis.get_nr_shells(), 3 * nratoms // 2 + nratoms // 2)
+
+    def build_ethylene(self):
+        mol = Molecule()
+        mol.add_atom('C', -0.6530176758,  0.0000000000 ,0.0000000000, unit='angstrom')
+        mol.add_atom('C',  0.6530176758,  0.0000000000 ,0.0000000000, unit='angstrom')
+        mol.add_atom('H', -1.2288875372, -0.9156191261 ,0.0000000000, unit='angstrom')
+        mol.add_atom('H', -1.2288875372,  0.9156191261 ,0.0000000000, unit='angstrom')
+        mol.add_atom('H',  1.2288875372,  0.9156191261 ,0.0000000000, unit='angstrom')
+        mol.add_atom('H',  1.2288875372, -0.9156191261 ,0.0000000000, unit='angstrom')
+
+        return mol
+
+    def build_molset(self):
+        return {
+            'C': [BasisFunction(1,0,0),
+                  BasisFunction(2,0,0),
+                  BasisFunction(2,1,1),
+                  BasisFunction(2,1,-1),
+                  BasisFunction(2,1,0)],
+            'H': [BasisFunction(1,0,0)]
+        }
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 import unittest
 import numpy as np
+import tempfile
+import json
+import glob
 import sys
 import os
 
@@ -8,6 +11,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 # import functions
 from sphecerix import CharacterTable
+from sphecerix.character_table import PACKAGE, TABLEDIR, pack_character_tables, \
+                                      read_character_tables
 
 class TestCharacterTable(unittest.TestCase):
     """
@@ -23,5 +28,83 @@ class TestCharacterTable(unittest.TestCase):
         np.testing.assert_almost_equal(ct.lot([1,1,1,-1,-1,-1]), [0,1,0])
         np.testing.assert_almost_equal(ct.lot([4,-2,-2,0,0,0]), [0,0,2])
 
+    def test_batched_lot(self):
+        """
+        Reduce many representations at once, per operation or per class
+        """
+        ct = CharacterTable('td')
+        rng = np.random.default_rng(0)
+        multiplicities = rng.integers(0, 4, size=(50, ct.nrgroups))
+        condensed = multiplicities @ ct.table
+        expanded = np.repeat(condensed, ct.sizes, axis=1)
+        
+        np.testing.assert_equal(ct.lot(expanded), multiplicities)
+        np.testing.assert_equal(ct.lot(condensed), multiplicities)
+        np.testing.assert_equal(ct.lot(expanded[7]), multiplicities[7])
+        np.testing.assert_equal(ct.lot(condensed[7]), multiplicities[7])
+        
+        # operations in arbitrary order
+        order = rng.permutation(ct.order)
+        classes = np.repeat(np.arange(ct.nrclasses), ct.sizes)[order]
+        np.testing.assert_equal(ct.lot(expanded[:,order], classes), multiplicities)
+        
+        # characters that do not belong to a representation
+        with self.assertRaisesRegex(ValueError, 'maximum deviation.*0.125'):
+            ct.lot([1,0,0,0,0])
+        with self.assertRaises(ValueError):
+            ct.lot(np.ones(7))
+
+    def test_registry(self):
+        """
+        All instances of a table share the same read-only arrays
+        """
+        ct1 = CharacterTable('td')
+        ct2 = CharacterTable('td')
+        self.assertIs(ct1.table, ct2.table)
+        self.assertIs(ct1.expandedtable, ct2.expandedtable)
+        self.assertEqual(ct1.chartablelib['name'], 'td')
+        with self.assertRaises(ValueError):
+            ct1.table[0,0] = 2.0
+        with self.assertRaises(TypeError):
+            ct1.chartablelib['classes'][0]['multiplicity'] = 2
+        
+        # invalid tables are rejected
+        chartablelib = {'name': 'c2', 
+                        'classes': [{'symbol': 'E', 'multiplicity': 1},
+                                    {'symbol': 'C2', 'multiplicity': 1}],
+                        'symmetry_groups': [{'symbol': 'A', 'characters': [1,1]},
+                                            {'symbol': 'B', 'characters': [1,0]}]}
+        with self.assertRaisesRegex(ValueError, 'Invalid character table c2'):
+            CharacterTable('c2', chartablelib)
+        
+        np.testing.assert_almost_equal(ct1.expandedtable,
+                                       np.repeat(ct1.table, [1,8,3,6,6], axis=1))
+        self.assertTrue(CharacterTable.exists('ih'))
+        self.assertFalse(CharacterTable.exists('x1'))
+
+    def test_package(self):
+        """
+        The packed resource holds the bundled json tables
+        """
+        tables = read_character_tables(PACKAGE)
+        files = sorted(glob.glob(os.path.join(TABLEDIR, '*.json')))
+        self.assertEqual(sorted(tables.keys()), 
+                         [os.path.splitext(os.path.basename(f))[0] for f in files])
+        for filename in files:
+            with open(filename) as f:
+                chartablelib = json.load(f)
+            name = os.path.splitext(os.path.basename(filename))[0]
+            self.assertEqual(tables[name]['classes'], chartablelib['classes'])
+            for g1,g2 in zip(tables[name]['symmetry_groups'], chartablelib['symmetry_groups']):
+                self.assertEqual(g1['symbol'], g2['symbol'])
+                np.testing.assert_equal(g1['characters'], g2['characters'])
+        
+        # the bundled package is up to date
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'charactertables.bin')
+            pack_character_tables(path)
+            with open(path, 'rb') as f1, open(PACKAGE, 'rb') as f2:
+                self.assertEqual(f1.read(), f2.read())
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import numpy as np
+import random
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, SymmetryOperations, \
+                      CharacterTable, ProjectionOperator
+
+class TestComputedCharacterTables(unittest.TestCase):
+    """
+    Test computing character tables from a set of operations
+    """
+
+    def test_tabulated_groups(self):
+        """
+        Computed tables agree with the tabulated and generated ones
+        """
+        tau = (1.0 + np.sqrt(5.0)) / 2.0
+        groups = {
+            'td': [('rotation', '3', [1,1,1], 2.0 * np.pi / 3),
+                   ('rotation', '2', [0,0,1], np.pi),
+                   ('mirror', 'd', np.array([1,-1,0]) / np.sqrt(2))],
+            'ih': [('rotation', '5', [0,1,tau], 2.0 * np.pi / 5),
+                   ('rotation', '3', [1,1,1], 2.0 * np.pi / 3),
+                   ('inversion',)],
+            'd6h': [('rotation', '6', [0,0,1], np.pi / 3),
+                    ('rotation', '2', [1,0,0], np.pi),
+                    ('mirror', 'h', [0,0,1])],
+            'c5': [('rotation', '5', [0,0,1], 2.0 * np.pi / 5)],
+        }
+        for name, generators in groups.items():
+            symops = self.build_group(generators)
+            ct = CharacterTable(name)
+            computed = CharacterTable.from_operations(symops)
+            self.assertEqual(computed.chartablelib['name'], name)
+            self.assertEqual(computed.order, ct.order)
+            np.testing.assert_almost_equal(computed.norms, ct.norms)
+            
+            # the same characters for every operation, up to the order of
+            # the irreps
+            chars = ct.table[:,symops.get_class_indices(ct)]
+            computedchars = computed.table[:,symops.get_class_indices(computed)]
+            np.testing.assert_almost_equal(chars[np.lexsort(chars.transpose()[::-1])],
+                                           computedchars[np.lexsort(computedchars.transpose()[::-1])])
+
+        # tables are cached by the structure of the group
+        computed = CharacterTable.from_operations(self.build_group(groups['ih']))
+        self.assertIs(CharacterTable.from_operations(self.build_group(groups['ih'])).chartablelib,
+                      computed.chartablelib)
+
+    def test_octahedral(self):
+        """
+        Build symmetry-adapted orbitals of SF6 without a tabulated table
+        """
+        mol = Molecule()
+        mol.add_atom('S', 0.0, 0.0, 0.0, unit='angstrom')
+        for v in np.vstack([np.identity(3), -np.identity(3)]) * 1.56:
+            mol.add_atom('F', *v, unit='angstrom')
+        
+        molset = {
+            'S': [BasisFunction(1,0,0),
+                  BasisFunction(2,0,0),
+                  BasisFunction(2,1,1),
+                  BasisFunction(2,1,-1),
+                  BasisFunction(2,1,0)],
+            'F': [BasisFunction(1,0,0),
+                  BasisFunction(2,1,1),
+                  BasisFunction(2,1,-1),
+                  BasisFunction(2,1,0)]
+        }
+        mol.build_basis(molset)
+        
+        symops, label, ctname = SymmetryOperations.detect(mol)
+        self.assertEqual(label, 'Oh')
+        self.assertIsNone(ctname)
+        symops.run()
+        
+        ct = CharacterTable.from_operations(symops)
+        self.assertEqual([ct.get_label_irrep(j) for j in range(ct.nrgroups)],
+                         ['A1g', 'A2g', 'Eg', 'T1g', 'T2g', 'A1u', 'A2u', 'Eu', 'T1u', 'T2u'])
+        lot = ct.lot(symops.characters(), symops.get_class_indices(ct))
+        np.testing.assert_almost_equal(lot, [4,0,2,1,1,0,0,0,4,1])
+        
+        random.seed(0)
+        po = ProjectionOperator(ct, symops)
+        salcs = po.build_salcs().toarray()
+        nbf = len(mol.basis)
+        np.testing.assert_almost_equal(salcs @ salcs.transpose(), np.identity(nbf))
+        for m in symops.operation_matrices:
+            newmat = salcs @ m @ salcs.transpose()
+            idx = 0
+            for b in po.get_block_sizes():
+                np.testing.assert_almost_equal(newmat[idx:idx+b,idx+b:], 0.0)
+                idx += b
+
+    def test_tetrahedral(self):
+        """
+        The group T holds a pair of complex conjugate irreps
+        """
+        symops = self.build_group([('rotation', '3', [1,1,1], 2.0 * np.pi / 3),
+                                   ('rotation', '2', [0,0,1], np.pi)])
+        ct = CharacterTable.from_operations(symops)
+        self.assertEqual(ct.chartablelib['name'], 't')
+        self.assertEqual([ct.get_label_irrep(j) for j in range(ct.nrgroups)], ['A', 'E', 'T'])
+        np.testing.assert_almost_equal(ct.norms, [1,2,1])
+        np.testing.assert_almost_equal(ct.table[:,0], [1,2,3])
+        self.assertEqual(ct.irreducible.shape, (4,4))
+
+    def test_labels(self):
+        """
+        Irreps are labelled A or B by the principal rotation and classes
+        carry unique symbols
+        """
+        symops = self.build_group([('rotation', '4', [0,0,1], np.pi / 2),
+                                   ('rotation', '2', [1,0,0], np.pi),
+                                   ('inversion',)])
+        ct = CharacterTable.from_operations(symops)
+        self.assertEqual([ct.get_label_irrep(j) for j in range(ct.nrgroups)],
+                         ['A1g', 'A2g', 'B1g', 'B2g', 'Eg', 'A1u', 'A2u', 'B1u', 'B2u', 'Eu'])
+        
+        symops = self.build_group([('rotation', '3', [1,1,1], 2.0 * np.pi / 3),
+                                   ('rotation', '2', [0,0,1], np.pi),
+                                   ('inversion',)])
+        ct = CharacterTable.from_operations(symops)
+        symbols = [c['symbol'] for c in ct.chartablelib['classes']]
+        self.assertEqual(symbols, ['E', 'C3', 'C3^2', 'C2', 'i', 'S6', 'S6^5', 'sigma'])
+        
+        # the name is part of the cache key
+        self.assertEqual(ct.chartablelib['name'], 'th')
+        self.assertEqual(CharacterTable.from_operations(symops, name='test').chartablelib['name'], 'test')
+        self.assertEqual(CharacterTable.from_operations(symops).chartablelib['name'], 'th')
+
+    def build_group(self, generators):
+        symops = SymmetryOperations(None)
+        symops.add('identity')
+        symops.add_generators(generators)
+        
+        return symops
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,246 @@
+import unittest
+import numpy as np
+import random
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, SymmetryOperations, \
+                      CharacterTable, ProjectionOperator, conjugacy_classes, \
+                      class_constants
+from helpers import build_ammonia
+
+class TestConjugacyClasses(unittest.TestCase):
+    """
+    Test assignment of operations to the classes of a character table
+    """
+
+    def test_ammonia_shuffled(self):
+        """
+        Operations listed in arbitrary order are matched to their classes
+        """
+        symops = build_ammonia('p')
+        ct = CharacterTable('c3v')
+        np.testing.assert_equal(symops.get_conjugacy_classes(), [0,1,1,2,2,2])
+        np.testing.assert_equal(symops.get_class_indices(ct), [0,1,1,2,2,2])
+
+        order = [3,1,5,0,4,2]
+        symops.operations = [symops.operations[k] for k in order]
+        np.testing.assert_equal(symops.get_class_indices(ct), [2,1,2,0,2,1])
+
+        symops.run()
+        traces = np.trace(symops.operation_matrices, axis1=1, axis2=2)
+        np.testing.assert_almost_equal(ct.lot(traces, symops.get_class_indices(ct)), [2,0,2])
+
+        # the projection operator does not depend on the order
+        random.seed(0)
+        po = ProjectionOperator(ct, symops)
+        mos = po.build_mos()
+        np.testing.assert_almost_equal(mos @ mos.transpose(), np.identity(6))
+        self.assertEqual(sorted(set(b[2] for b in po.get_blocks())), ['A1', 'E'])
+        self.assertEqual(sum(b[0] for b in po.get_blocks()), 6)
+
+        # sorting restores the class order of the character table
+        symops.sort_by_classes(ct)
+        self.assertEqual(symops.operations[0].name, 'E')
+        symops.run()
+        traces = np.trace(symops.operation_matrices, axis1=1, axis2=2)
+        np.testing.assert_almost_equal(ct.lot(traces), [2,0,2])
+
+    def test_axis_labels(self):
+        """
+        Classes with identical signatures are told apart by their axes
+        """
+        mol = Molecule()
+        mol.add_atom('C', -0.6530176758,  0.0000000000 ,0.0000000000, unit='angstrom')
+        mol.add_atom('C',  0.6530176758,  0.0000000000 ,0.0000000000, unit='angstrom')
+        mol.add_atom('H', -1.2288875372, -0.9156191261 ,0.0000000000, unit='angstrom')
+        mol.add_atom('H', -1.2288875372,  0.9156191261 ,0.0000000000, unit='angstrom')
+        mol.add_atom('H',  1.2288875372,  0.9156191261 ,0.0000000000, unit='angstrom')
+        mol.add_atom('H',  1.2288875372, -0.9156191261 ,0.0000000000, unit='angstrom')
+        mol.build_basis({'C': [BasisFunction(1,0,0),
+                               BasisFunction(2,0,0),
+                               BasisFunction(2,1,1),
+                               BasisFunction(2,1,-1),
+                               BasisFunction(2,1,0)],
+                         'H': [BasisFunction(1,0,0)]})
+        
+        symops = SymmetryOperations(mol)
+        symops.add('identity')
+        symops.add('rotation', '2(x)', np.array([1,0,0]), np.pi)
+        symops.add('rotation', '2(y)', np.array([0,1,0]), np.pi)
+        symops.add('rotation', '2(z)', np.array([0,0,1]), np.pi)
+        symops.add('inversion')
+        symops.add('mirror', 'v(yz)', np.array([1,0,0]))
+        symops.add('mirror', 'v(xz)', np.array([0,1,0]))
+        symops.add('mirror', 'v(xy)', np.array([0,0,1]))
+        symops.run()
+        
+        ct = CharacterTable('d2h')
+        np.testing.assert_equal(symops.get_class_indices(ct, keep_order=False), [0,3,2,1,4,7,6,5])
+        np.testing.assert_almost_equal(ct.lot(symops.characters(),
+                                              symops.get_class_indices(ct, keep_order=False)),
+                                       [4,2,1,0,0,1,2,4])
+
+        # unless requested otherwise, operations listed in the class order
+        # of the table keep their order
+        np.testing.assert_equal(symops.get_class_indices(ct), np.arange(8))
+        self.assert_order_independent(symops, ct)
+        
+        # benzene (D6h) with the C2' axes through the carbon atoms
+        mol = Molecule()
+        for i in range(6):
+            phi = i * np.pi / 3
+            mol.add_atom('C', 2.6 * np.cos(phi), 2.6 * np.sin(phi), 0.0)
+            mol.add_atom('H', 4.7 * np.cos(phi), 4.7 * np.sin(phi), 0.0)
+        mol.build_basis({'C': [BasisFunction(2,1,1),
+                               BasisFunction(2,1,-1),
+                               BasisFunction(2,1,0)],
+                         'H': [BasisFunction(1,0,0)]})
+        symops, _, ctname = SymmetryOperations.detect(mol)
+        symops.run()
+        ct = CharacterTable(ctname)
+        lot = ct.lot(symops.characters(), symops.get_class_indices(ct))
+        labels = [ct.get_label_irrep(j) for j in range(ct.nrgroups)]
+        lot = dict(zip(labels, lot))
+        self.assertEqual((lot['B2g'], lot['B1g']), (1,0))  # pz orbitals
+        self.assertEqual((lot['B1u'], lot['B2u']), (2,1))  # radial and tangential
+        self.assert_order_independent(symops, ct)
+        
+        # away from the standard orientation, C2' and C2'' cannot be told
+        # apart
+        rot = SymmetryOperations(None)
+        rot.add('rotation', '', np.array([0,0,1]), 0.3)
+        mol.positions[:] = mol.positions @ rot.get_matrices()[0].transpose()
+        symops = SymmetryOperations.detect(mol)[0]
+        with self.assertRaisesRegex(RuntimeError, 'Ambiguous'):
+            symops.get_class_indices(ct)
+
+    def test_table_order(self):
+        """
+        Operations listed in the class order of the character table are
+        assigned by their position, also when this deviates from the
+        orientation conventions of the table
+        """
+        # benzene with the C2' axes and sigma_v planes through the carbon
+        # atoms along the y-axis
+        mol = Molecule()
+        for i in range(6):
+            phi = i * np.pi / 3
+            mol.add_atom('C', 1.3868467444 * np.sin(phi), -1.3868467444 * np.cos(phi), 0.0,
+                         unit='angstrom')
+        for i in range(6):
+            phi = i * np.pi / 3
+            mol.add_atom('H', 2.4694205285 * np.sin(phi), -2.4694205285 * np.cos(phi), 0.0,
+                         unit='angstrom')
+        mol.build_basis({'C': [BasisFunction(2,0,0), BasisFunction(2,1,0)],
+                         'H': [BasisFunction(1,0,0)]})
+
+        z = np.array([0,0,1])
+        inplane = lambda phi: np.array([np.sin(phi), -np.cos(phi), 0.0])
+        symops = SymmetryOperations(mol)
+        symops.add('identity')
+        for n in [6,3,2]:
+            for sign in ([1] if n == 2 else [1,-1]):
+                symops.add('rotation', '%i' % n, z, sign * 2.0 * np.pi / n)
+        for i in range(3):
+            symops.add('rotation', "2'", inplane(2.0 * np.pi * i / 6), np.pi)
+        for i in range(3):
+            symops.add('rotation', "2''", inplane(2.0 * np.pi * (i / 6 + 1 / 12)), np.pi)
+        symops.add('inversion')
+        for n in [3,6]:
+            for sign in [1,-1]:
+                symops.add('improper', '%i' % n, z, sign * 2.0 * np.pi / n)
+        symops.add('mirror', 'h', z)
+        for i in range(3):
+            symops.add('mirror', 'd', inplane(2.0 * np.pi * (i / 6 + 1 / 12) + np.pi / 2))
+        for i in range(3):
+            symops.add('mirror', 'v', inplane(2.0 * np.pi * i / 6 + np.pi / 2))
+        symops.run()
+
+        ct = CharacterTable('d6h')
+        np.testing.assert_equal(symops.get_class_indices(ct),
+                                np.repeat(np.arange(ct.nrclasses), ct.sizes))
+        traces = np.trace(symops.operation_matrices, axis1=1, axis2=2)
+        np.testing.assert_almost_equal(ct.lot(traces, symops.get_class_indices(ct)), ct.lot(traces))
+
+        # the projection operator yields the textbook irreps
+        random.seed(0)
+        po = ProjectionOperator(ct, symops)
+        po.build_mos()
+        labels = [ct.get_label_irrep(j) for j in range(ct.nrgroups)]
+        irreps = {mol.basis.names[g[0]]: sorted(labels[j] for j in np.flatnonzero(n))
+                  for g,n in zip(po.groups, po.irreps)}
+        self.assertEqual(irreps, {'C2s': ['A1g', 'B1u', 'E1u', 'E2g'],
+                                  'C2pz': ['A2u', 'B2g', 'E1g', 'E2u'],
+                                  'H1s': ['A1g', 'B1u', 'E1u', 'E2g']})
+
+    def test_cyclic(self):
+        """
+        Classes C_n^k and C_n^(n-k) share their signature and characters and
+        need no resolution, also for large n
+        """
+        symops = SymmetryOperations(None)
+        symops.add_generators([('rotation', '48', np.array([0,0,1]), 2.0 * np.pi / 48),
+                               ('mirror', 'h', np.array([0,0,1]))])
+        rng = np.random.default_rng(2)
+        symops.operations = [symops.operations[k] for k in rng.permutation(96)]
+        symops.products = None
+
+        ct = CharacterTable('c48h')
+        lot = ct.lot(np.trace(symops.get_matrices(), axis1=1, axis2=2), symops.get_class_indices(ct))
+        labels = [ct.get_label_irrep(j) for j in range(ct.nrgroups)]
+        self.assertEqual(sorted(labels[j] for j in np.flatnonzero(lot)), ['Au', 'E1u'])
+
+    def assert_order_independent(self, symops, ct):
+        """
+        Reduction of the representation does not depend on the order of
+        the operations
+        """
+        reference = ct.lot(symops.characters(), symops.get_class_indices(ct, keep_order=False))
+        rng = np.random.default_rng(1)
+        for _ in range(5):
+            order = rng.permutation(len(symops.operations))
+            symops.operations = [symops.operations[k] for k in order]
+            symops.products = None
+            symops.multiplication_table = None
+            symops.run()
+            np.testing.assert_almost_equal(ct.lot(symops.characters(), symops.get_class_indices(ct)),
+                                           reference)
+
+    def test_class_constants(self):
+        """
+        Class multiplication coefficients from the group and from the
+        character table agree
+        """
+        symops = SymmetryOperations(None)
+        phi = (1.0 + np.sqrt(5.0)) / 2.0
+        symops.add_generators([('rotation', '5', np.array([0,1,phi]), 2.0 * np.pi / 5),
+                               ('rotation', '3', np.array([1,1,1]), 2.0 * np.pi / 3),
+                               ('inversion',)])
+        self.assertEqual(len(symops.operations), 120)
+
+        ct = CharacterTable('ih')
+        symops.sort_by_classes(ct)
+        labels = symops.get_conjugacy_classes()
+        np.testing.assert_equal(np.bincount(labels),
+                                [c['multiplicity'] for c in ct.chartablelib['classes']])
+        np.testing.assert_almost_equal(class_constants(symops.multiplication_table, labels),
+                                       ct.get_class_constants())
+
+        # a set of operations that does not form the group is rejected
+        symops.operations = symops.operations[:60]
+        with self.assertRaises(RuntimeError):
+            symops.get_class_indices(ct)
+
+    def test_conjugacy_classes(self):
+        # multiplication table of S3 ~ C3v
+        mt = build_ammonia('p').get_multiplication_table()
+        np.testing.assert_equal(conjugacy_classes(mt), [0,1,1,2,2,2])
+
+
+if __name__ == '__main__':
+    unittest.main()
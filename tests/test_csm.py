@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, SymmetryOperations, continuous_symmetry_measure
+from helpers import build_ammonia
+
+class TestCSM(unittest.TestCase):
+    """
+    Test the continuous symmetry measure of trajectories
+    """
+
+    def test_mirror(self):
+        symops = SymmetryOperations(None)
+        symops.add('identity')
+        symops.add('mirror', 'h', np.array([0,0,1]))
+        positions = np.array([[0,0,0.3], [1,0,0], [-1,0,0]])
+        self.assertAlmostEqual(continuous_symmetry_measure(positions, symops),
+                               100.0 * 0.06 / 2.06)
+
+    def test_trajectory(self):
+        mol = Molecule()
+        mol.add_atom('N', 0.00000000, 0.00000000, -0.06931370, unit='angstrom')
+        mol.add_atom('H', 0.00000000, 0.94311105,  0.32106944, unit='angstrom')
+        mol.add_atom('H', -0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+        mol.add_atom('H', 0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+        symops = SymmetryOperations(mol)
+        symops.add('identity')
+        symops.add('rotation', '3+', np.array([0,0,1]), 2.0 * np.pi / 3)
+        symops.add('rotation', '3-', -np.array([0,0,1]), 2.0 * np.pi / 3)
+        for i in range(0,3):
+            symops.add('mirror', 'v%i' % (i+1), np.array([np.cos(i * 2.0 * np.pi / 3),
+                                                          np.sin(i * 2.0 * np.pi / 3),
+                                                          0.0]))
+
+        # frames with increasing distortion
+        rng = np.random.default_rng(2)
+        noise = rng.normal(size=mol.positions.shape)
+        scales = np.linspace(0.0, 0.05, 11)
+        frames = mol.positions[None] + scales[:,None,None] * noise[None]
+        frames[3] += [1.0, 2.0, 3.0]    # translation does not matter
+
+        csm = continuous_symmetry_measure(frames, symops, mol.elements)
+        self.assertEqual(csm.shape, (11,))
+        self.assertAlmostEqual(csm[0], 0.0)
+        self.assertTrue(np.all(np.diff(csm) > 0))
+        np.testing.assert_almost_equal(continuous_symmetry_measure(frames, symops, mol.elements,
+                                                                   method='hungarian'), csm)
+
+        # the chunk size bounds the number of (frame, operation, atom)
+        # combinations, yet never drops below a single frame
+        for chunksize in (1, 4 * 6 * 4, 4 * 6 * 4 + 1):
+            np.testing.assert_almost_equal(continuous_symmetry_measure(frames, symops, mol.elements,
+                                                                       chunksize=chunksize), csm)
+
+        # the order of the atoms does not matter
+        order = [2,0,3,1]
+        np.testing.assert_almost_equal(continuous_symmetry_measure(frames[:,order], symops,
+                                                                   mol.elements[order]), csm)
+
+        # atoms are not mapped onto atoms of other elements
+        elements = [0,0,1,1]
+        self.assertGreater(continuous_symmetry_measure(frames[0], symops, elements), 1.0)
+
+    def test_detected(self):
+        """
+        Operations detected for a molecule away from the origin carry
+        translations, which do not affect the measure
+        """
+        ref = build_ammonia()
+        mol = ref.mol
+        mol.positions[:] += [1.0, 2.0, 3.0]
+        symops = SymmetryOperations.detect(mol)[0]
+        self.assertTrue(np.any(symops.get_translations() != 0.0))
+
+        rng = np.random.default_rng(4)
+        frames = mol.positions[None] + rng.normal(scale=0.02, size=(5,) + mol.positions.shape)
+        csm = continuous_symmetry_measure(frames, symops, mol.elements)
+        self.assertAlmostEqual(continuous_symmetry_measure(mol.positions, symops, mol.elements), 0.0)
+        np.testing.assert_almost_equal(csm, continuous_symmetry_measure(frames, ref, mol.elements))
+
+        # translations that do not leave a common point in place are not
+        # point operations
+        screw = SymmetryOperations(None)
+        screw.add('identity')
+        screw.add('rotation', '2', np.array([0,0,1]), np.pi, translation=[0.0, 0.0, 1.0])
+        with self.assertRaises(RuntimeError):
+            continuous_symmetry_measure(frames, screw)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,8 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 # import functions
-from sphecerix import Molecule, BasisFunction, SymmetryOperations
+from sphecerix import Molecule, BasisFunction, SymmetryOperations, match_atoms, \
+                      atom_orbits
 
 class TestEthyleneSymmetryOperations(unittest.TestCase):
     """
@@ -47,6 +48,50 @@ class TestEthyleneSymmetryOperations(unittest.TestCase):
         
         result = np.load(os.path.join(os.path.dirname(__file__), 'results', 'ethylene.npy'))
         np.testing.assert_almost_equal(symops.operation_matrices, result)
+        
+        # atoms mapped under C2(z) and sigma(xz)
+        np.testing.assert_equal(symops.atomic_transformations[1], [1,0,4,5,2,3])
+        np.testing.assert_equal(symops.atomic_transformations[6], [0,1,3,2,5,4])
+        
+        # symmetry-unique atoms and their site symmetry
+        orbits, representatives = symops.get_orbits()
+        np.testing.assert_equal(orbits, [0,0,1,1,1,1])
+        np.testing.assert_equal(representatives, [0,2])
+        stabilisers = symops.get_stabilisers()
+        np.testing.assert_equal(stabilisers[0], [0,3,5,6])
+        np.testing.assert_equal(stabilisers[1], [0,5])
+        
+        # orbits follow from the generators only
+        orbits, representatives = atom_orbits(symops.atomic_transformations[[1,6]])
+        np.testing.assert_equal(orbits, [0,0,1,1,1,1])
+        
+    def test_invalid_operation(self):
+        """
+        A C3 rotation does not map ethylene onto itself
+        """
+        mol = Molecule()
+        mol.add_atom('C', -0.6530176758,  0.0000000000 ,0.0000000000, unit='angstrom')
+        mol.add_atom('C',  0.6530176758,  0.0000000000 ,0.0000000000, unit='angstrom')
+        mol.build_basis({'C': [BasisFunction(1,0,0)]})
+        
+        symops = SymmetryOperations(mol)
+        symops.add('identity')
+        symops.add('rotation', '3(z)', np.array([0,0,1]), 2.0 * np.pi / 3)
+        with self.assertRaisesRegex(RuntimeError, expected_regex='Operation C3\\(z\\) does not map atom 0'):
+            symops.run()
+            
+    def test_match_atoms_cluster(self):
+        """
+        Match atoms for a large centrosymmetric cluster
+        """
+        rng = np.random.default_rng(5)
+        half = rng.uniform(-30, 30, (5000,3))
+        positions = np.vstack([half, -half])
+        
+        matrices = np.array([np.identity(3), -np.identity(3)])
+        perm = match_atoms(positions, matrices)
+        np.testing.assert_equal(perm[0], np.arange(10000))
+        np.testing.assert_equal(perm[1], np.concatenate([np.arange(5000,10000), np.arange(5000)]))
 
 if __name__ == '__main__':
     unittest.main()
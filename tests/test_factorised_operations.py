@@ -0,0 +1,153 @@
+import unittest
+import numpy as np
+import random
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import BasisFunction, \
+                      CharacterTable, ProjectionOperator
+from helpers import build_ammonia
+
+class TestFactorisedOperations(unittest.TestCase):
+    """
+    Test the factorised (permutation x Wigner-D) representation of the
+    operation matrices against the dense tensor
+    """
+
+    def test_dense_equivalence(self):
+        symops = build_ammonia('extended')
+        symops.run()
+        fo = symops.factorised
+        mats = symops.operation_matrices
+        nbf = len(symops.mol.basis)
+
+        self.assertEqual(len(fo), 6)
+        np.testing.assert_almost_equal(fo.to_dense(), mats)
+        np.testing.assert_almost_equal(fo.traces(), np.trace(mats, axis1=1, axis2=2))
+        np.testing.assert_almost_equal(fo.diagonals(), np.diagonal(mats, axis1=1, axis2=2))
+
+        rng = np.random.default_rng(3)
+        x = rng.normal(size=nbf)
+        X = rng.normal(size=(nbf, 4))
+        for k in range(len(fo)):
+            np.testing.assert_almost_equal(fo.matvec(k, x), mats[k] @ x)
+            np.testing.assert_almost_equal(fo.matmat(k, X), mats[k] @ X)
+            np.testing.assert_almost_equal(fo.rmatvec(k, x), x @ mats[k])
+            self.assertAlmostEqual(fo.trace(k), np.trace(mats[k]))
+
+        # products of two operations
+        for k1 in range(len(fo)):
+            for k2 in range(len(fo)):
+                np.testing.assert_almost_equal(fo.product(k1, k2).dense(0),
+                                               mats[k1] @ mats[k2])
+
+        # weighted sum of rows as used by the projection operator
+        w = rng.normal(size=len(fo))
+        for i in [0, 3, 7, nbf-1]:
+            np.testing.assert_almost_equal(fo.weighted_row(i, w),
+                                           np.einsum('k,kj->j', w, mats[:,i,:]))
+
+    def test_lazy_operation_matrices(self):
+        """
+        Operation matrices are constructed on access in lazy mode
+        """
+        symops = build_ammonia('extended')
+        symops.run()
+        mats = symops.operation_matrices
+
+        for cache in [False, True]:
+            lazy = build_ammonia('extended', lazy=True, cache=cache)
+            lazy.run()
+            self.assertEqual(len(lazy.operation_matrices), 6)
+            self.assertEqual(lazy.operation_matrices.shape, mats.shape)
+            np.testing.assert_almost_equal(lazy.operation_matrices[2], mats[2])
+            np.testing.assert_almost_equal(lazy.operation_matrices[-1], mats[-1])
+            np.testing.assert_almost_equal(lazy.operation_matrices[1:4], mats[1:4])
+            np.testing.assert_almost_equal(np.trace(lazy.operation_matrices, axis1=1, axis2=2),
+                                           np.trace(mats, axis1=1, axis2=2))
+            self.assertEqual(lazy.operation_matrices[3] is lazy.operation_matrices[3], cache)
+
+            for m1,m2 in zip(lazy.iter_operation_matrices(), mats):
+                np.testing.assert_almost_equal(m1, m2)
+
+        for m1,m2 in zip(symops.iter_operation_matrices(), mats):
+            np.testing.assert_almost_equal(m1, m2)
+
+    def test_projection_operator(self):
+        """
+        Build symmetry-adapted orbitals without any dense operation matrices
+        """
+        symops = build_ammonia('extended')
+        symops.run(dense=False)
+        self.assertIsNone(symops.operation_matrices)
+
+        random.seed(0)
+        po = ProjectionOperator(CharacterTable('c3v'), symops)
+        mos = po.build_mos()
+
+        # orbitals are orthonormal and block-diagonalize all operations
+        nbf = len(symops.mol.basis)
+        np.testing.assert_almost_equal(mos @ mos.transpose(), np.identity(nbf))
+        self.assertEqual(sum(b[0] for b in po.get_blocks()), nbf)
+        mats = symops.factorised.to_dense()
+        for m in mats:
+            newmat = mos @ m @ mos.transpose()
+            idx = 0
+            for b in po.get_block_sizes():
+                np.testing.assert_almost_equal(newmat[idx:idx+b,idx+b:], 0.0)
+                idx += b
+
+    def test_salcs(self):
+        """
+        Build symmetry-adapted orbitals per orbit of equivalent shells
+        """
+        symops = build_ammonia('extended')
+        symops.run(dense=False)
+
+        ct = CharacterTable('c3v')
+        po = ProjectionOperator(ct, symops)
+        salcs = po.build_salcs()
+        nbf = len(symops.mol.basis)
+        self.assertEqual(salcs.shape, (nbf, nbf))
+
+        # irreps per orbit of shells add up to those of the full basis
+        np.testing.assert_almost_equal(np.sum(po.irreps, axis=0),
+                                       ct.lot(symops.characters()))
+
+        mos = salcs.toarray()
+        np.testing.assert_almost_equal(mos @ mos.transpose(), np.identity(nbf))
+        for m in symops.factorised.to_dense():
+            newmat = mos @ m @ mos.transpose()
+            idx = 0
+            for b in po.get_block_sizes():
+                np.testing.assert_almost_equal(newmat[idx:idx+b,idx+b:], 0.0)
+                idx += b
+
+    def test_characters(self):
+        """
+        Characters follow from the fixed atoms without operation matrices
+        """
+        symops = build_ammonia('extended')
+        symops.run()
+        np.testing.assert_almost_equal(symops.characters(),
+                                       np.trace(symops.operation_matrices, axis1=1, axis2=2))
+
+        # incomplete shells and higher angular momenta
+        mol = symops.mol
+        molset = {
+            'N': [BasisFunction(3,2,m) for m in [-2,0,1]] +
+                 [BasisFunction(4,3,m) for m in range(-3,4)],
+            'H': [BasisFunction(1,0,0), BasisFunction(2,1,0)]
+        }
+        mol.build_basis(molset)
+        symops.run()
+        np.testing.assert_almost_equal(symops.characters(),
+                                       np.trace(symops.operation_matrices, axis1=1, axis2=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
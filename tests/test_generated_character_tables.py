@@ -0,0 +1,165 @@
+import unittest
+import numpy as np
+import random
+import json
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, SymmetryOperations, \
+                      CharacterTable, ProjectionOperator
+from sphecerix.character_table_generator import generate_character_table, \
+                                                is_generatable
+
+class TestGeneratedCharacterTables(unittest.TestCase):
+    """
+    Test the analytical construction of character tables
+    """
+
+    def test_orthogonality(self):
+        for n in range(1,13):
+            for fmt in ['c%i', 'c%iv', 'c%ih', 'd%i', 'd%id', 'd%ih', 's%i']:
+                name = fmt % n
+                if not is_generatable(name):
+                    continue
+                ct = CharacterTable(name, generate_character_table(name))
+                
+                # the order follows from the family
+                factor = 4 if fmt in ['d%id', 'd%ih'] else 2 if fmt in ['c%iv', 'c%ih', 'd%i'] else 1
+                self.assertEqual(ct.order, factor * n, name)
+                
+                # one row per irrep or per pair of complex irreps
+                self.assertEqual(len(ct.irreducible), ct.nrclasses, name)
+                np.testing.assert_almost_equal(np.sum(ct.table[:,0]**2 / ct.norms), ct.order)
+                
+                # class constants are non-negative integers
+                sizes = np.array([c['multiplicity'] for c in ct.chartablelib['classes']])
+                constants = ct.get_class_constants()
+                np.testing.assert_almost_equal(constants, np.round(constants))
+                self.assertTrue(np.all(np.round(constants) >= 0))
+                np.testing.assert_almost_equal(constants @ sizes, np.outer(sizes, sizes))
+
+        for name in ['c1v', 's3', 'd1h', 'o', 'th', 'c', 'cs2']:
+            self.assertFalse(is_generatable(name))
+        self.assertTrue(CharacterTable.exists('c5v'))
+        self.assertFalse(CharacterTable.exists('c1v'))
+        with self.assertRaises(RuntimeError):
+            CharacterTable('c1v')
+
+        # tables are cached and cannot be modified
+        table = generate_character_table('d5h')
+        self.assertIs(generate_character_table('d5h'), table)
+        with self.assertRaises(TypeError):
+            table['name'] = 'c5v'
+        with self.assertRaises(TypeError):
+            table['classes'][0]['multiplicity'] = 2
+        with self.assertRaises(ValueError):
+            table['irreducible_characters'][0,0] = 2.0
+
+    def test_json_tables(self):
+        """
+        Generated tables agree with those read from the json files
+        """
+        def ring(symbol, n, r, z=0.0):
+            return [(symbol, r * np.cos(2.0 * np.pi * i / n), r * np.sin(2.0 * np.pi * i / n), z)
+                    for i in range(n)]
+
+        molecules = {
+            'c3v': [('N',0.0,0.0,-0.13)] + ring('H',3,1.78,0.61),
+            'd6h': ring('C',6,2.6) + ring('H',6,4.7),
+        }
+        for name, atoms in molecules.items():
+            mol = self.build_molecule(atoms)
+            symops, _, ctname = SymmetryOperations.detect(mol)
+            self.assertEqual(ctname, name)
+            symops.run()
+            
+            ct = CharacterTable(name)
+            generated = CharacterTable(name, generate_character_table(name))
+            lot = ct.lot(symops.characters(), symops.get_class_indices(ct))
+            genlot = generated.lot(symops.characters(), symops.get_class_indices(generated))
+            labels = [ct.get_label_irrep(j) for j in range(ct.nrgroups)]
+            genlabels = [generated.get_label_irrep(j) for j in range(generated.nrgroups)]
+            self.assertEqual(sorted(labels), sorted(genlabels))
+            self.assertEqual(dict(zip(labels, lot)), dict(zip(genlabels, genlot)))
+
+    def test_d2h(self):
+        """
+        The classes of D2 and D2h are named after the coordinate axes
+        """
+        with open(os.path.join(os.path.dirname(__file__), '..', 'sphecerix',
+                               'charactertables', 'd2h.json')) as f:
+            reference = json.load(f)
+        table = generate_character_table('d2h')
+        symbols = [c['symbol'].replace('sigma_h', 'sigma(xy)') for c in table['classes']]
+        order = [symbols.index(c['symbol']) for c in reference['classes']]
+        characters = {g['symbol']: np.array(g['characters'])[order] for g in table['symmetry_groups']}
+        for g in reference['symmetry_groups']:
+            np.testing.assert_almost_equal(characters[g['symbol']], g['characters'])
+
+    def test_complex_irreps(self):
+        """
+        Build symmetry-adapted orbitals of a C5h molecule; the E1 and E2
+        representations combine pairs of complex irreps
+        """
+        atoms = []
+        for i in range(5):
+            phi = 2.0 * np.pi * i / 5
+            atoms.append(('C', 2.3 * np.cos(phi), 2.3 * np.sin(phi), 0.0))
+            atoms.append(('H', 3.9 * np.cos(phi + 0.3), 3.9 * np.sin(phi + 0.3), 0.0))
+        mol = self.build_molecule(atoms)
+        
+        symops, label, ctname = SymmetryOperations.detect(mol)
+        self.assertEqual((label, ctname), ('C5h', 'c5h'))
+        symops.run()
+        
+        ct = CharacterTable(ctname)
+        self.assertEqual([ct.get_label_irrep(j) for j in range(ct.nrgroups)],
+                         ["A'", "E1'", "E2'", "A''", "E1''", "E2''"])
+        np.testing.assert_almost_equal(ct.norms, [1,2,2,1,2,2])
+        
+        # s orbitals and the in-plane p orbitals yield the ' irreps; each
+        # orbit of five functions spans every irrep (or pair) once
+        classes = symops.get_class_indices(ct)
+        nbf = len(mol.basis)
+        np.testing.assert_almost_equal(ct.lot(symops.characters(), classes), 
+                                       [5,5,5,1,1,1])
+        
+        random.seed(0)
+        po = ProjectionOperator(ct, symops)
+        salcs = po.build_salcs().toarray()
+        np.testing.assert_almost_equal(salcs @ salcs.transpose(), np.identity(nbf))
+        for m in symops.operation_matrices:
+            newmat = salcs @ m @ salcs.transpose()
+            idx = 0
+            for b in po.get_block_sizes():
+                np.testing.assert_almost_equal(newmat[idx:idx+b,idx+b:], 0.0)
+                idx += b
+
+    def build_molecule(self, atoms):
+        mol = Molecule()
+        for atom in atoms:
+            mol.add_atom(*atom, unit='bohr')
+        
+        molset = {
+            'C': [BasisFunction(1,0,0),
+                  BasisFunction(2,0,0),
+                  BasisFunction(2,1,1),
+                  BasisFunction(2,1,-1),
+                  BasisFunction(2,1,0)],
+            'N': [BasisFunction(1,0,0),
+                  BasisFunction(2,0,0),
+                  BasisFunction(2,1,1),
+                  BasisFunction(2,1,-1),
+                  BasisFunction(2,1,0)],
+            'H': [BasisFunction(1,0,0)]
+        }
+        mol.build_basis(molset)
+        
+        return mol
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, SymmetryOperations, \
+                      CharacterTable, generate_group, multiplication_table
+
+class TestGroupGenerators(unittest.TestCase):
+    """
+    Test building complete groups from their generators
+    """
+
+    def test_ammonia(self):
+        mol = Molecule()
+        mol.add_atom('N', 0.00000000, 0.00000000, -0.06931370, unit='angstrom')
+        mol.add_atom('H', 0.00000000, 0.94311105,  0.32106944, unit='angstrom')
+        mol.add_atom('H', -0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+        mol.add_atom('H', 0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+
+        molset = {
+            'N': [BasisFunction(1,0,0),
+                  BasisFunction(2,0,0),
+                  BasisFunction(2,1,1),
+                  BasisFunction(2,1,-1),
+                  BasisFunction(2,1,0)] +
+                 [BasisFunction(3,2,m) for m in range(-2,3)],
+            'H': [BasisFunction(1,0,0)]
+        }
+        mol.build_basis(molset)
+
+        symops = SymmetryOperations(mol)
+        symops.add_generators([('rotation', '3', np.array([0,0,1]), 2.0 * np.pi / 3),
+                               ('mirror', 'v', np.array([1,0,0]))])
+        self.assertEqual(len(symops.operations), 6)
+        self.assertEqual(symops.operations[0].name, 'E')
+        self.assertIn('σv', [op.name for op in symops.operations[3:]])
+        self.assertEqual(np.sum(symops.products[:,0] >= 0), 3)
+        symops.run()
+
+        # products of the generator representations equal the Wigner-D
+        # matrices of the operations
+        direct = SymmetryOperations(mol)
+        direct.operations = symops.operations
+        direct.run()
+        np.testing.assert_almost_equal(symops.operation_matrices, direct.operation_matrices)
+
+        ct = CharacterTable('c3v')
+        np.testing.assert_almost_equal(ct.lot(np.trace(symops.operation_matrices, axis1=1, axis2=2)),
+                                       [5,0,4])
+
+    def test_octahedral(self):
+        symops = SymmetryOperations(None)
+        symops.add_generators([('rotation', '4', np.array([0,0,1]), np.pi / 2),
+                               ('rotation', '3', np.ones(3), 2.0 * np.pi / 3),
+                               ('inversion',)])
+        self.assertEqual(len(symops.operations), 48)
+
+        # every row and column of the multiplication table is a permutation
+        mt = symops.multiplication_table
+        np.testing.assert_equal(np.sort(mt, axis=0), np.repeat(np.arange(48)[:,None], 48, axis=1))
+        np.testing.assert_equal(np.sort(mt, axis=1), np.repeat(np.arange(48)[None,:], 48, axis=0))
+        mats = symops.get_matrices()
+        np.testing.assert_almost_equal(mats[mt[5,17]], mats[5] @ mats[17])
+
+    def test_generate_group(self):
+        c2 = np.diag([-1.0, -1.0, 1.0])
+        sigma = np.diag([1.0, -1.0, 1.0])
+        matrices, products = generate_group([c2, sigma, c2])
+        self.assertEqual(len(matrices), 4)
+        np.testing.assert_equal(products[:3], -1)
+        for k,(a,b) in enumerate(products[3:]):
+            np.testing.assert_almost_equal(matrices[3+k], matrices[a] @ matrices[b])
+
+        mt = multiplication_table(matrices)
+        np.testing.assert_equal(mt[0], np.arange(4))
+
+        # an incomplete set of operations is not a group
+        with self.assertRaises(RuntimeError):
+            multiplication_table(matrices[:3])
+
+        # rotation over an irrational angle does not generate a finite group
+        rot = SymmetryOperations(None)
+        rot.add('rotation', '', np.array([0,0,1]), 1.0)
+        with self.assertRaises(RuntimeError):
+            generate_group(rot.get_matrices(), maxorder=1000)
+
+if __name__ == '__main__':
+    unittest.main()
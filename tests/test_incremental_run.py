@@ -0,0 +1,99 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import BasisFunction, SymmetryOperations
+from helpers import build_ammonia
+
+class TestIncrementalRun(unittest.TestCase):
+    """
+    Test that repeated calls to run() after adding operations or extending
+    the basis set reproduce a full recompute
+    """
+
+    def test_add_operations(self):
+        mol = build_ammonia().mol
+        symops = SymmetryOperations(mol)
+        symops.add('identity')
+        symops.run()
+        for args in self.get_operations()[1:]:
+            symops.add(*args)
+            symops.run()
+            self.assert_equal_to_full(symops)
+
+        # factorised only, followed by a dense run
+        symops.operations = symops.operations[:4]
+        symops.run(dense=False)
+        self.assertIsNone(symops.operation_matrices)
+        for args in self.get_operations()[4:]:
+            symops.add(*args)
+        symops.run()
+        self.assert_equal_to_full(symops)
+
+    def test_extend_basis(self):
+        mol = build_ammonia().mol
+        symops = SymmetryOperations(mol)
+        for args in self.get_operations():
+            symops.add(*args)
+        symops.run()
+        perms = symops.atomic_transformations
+
+        molset = {
+            'N': [BasisFunction(1,0,0),
+                  BasisFunction(2,1,1),
+                  BasisFunction(2,1,-1),
+                  BasisFunction(2,1,0)] +
+                 [BasisFunction(3,2,m) for m in range(-2,3)],
+            'H': [BasisFunction(1,0,0),
+                  BasisFunction(2,1,0)]
+        }
+        mol.build_basis(molset)
+        symops.run()
+        self.assertIs(symops.atomic_transformations.base, perms.base)
+        self.assertEqual(symops.operation_matrices.shape, (6,15,15))
+        self.assert_equal_to_full(symops)
+
+        # moving the atoms invalidates all atom permutations
+        mol.positions[:] = mol.positions[:,[1,0,2]]
+        symops.operations = [symops.operations[k] for k in [0,1,2]]
+        symops.run()
+        self.assert_equal_to_full(symops)
+
+    def test_generators(self):
+        mol = build_ammonia().mol
+        symops = SymmetryOperations(mol)
+        symops.add('identity')
+        symops.run()
+        symops.add_generators([('rotation', '3', np.array([0,0,1]), 2.0 * np.pi / 3),
+                               ('mirror', 'v', np.array([1,0,0]))])
+        symops.run()
+        self.assert_equal_to_full(symops)
+
+    def assert_equal_to_full(self, symops):
+        full = SymmetryOperations(symops.mol)
+        full.operations = list(symops.operations)
+        full.run()
+        np.testing.assert_equal(symops.atomic_transformations, full.atomic_transformations)
+        np.testing.assert_almost_equal(symops.operation_matrices, full.operation_matrices)
+        for l,b in full.factorised.blocks.items():
+            np.testing.assert_almost_equal(symops.factorised.blocks[l], b)
+
+    def get_operations(self):
+        operations = [('identity',),
+                      ('rotation', '3+', np.array([0,0,1]), 2.0 * np.pi / 3),
+                      ('rotation', '3-', -np.array([0,0,1]), 2.0 * np.pi / 3)]
+        for i in range(0,3):
+            operations.append(('mirror', 'v%i' % (i+1), np.array([np.cos(i * 2.0 * np.pi / 3),
+                                                                  np.sin(i * 2.0 * np.pi / 3),
+                                                                  0.0])))
+
+        return operations
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, SymmetryOperations
+
+class TestMolecule(unittest.TestCase):
+    """
+    Test the array-backed storage of atoms in the Molecule class
+    """
+
+    def test_add_atom(self):
+        mol = Molecule()
+        mol.add_atom('N', 0.0, 0.0, -0.06931370, unit='angstrom')
+        mol.add_atom('H', 0.0, 0.94311105, 0.32106944, unit='angstrom')
+        mol.add_atom('H', -0.81675813, -0.47155553, 0.32106944)
+
+        self.assertEqual(mol.nratoms, 3)
+        self.assertEqual(mol.positions.shape, (3,3))
+        self.assertTrue(mol.positions.flags['C_CONTIGUOUS'])
+        self.assertEqual(mol.symbols, ['N', 'H'])
+        np.testing.assert_equal(mol.elements, [0,1,1])
+        np.testing.assert_equal(mol.charges, [0,0,0])
+
+        # compatibility view on the atoms
+        self.assertEqual(len(mol.atoms), 3)
+        self.assertEqual(mol.atoms[1][0], 'H')
+        np.testing.assert_almost_equal(mol.atoms[1][1],
+                                       np.array([0.0, 0.94311105, 0.32106944]) * 1.8897259886)
+        np.testing.assert_almost_equal(mol.atoms[2][1], [-0.81675813, -0.47155553, 0.32106944])
+
+        # the compatibility views are read-only, such that attempts to
+        # modify them fail instead of being silently lost; the positions
+        # are copies which do not alter the molecule
+        with self.assertRaises(AttributeError):
+            mol.atoms.append(('H', np.zeros(3)))
+        with self.assertRaises(TypeError):
+            mol.atoms[0][0] = 'C'
+        mol.atoms[0][1][0] = 1.0
+        self.assertEqual(mol.positions[0,0], 0.0)
+        with self.assertRaises(AttributeError):
+            mol.charges.append(0)
+        self.assertEqual(mol.charges, (0,0,0))
+
+        with self.assertRaises(RuntimeError):
+            mol.add_atom('H', 0.0, 0.0, 0.0, unit='nm')
+
+    def test_add_atoms(self):
+        nratoms = 10000
+        rng = np.random.default_rng(42)
+        positions = rng.uniform(-10, 10, (nratoms, 3))
+        symbols = np.where(np.arange(nratoms) % 3 == 0, 'C', 'H')
+
+        mol = Molecule()
+        mol.add_atom('O', 0.0, 0.0, 0.0)
+        mol.add_atoms(symbols, positions)
+
+        self.assertEqual(mol.nratoms, nratoms + 1)
+        self.assertEqual(mol.symbols, ['O', 'C', 'H'])
+        np.testing.assert_equal(mol.elements[1:], np.where(symbols == 'C', 1, 2))
+        np.testing.assert_almost_equal(mol.positions[1:], positions)
+
+        # symmetry operations refer to the positions without copying them
+        symops = SymmetryOperations(mol)
+        self.assertTrue(np.shares_memory(symops.positions, mol.positions))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, SymmetryOperations
+
+class TestParallelRun(unittest.TestCase):
+    """
+    Test that evaluating the operations with a pool of worker processes
+    yields the same result as the serial evaluation
+    """
+
+    def test_methane(self):
+        mol = self.build_methane()
+        ref = SymmetryOperations(mol)
+        ref.add_generators([('rotation', '3', np.ones(3), 2.0 * np.pi / 3),
+                            ('improper', '4', np.array([0,0,1]), np.pi / 2)])
+        self.assertEqual(len(ref.operations), 24)
+        ref.run()
+
+        symops = SymmetryOperations(mol)
+        symops.operations = ref.operations
+        symops.products = ref.products
+        symops.run(dense=False, workers=2)
+        symops.run(workers=3)
+        np.testing.assert_equal(symops.atomic_transformations, ref.atomic_transformations)
+        np.testing.assert_equal(symops.operation_matrices, ref.operation_matrices)
+
+        # operations added after a parallel run are processed incrementally
+        direct = SymmetryOperations(mol)
+        direct.operations = list(ref.operations)
+        direct.run()
+        symops = SymmetryOperations(mol)
+        symops.operations = ref.operations[:10]
+        symops.run(workers=2)
+        symops.operations = list(ref.operations)
+        symops.run(workers=2)
+        np.testing.assert_equal(symops.operation_matrices, direct.operation_matrices)
+
+    def build_methane(self):
+        mol = Molecule()
+        mol.add_atom('C', 0.0, 0.0, 0.0, unit='angstrom')
+        for v in [(1,1,1), (1,-1,-1), (-1,1,-1), (-1,-1,1)]:
+            mol.add_atom('H', *(0.63 * np.array(v)), unit='angstrom')
+
+        molset = {
+            'C': [BasisFunction(1,0,0),
+                  BasisFunction(2,0,0)] +
+                 [BasisFunction(2,1,m) for m in range(-1,2)] +
+                 [BasisFunction(3,2,m) for m in range(-2,3)],
+            'H': [BasisFunction(1,0,0)] +
+                 [BasisFunction(2,1,m) for m in range(-1,2)]
+        }
+        mol.build_basis(molset)
+
+        return mol
+
+if __name__ == '__main__':
+    unittest.main()
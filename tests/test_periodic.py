@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, SymmetryOperations, match_atoms
+
+class TestPeriodic(unittest.TestCase):
+    """
+    Test symmetry operations with translations on periodic molecules
+    """
+
+    def test_screw_glide(self):
+        """
+        Chain of atoms with a 2_1 screw axis and a glide plane
+        """
+        mol = Molecule()
+        mol.set_unit_cell(np.diag([10.0, 10.0, 4.0]))
+        mol.add_atom('C',  1.0, 0.0, 0.0)
+        mol.add_atom('C', -1.0, 0.0, 6.0)    # outside of the unit cell
+        mol.add_atom('H',  1.0, 2.0, 0.0)
+        mol.add_atom('H', -1.0, -2.0, 2.0)
+        np.testing.assert_almost_equal(mol.get_cartesian(mol.get_fractional()), mol.positions)
+
+        molset = {
+            'C': [BasisFunction(1,0,0)] + [BasisFunction(2,1,m) for m in range(-1,2)],
+            'H': [BasisFunction(1,0,0)]
+        }
+        mol.build_basis(molset)
+
+        half = mol.get_cartesian([0, 0, 0.5])
+        symops = SymmetryOperations(mol)
+        symops.add('identity')
+        symops.add('rotation', '2', np.array([0,0,1]), np.pi, translation=half)
+        symops.add('inversion', translation=half)
+        symops.add('mirror', 'h', np.array([0,0,1]))
+        symops.run()
+        np.testing.assert_equal(symops.atomic_transformations,
+                                [[0,1,2,3],[1,0,3,2],[1,0,3,2],[0,1,2,3]])
+        np.testing.assert_almost_equal(symops.characters(),
+                                       np.trace(symops.operation_matrices, axis1=1, axis2=2))
+
+        # the point operation without translation is not a symmetry operation
+        symops.add('rotation', '2', np.array([0,0,1]), np.pi)
+        with self.assertRaises(RuntimeError):
+            symops.run()
+
+        # nor is any operation when periodicity is not taken into account
+        with self.assertRaises(RuntimeError):
+            match_atoms(mol.positions, symops.get_matrices()[1:2], translations=half[None])
+
+    def test_supercell(self):
+        """
+        Atoms of a skewed supercell are matched modulo the lattice vectors
+        """
+        rng = np.random.default_rng(1)
+        cell = np.array([[3.0, 0.0, 0.0], [1.5, 2.6, 0.0], [0.0, 0.0, 4.0]])
+        frac = rng.uniform(size=(5,3))
+        frac = np.vstack([frac, frac + [0.0, 0.0, 0.5]])    # translation symmetry
+        supercell = np.array(list(np.ndindex(4,4,2)))
+        frac = (frac[None,:,:] + supercell[:,None,:]).reshape(-1,3) / [4,4,2]
+        positions = frac @ (cell * [[4],[4],[2]]) + rng.normal(scale=1e-5, size=frac.shape)
+
+        translations = np.array([[0.0, 0.0, 2.0], [3.0, 0.0, 0.0], [4.5, 2.6, 4.0]])
+        perms = match_atoms(positions, np.repeat(np.identity(3)[None], 3, axis=0),
+                            translations=translations, cell=cell * [[4],[4],[2]])
+        shifted = positions[perms] - (positions[None] + translations[:,None])
+        shifted -= np.round(shifted @ np.linalg.inv(cell * [[4],[4],[2]])) @ (cell * [[4],[4],[2]])
+        np.testing.assert_almost_equal(shifted, 0.0, decimal=4)
+
+if __name__ == '__main__':
+    unittest.main()
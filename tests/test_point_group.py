@@ -0,0 +1,208 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, SymmetryOperations, \
+                      CharacterTable, match_atoms, common_centre, symmetrize
+from helpers import build_ammonia
+
+class TestPointGroup(unittest.TestCase):
+    """
+    Test automatic detection of symmetry operations and point groups
+    """
+
+    def test_ammonia(self):
+        mol = Molecule()
+        mol.add_atom('N', 0.00000000, 0.00000000, -0.06931370, unit='angstrom')
+        mol.add_atom('H', 0.00000000, 0.94311105,  0.32106944, unit='angstrom')
+        mol.add_atom('H', -0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+        mol.add_atom('H', 0.81675813, -0.47155553, 0.32106944, unit='angstrom')
+
+        molset = {
+            'N': [BasisFunction(1,0,0),
+                  BasisFunction(2,0,0),
+                  BasisFunction(2,1,1),
+                  BasisFunction(2,1,-1),
+                  BasisFunction(2,1,0)],
+            'H': [BasisFunction(1,0,0)]
+        }
+        mol.build_basis(molset)
+
+        symops, label, ctname = SymmetryOperations.detect(mol)
+        self.assertEqual(label, 'C3v')
+        self.assertEqual(ctname, 'c3v')
+        self.assertEqual([op.name[:2] for op in symops.operations],
+                         ['E', 'C3', 'C3', 'σ,', 'σ,', 'σ,'])
+
+        symops.run()
+        ct = CharacterTable(ctname)
+        np.testing.assert_almost_equal(ct.lot(symops.characters()), [4,0,2])
+
+    def test_point_groups(self):
+        """
+        Detect the point group of a series of (rotated) geometries
+        """
+        def ring(symbol, n, r, z=0.0, phase=0.0):
+            return [(symbol, r * np.cos(2.0 * np.pi * i / n + phase),
+                             r * np.sin(2.0 * np.pi * i / n + phase), z) for i in range(n)]
+
+        molecules = {
+            'C2v': [('O',0.0,0.0,0.5), ('H',1.4,0.0,-0.5), ('H',-1.4,0.0,-0.5)],
+            'D2h': [('C',-1.23,0.0,0.0), ('C',1.23,0.0,0.0), ('H',-2.3,-1.7,0.0),
+                    ('H',-2.3,1.7,0.0), ('H',2.3,1.7,0.0), ('H',2.3,-1.7,0.0)],
+            'D3h': [('B',0.0,0.0,0.0)] + ring('F',3,2.4),
+            'D3d': [('C',0.0,0.0,1.4), ('C',0.0,0.0,-1.4)] + ring('H',3,1.9,2.1) +
+                   ring('H',3,1.9,-2.1,np.pi/3),
+            'D2d': [('C',0.0,0.0,0.0), ('C',0.0,0.0,2.5), ('C',0.0,0.0,-2.5),
+                    ('H',1.7,0.0,3.5), ('H',-1.7,0.0,3.5), ('H',0.0,1.7,-3.5), ('H',0.0,-1.7,-3.5)],
+            'D6h': ring('C',6,2.6) + ring('H',6,4.7),
+            'C2h': [('C',1.0,0.0,0.0), ('C',-1.0,0.0,0.0), ('Cl',1.5,1.5,0.0),
+                    ('Cl',-1.5,-1.5,0.0), ('H',1.5,-1.2,0.0), ('H',-1.5,1.2,0.0)],
+            'Cs': [('O',0.0,0.0,0.0), ('H',1.4,0.3,0.0), ('Cl',-1.0,1.2,0.0)],
+            'C1': [('O',0.0,0.0,0.0), ('H',1.4,0.3,0.2), ('Cl',-1.0,1.2,0.5), ('N',0.3,-1.0,1.0)],
+            'Td': [('C',0.0,0.0,0.0), ('H',1.0,1.0,1.0), ('H',-1.0,-1.0,1.0),
+                   ('H',-1.0,1.0,-1.0), ('H',1.0,-1.0,-1.0)],
+            'Oh': [('S',0.0,0.0,0.0)] + [('F',) + tuple(v) for v in np.vstack([np.identity(3), -np.identity(3)]) * 3.0],
+        }
+        orders = {'C2v': 4, 'D2h': 8, 'D3h': 12, 'D3d': 12, 'D2d': 8, 'D6h': 24,
+                  'C2h': 4, 'Cs': 2, 'C1': 1, 'Td': 24, 'Oh': 48}
+
+        # arbitrary orientation
+        axis = np.array([0.3, -0.5, 0.8]) / np.linalg.norm([0.3, -0.5, 0.8])
+        rot = SymmetryOperations(None)
+        rot.add('rotation', '', axis, 0.7)
+        rotmat = rot.get_matrices()[0]
+
+        for pg, atoms in molecules.items():
+            positions = np.array([a[1:] for a in atoms])
+            positions -= np.average(positions, axis=0)
+            for mat in [np.identity(3), rotmat]:
+                mol = Molecule()
+                mol.add_atoms([a[0] for a in atoms], positions @ mat.transpose())
+
+                symops, label, ctname = SymmetryOperations.detect(mol)
+                self.assertEqual(label, pg)
+                self.assertEqual(len(symops.operations), orders[pg])
+                np.testing.assert_equal(match_atoms(mol.positions, symops.get_matrices()),
+                                        symops.atomic_transformations)
+
+    def test_dodecahedrane(self):
+        mol = Molecule()
+        mol.from_file(os.path.join(os.path.dirname(__file__), '..', 'examples',
+                                   'molecules', 'dodecahedrane.xyz'))
+
+        symops, label, ctname = SymmetryOperations.detect(mol)
+        self.assertEqual(label, 'Ih')
+        self.assertEqual(ctname, 'ih')
+
+        # operations are ordered as the classes of the character table
+        names = [op.name.split(',')[0] for op in symops.operations]
+        ct = CharacterTable(ctname)
+        idx = 0
+        for c,symbol in zip(ct.chartablelib['classes'], ['E', 'C5', 'C5^2', 'C3', 'C2', 'i',
+                                                        'S10', 'S10^3', 'S6', 'σ']):
+            self.assertEqual(names[idx:idx+c['multiplicity']], [symbol] * c['multiplicity'])
+            idx += c['multiplicity']
+
+    def test_invalid(self):
+        mol = Molecule()
+        mol.add_atom('C', 0.0, 0.0, -1.2)
+        mol.add_atom('O', 0.0, 0.0, 1.0)
+        with self.assertRaisesRegex(RuntimeError, expected_regex='linear'):
+            SymmetryOperations.detect(mol)
+
+        # operations are found about the centroid
+        mol = Molecule()
+        mol.add_atom('O', 0.0, 0.0, 0.0)
+        mol.add_atom('H', 1.4, 0.0, -1.0)
+        mol.add_atom('H', -1.4, 0.0, -1.0)
+        self.assertEqual(SymmetryOperations.detect(mol)[1], 'C2v')
+        mol.positions[:] += np.array([0.1, 0.0, 0.0])
+        self.assertEqual(SymmetryOperations.detect(mol)[1], 'C2v')
+
+    def test_shifted(self):
+        """
+        Detect the point group of a molecule away from the origin
+        """
+        mol = Molecule()
+        mol.from_file(os.path.join(os.path.dirname(__file__), '..', 'examples',
+                                   'molecules', 'dodecahedrane.xyz'))
+        shift = np.array([1.0, 2.0, 3.0])
+        mol.positions[:] += shift
+        mol.build_basis({'C': [BasisFunction(2,1,m) for m in [1,-1,0]],
+                         'H': [BasisFunction(1,0,0)]})
+        
+        symops, label, ctname = SymmetryOperations.detect(mol)
+        self.assertEqual((label, ctname), ('Ih', 'ih'))
+        self.assertEqual(len(symops.operations), 120)
+        
+        # operations act about the centroid
+        centroid = np.average(mol.positions, axis=0)
+        np.testing.assert_almost_equal(symops.get_translations(),
+                                       centroid - symops.get_matrices() @ centroid)
+        np.testing.assert_equal(match_atoms(mol.positions, symops.get_matrices(),
+                                            translations=symops.get_translations()),
+                                symops.atomic_transformations)
+        
+        # and yield the same representation as for the centred molecule
+        symops.run()
+        ct = CharacterTable(ctname)
+        lot = ct.lot(symops.characters(), symops.get_class_indices(ct))
+        mol.positions[:] -= centroid
+        centred = SymmetryOperations.detect(mol)[0]
+        centred.run()
+        np.testing.assert_almost_equal(lot, ct.lot(centred.characters(), centred.get_class_indices(ct)))
+
+    def test_affine_operations(self):
+        """
+        Operations detected for a molecule away from the origin are accepted
+        by the functions consuming operations
+        """
+        mol = build_ammonia().mol
+        mol.positions[:] += [1.0, 2.0, 3.0]
+        ref = np.array(mol.positions)
+        symops, label, _ = SymmetryOperations.detect(mol)
+        self.assertEqual(label, 'C3v')
+        centre = common_centre(symops.get_matrices(), symops.get_translations())
+        np.testing.assert_almost_equal(symops.get_translations(),
+                                       centre - symops.get_matrices() @ centre)
+        np.testing.assert_almost_equal(centre[:2], [1.0, 2.0])
+
+        # symmetrization about the centroid
+        rng = np.random.default_rng(1)
+        positions = symmetrize(ref + rng.normal(scale=1e-3, size=ref.shape), symops)
+        np.testing.assert_equal(match_atoms(positions, symops.get_matrices(), tol=1e-8,
+                                            translations=symops.get_translations()),
+                                symops.atomic_transformations)
+        np.testing.assert_almost_equal(positions, ref, decimal=2)
+
+        # rebuilding the molecule from its asymmetric unit
+        rebuilt = Molecule.from_asymmetric_unit(['N', 'H'], ref[:2], symops)
+        self.assertEqual(rebuilt.nratoms, 4)
+        np.testing.assert_almost_equal(rebuilt.positions[np.argsort(rebuilt.positions[:,0])],
+                                       ref[np.argsort(ref[:,0])])
+
+        # generated operations act about the centre of the generators
+        group = SymmetryOperations(mol)
+        group.add_generators([symops.operations[1], symops.operations[3]])
+        self.assertEqual(len(group.operations), 6)
+        np.testing.assert_almost_equal(group.get_translations(),
+                                       centre - group.get_matrices() @ centre)
+        group.run()
+
+        # translations that do not leave a common point in place, such as
+        # lattice translations, are rejected
+        with self.assertRaises(RuntimeError):
+            common_centre(np.identity(3), [0.0, 0.0, 1.0])
+        screw = SymmetryOperations(None)
+        screw.add('rotation', '2', np.array([0,0,1]), np.pi, translation=[0.0, 0.0, 1.0])
+        with self.assertRaises(RuntimeError):
+            screw.add_generators([])
+
+if __name__ == '__main__':
+    unittest.main()
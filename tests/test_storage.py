@@ -0,0 +1,99 @@
+import unittest
+import numpy as np
+import random
+import tempfile
+import json
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import SymmetryOperations, \
+                      CharacterTable, ProjectionOperator, SymmetryCache
+from helpers import build_ammonia
+
+class TestStorage(unittest.TestCase):
+    """
+    Test storing and caching the results of a symmetry analysis
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_save_load(self):
+        symops = build_ammonia()
+        symops.run()
+        path = os.path.join(self.tmpdir.name, 'nh3')
+        symops.save(path)
+
+        for mmap in [False, True]:
+            loaded = SymmetryOperations.load(path, symops.mol, mmap=mmap)
+            self.assertEqual([op.name for op in loaded.operations],
+                             [op.name for op in symops.operations])
+            np.testing.assert_almost_equal(loaded.get_matrices(), symops.get_matrices())
+            np.testing.assert_equal(loaded.atomic_transformations, symops.atomic_transformations)
+            np.testing.assert_almost_equal(loaded.operation_matrices, symops.operation_matrices)
+
+        # projection operator results
+        random.seed(0)
+        ct = CharacterTable('c3v')
+        po = ProjectionOperator(ct, symops)
+        mos = po.build_mos()
+        po.save(os.path.join(self.tmpdir.name, 'mos'))
+
+        po2 = ProjectionOperator(ct, loaded)
+        po2.restore(os.path.join(self.tmpdir.name, 'mos'), mmap=True)
+        np.testing.assert_almost_equal(po2.mos, mos)
+        self.assertEqual(po2.get_blocks(), po.get_blocks())
+        self.assertEqual(po2.groups, po.groups)
+
+        # unknown format versions are rejected
+        with open(os.path.join(path, 'manifest.json')) as f:
+            manifest = json.load(f)
+        manifest['version'] = 0
+        with open(os.path.join(path, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f)
+        with self.assertRaises(RuntimeError):
+            SymmetryOperations.load(path, symops.mol)
+
+    def test_cache(self):
+        cache = SymmetryCache(os.path.join(self.tmpdir.name, 'cache'))
+        ref = cache.run(build_ammonia())
+        self.assertEqual(len(os.listdir(cache.directory)), 1)
+
+        # a second run is served from the cache
+        key = cache.get_key(ref)
+        symops = cache.run(build_ammonia())
+        self.assertEqual(cache.get_key(symops), key)
+        self.assertEqual(len(os.listdir(cache.directory)), 1)
+        np.testing.assert_almost_equal(symops.operation_matrices, ref.operation_matrices)
+
+        random.seed(0)
+        ct = CharacterTable('c3v')
+        mos = cache.build_mos(ProjectionOperator(ct, symops))
+        np.testing.assert_almost_equal(cache.build_mos(ProjectionOperator(ct, symops)), mos)
+
+        # a different geometry yields a different key; the least recently
+        # used entry is evicted once the cache exceeds its size
+        symops = build_ammonia()
+        symops.mol.positions[:,2] *= 1.01
+        self.assertNotEqual(cache.get_key(symops), key)
+        cache.maxsize = cache.get_size() + 1
+        os.utime(os.path.join(cache.directory, key, 'symops', 'manifest.json'), (0, 0))
+        os.utime(os.path.join(cache.directory, key, 'mos-c3v', 'manifest.json'), (0, 0))
+        cache.run(symops)
+        self.assertEqual(os.listdir(cache.directory), [cache.get_key(symops)])
+
+        # the results depend on the basis set, which should thus be present
+        symops.mol.basis = None
+        with self.assertRaisesRegex(RuntimeError, 'no basis set'):
+            cache.run(symops)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, BasisFunction, SymmetryOperations, symmetrize
+from helpers import build_ammonia
+
+class TestSymmetrize(unittest.TestCase):
+    """
+    Test symmetrization of geometries by group averaging
+    """
+
+    def test_ammonia(self):
+        symops = build_ammonia()
+        mol = symops.mol
+        ref = np.array(mol.positions)
+        rng = np.random.default_rng(5)
+        mol.positions[:] += rng.normal(scale=5e-3, size=ref.shape)
+
+        # the distorted geometry is not symmetric within the default
+        # tolerance of run()
+        with self.assertRaises(RuntimeError):
+            symops.run()
+
+        symops.symmetrize(tol=0.05)
+        symops.run()
+        self.assert_symmetric(mol.positions, symops)
+        np.testing.assert_almost_equal(mol.positions, ref, decimal=2)
+
+        # trajectory of frames
+        frames = ref[None] + rng.normal(scale=1e-3, size=(4,) + ref.shape)
+        result = symmetrize(frames, symops)
+        self.assertEqual(result.shape, frames.shape)
+        for frame in result:
+            self.assert_symmetric(frame, symops)
+
+        # an incomplete set of operations does not form a group
+        with self.assertRaises(RuntimeError):
+            symmetrize(frames, symops.operations[:2])
+
+    def test_periodic(self):
+        mol = Molecule()
+        mol.set_unit_cell(np.diag([10.0, 10.0, 4.0]))
+        mol.add_atom('C',  1.0, 0.0, 0.001)
+        mol.add_atom('C', -1.002, 0.0, 5.999)
+        half = mol.get_cartesian([0, 0, 0.5])
+
+        symops = SymmetryOperations(mol)
+        symops.add('identity')
+        symops.add('rotation', '2', np.array([0,0,1]), np.pi, translation=half)
+        symops.add('mirror', 'h', np.array([0,0,1]))
+        symops.add('inversion', translation=half)
+        positions = symmetrize(mol, symops)
+        np.testing.assert_almost_equal(positions, [[1.001, 0.0, 0.0], [-1.001, 0.0, 6.0]])
+
+    def assert_symmetric(self, positions, symops):
+        mats = symops.get_matrices()
+        perm = symops.atomic_transformations
+        for k in range(len(mats)):
+            np.testing.assert_almost_equal(positions @ mats[k].T, positions[perm[k]], decimal=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
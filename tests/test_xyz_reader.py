@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+import tempfile
+import sys
+import os
+
+# add a reference to load the Sphecerix library
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# import functions
+from sphecerix import Molecule, XYZReader, iter_xyz
+
+class TestXYZReader(unittest.TestCase):
+    """
+    Test reading single and multi-frame XYZ files
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, 'trajectory.xyz')
+
+        # build a trajectory of an ammonia molecule that is slowly expanding
+        self.coords = np.array([
+            [ 0.00000000,    -0.00000000,    -0.06931370],
+            [ 0.00000000,     0.94311105,     0.32106944],
+            [-0.81675813,    -0.47155553,     0.32106944],
+            [ 0.81675813,    -0.47155553,     0.32106944]
+        ])
+        self.symbols = ['N', 'H', 'H', 'H']
+        self.nrframes = 25
+        with open(self.filename, 'w') as f:
+            for i in range(self.nrframes):
+                f.write('%i\nframe %i\n' % (len(self.coords), i))
+                for s,c in zip(self.symbols, self.coords * (1.0 + 0.01 * i)):
+                    f.write('%s  %12.8f  %12.8f  %12.8f\n' % (s, c[0], c[1], c[2]))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_multiframe(self):
+        for use_mmap in [True, False]:
+            with XYZReader(self.filename, use_mmap=use_mmap) as reader:
+                self.assertEqual(len(reader), self.nrframes)
+                self.assertEqual(reader.get_nratoms(3), 4)
+                self.assertEqual(reader.get_comment(7), 'frame 7')
+
+                # random access, including negative indices
+                for frame in [0, 13, -1]:
+                    f = frame % self.nrframes
+                    np.testing.assert_almost_equal(reader.read_positions(frame),
+                                                   self.coords * (1.0 + 0.01 * f) * 1.8897259886)
+
+                mol = reader[5]
+                self.assertEqual(mol.name, 'frame 5')
+                self.assertEqual([a[0] for a in mol.atoms], self.symbols)
+
+                with self.assertRaises(IndexError):
+                    reader.read_positions(self.nrframes)
+
+    def test_iter_xyz(self):
+        positions = list(iter_xyz(self.filename, positions_only=True, step=5))
+        self.assertEqual(len(positions), 5)
+        np.testing.assert_almost_equal(positions[2], self.coords * 1.1 * 1.8897259886)
+
+        mols = list(iter_xyz(self.filename, start=20))
+        self.assertEqual(len(mols), 5)
+        self.assertEqual(mols[0].nratoms, 4)
+
+    def test_from_file(self):
+        mol = Molecule()
+        mol.from_file(self.filename, frame=2)
+        np.testing.assert_almost_equal(mol.positions, self.coords * 1.02 * 1.8897259886)
+
+        mol = Molecule()
+        mol.from_file(os.path.join(os.path.dirname(__file__), '..', 'examples',
+                                   'molecules', 'dodecahedrane.xyz'))
+        self.assertEqual(mol.nratoms, 40)
+        self.assertEqual(mol.symbols, ['C', 'H'])
+
+if __name__ == '__main__':
+    unittest.main()